@@ -0,0 +1,208 @@
+"""Move RAM from idle guests to busy ones with virtio-balloon.
+
+Guests launched with balloon=True get a virtio-balloon device (with free
+page reporting where QEMU supports it) and report their memory stats over
+QMP. Every `interval` seconds the controller reads those stats and calls
+plan(), which shrinks guests sitting on lots of unused memory and grows
+guests that are running short, always within each guest's min/max (max is
+its -m). Growth is paid for by what was reclaimed plus what the host has
+available, so the controller never pushes the host into swap on its own.
+
+plan() is a pure function and the controller talks to guests through a
+small interface (read() / set_target()), so both can be driven by simulated
+guests.
+"""
+import asyncio
+import sys
+import time
+
+import qemu_qmp
+
+
+MB = 1024 * 1024
+
+DEFAULT_INTERVAL = 5.0
+
+BALLOON_ID = 'balloon0'
+BALLOON_PATH = f'/machine/peripheral/{BALLOON_ID}'
+
+# Guest is short on memory below this fraction available, idle above IDLE_RATIO
+PRESSURE_RATIO = 0.10
+IDLE_RATIO = 0.35
+# Idle guests keep this much on top of what they use
+HEADROOM = 0.25
+# Never move more than this fraction of a guest's memory in one round
+MAX_STEP = 0.25
+# Changes smaller than this aren't worth a balloon round trip
+MIN_CHANGE_MB = 32
+# Host memory the controller leaves alone when growing guests
+HOST_RESERVE_MB = 512
+
+
+class GuestMemory:
+    """One guest's memory as seen by the controller, in MB."""
+
+    def __init__(self, name, actual, min_mb, max_mb, available=None, swapped_in=0):
+        self.name = name
+        self.actual = actual
+        self.min_mb = min_mb
+        self.max_mb = max_mb
+        # None when the guest driver hasn't reported stats (yet)
+        self.available = available
+        # Pages swapped in since the last round, a sure sign of pressure
+        self.swapped_in = swapped_in
+
+    @property
+    def pressured(self):
+        if self.available is None:
+            return False
+        return self.swapped_in > 0 or self.available < self.actual * PRESSURE_RATIO
+
+    @property
+    def idle(self):
+        if self.available is None:
+            return False
+        return self.swapped_in == 0 and self.available > self.actual * IDLE_RATIO
+
+
+def plan(guests, host_available_mb=0):
+    """Return {name: new target MB} for guests whose balloon should move."""
+    targets = {}
+    reclaimed = 0
+
+    for g in guests:
+        if not g.idle:
+            continue
+        used = g.actual - g.available
+        wanted = max(g.min_mb, int(used * (1 + HEADROOM)))
+        target = max(wanted, int(g.actual * (1 - MAX_STEP)), g.min_mb)
+        if g.actual - target >= MIN_CHANGE_MB:
+            targets[g.name] = target
+            reclaimed += g.actual - target
+
+    budget = reclaimed + max(0, host_available_mb - HOST_RESERVE_MB)
+    # Most starved first, they get served before the budget runs out
+    pressured = sorted((g for g in guests if g.pressured), key=lambda g: g.available / max(g.actual, 1))
+    for g in pressured:
+        step = max(MIN_CHANGE_MB, int(g.actual * MAX_STEP))
+        grow = min(step, g.max_mb - g.actual, budget)
+        if grow >= MIN_CHANGE_MB:
+            targets[g.name] = g.actual + grow
+            budget -= grow
+    return targets
+
+
+def host_available_mb(meminfo='/proc/meminfo'):
+    try:
+        with open(meminfo, 'r') as f:
+            for line in f:
+                if line.startswith('MemAvailable:'):
+                    return int(line.split()[1]) // 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return 0
+
+
+class QMPGuest:
+    """Balloon access to one fleet VMProcess over its QMP connection."""
+
+    def __init__(self, vm, stats_interval):
+        self.vm = vm
+        self.name = f'{vm.name}-{vm.pid}'
+        self.max_mb = int(vm.spec.ram)
+        self.min_mb = min(self.max_mb, int(vm.spec.balloon_min or self.max_mb // 4))
+        self.stats_interval = max(1, int(stats_interval))
+        self._polling = False
+        self._last_swap_in = None
+
+    async def read(self):
+        qmp = await self.vm.qmp()
+        if not self._polling:
+            # The guest driver only reports stats once asked to
+            await qmp.execute('qom-set', {
+                'path': BALLOON_PATH, 'property': 'guest-stats-polling-interval', 'value': self.stats_interval})
+            self._polling = True
+
+        actual = (await qmp.execute('query-balloon'))['actual'] // MB
+        available = swapped_in = None
+        try:
+            reply = await qmp.execute('qom-get', {'path': BALLOON_PATH, 'property': 'guest-stats'})
+        except qemu_qmp.QMPError:
+            reply = {}
+        stats = reply.get('stats', {})
+        # last-update stays 0 until the guest driver sent something
+        if reply.get('last-update') and stats.get('stat-available-memory', -1) >= 0:
+            available = stats['stat-available-memory'] // MB
+            swap_in = stats.get('stat-swap-in', -1)
+            if swap_in >= 0:
+                swapped_in = 0 if self._last_swap_in is None else max(0, swap_in - self._last_swap_in)
+                self._last_swap_in = swap_in
+        return GuestMemory(self.name, actual, self.min_mb, self.max_mb, available, swapped_in or 0)
+
+    async def set_target(self, mb):
+        qmp = await self.vm.qmp()
+        await qmp.execute('balloon', {'value': int(mb) * MB})
+
+
+class BalloonController:
+    """Rebalances every registered guest each `interval` seconds."""
+
+    def __init__(self, interval=DEFAULT_INTERVAL, host_available=host_available_mb):
+        self.interval = interval
+        self.host_available = host_available
+        self.guests = {}
+        self.history = []
+        self._task = None
+
+    async def step(self):
+        """One round: read every guest, plan, apply. Returns the applied targets."""
+        readings = []
+        for guest in list(self.guests.values()):
+            try:
+                readings.append(await guest.read())
+            except (qemu_qmp.QMPError, KeyError, TypeError):
+                # Guest on its way out or without a working balloon, skip it this round
+                continue
+
+        targets = plan(readings, self.host_available())
+        for name, mb in targets.items():
+            guest = self.guests.get(name)
+            if guest is None:
+                continue
+            try:
+                await guest.set_target(mb)
+            except qemu_qmp.QMPError:
+                continue
+        if targets:
+            self.history.append((time.time(), targets))
+            del self.history[:-100]
+        return targets
+
+    async def run(self):
+        try:
+            while self.guests:
+                try:
+                    await self.step()
+                except Exception as e:
+                    # A bad round mustn't stop balancing for every guest
+                    print(f'qemu_balloon: rebalancing failed: {e!r}', file=sys.stderr)
+                await asyncio.sleep(self.interval)
+        finally:
+            self._task = None
+
+    def add(self, guest):
+        self.guests[guest.name] = guest
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self.run())
+
+    def remove(self, guest):
+        self.guests.pop(guest.name, None)
+
+    async def manage(self, vm):
+        """Keep vm (a running fleet VMProcess) balanced until cancelled."""
+        guest = QMPGuest(vm, self.interval)
+        self.add(guest)
+        try:
+            await asyncio.Event().wait()
+        finally:
+            self.remove(guest)
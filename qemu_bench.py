@@ -0,0 +1,415 @@
+"""Boot benchmarks: time launch configurations against each other.
+
+A matrix file lists images and the values to try for each dimension; every
+combination is launched `repeat` times, one guest at a time, through the same
+Fleet/build_command path the GUI uses. Per run it records, from the moment
+the launch was submitted:
+
+    process_start   QEMU process spawned (probe, overlay, warm lookup included)
+    first_output    first byte on the serial console
+    ready           ready marker on the serial console; for restored guests,
+                    QMP reporting the guest running
+    peak_rss_mb     peak resident memory of the QEMU process
+    cpu_seconds     CPU time of the QEMU process until it was stopped
+
+The guest is stopped once ready. "warm" runs are restored from the snapshot
+cache; if there is no saved state yet an unrecorded boot saves one first.
+A warm run that wasn't restored counts as failed, and so does every run of
+a configuration whose state couldn't be saved. A cache mode given without
+an io_profile keeps the compat devices; the profile a run actually used is
+in its effective_io column.
+
+Matrix file:
+
+    {
+      "images": ["debian-12-amd64-netinst.iso", {"disk": "alpine.qcow2", "system": "x86_64"}],
+      "ready_marker": "login:",
+      "accel": ["kvm", "tcg"], "smp": [1, 4], "ram": 1024,
+      "io_profile": [null, "throughput"], "cache": [null, "none"],
+      "start": ["cold", "warm"], "repeat": 5
+    }
+
+Usage:
+    python qemu_bench.py matrix.json [--json out.json] [--csv out.csv] [--baseline old.json]
+"""
+import argparse
+import asyncio
+import csv
+import itertools
+import json
+import os
+import statistics
+import sys
+import time
+
+from qemu_launch import AUTO_SYSTEM, VMSpec, default_qemu_dir
+import qemu_fleet
+import qemu_qmp
+import qemu_telemetry
+
+
+# Matrix keys a list of values can be given for, in result column order
+DIMENSIONS = ['image', 'system', 'accel', 'smp', 'ram', 'io_profile', 'cache', 'start']
+DEFAULTS = {'system': None, 'accel': None, 'smp': None, 'ram': 1024, 'io_profile': None, 'cache': None, 'start': 'cold'}
+STARTS = ('cold', 'warm')
+
+METRICS = ['process_start', 'first_output', 'ready', 'peak_rss_mb', 'cpu_seconds']
+# Differences below these are noise, whatever the relative change
+NOISE = {'process_start': 0.05, 'first_output': 0.05, 'ready': 0.1, 'peak_rss_mb': 8, 'cpu_seconds': 0.05}
+
+DEFAULT_REPEAT = 3
+DEFAULT_THRESHOLD = 0.10
+DEFAULT_TIMEOUT = 120
+
+POLL = 0.02
+
+
+class BenchError(Exception):
+    pass
+
+
+def _linux_peak_rss(pid):
+    with open(f'/proc/{pid}/status', 'r') as f:
+        for line in f:
+            if line.startswith('VmHWM:'):
+                return int(line.split()[1]) * 1024
+    return None
+
+
+def _windows_peak_rss(pid):
+    import ctypes
+    from ctypes import wintypes
+
+    class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+        _fields_ = [
+            ('cb', wintypes.DWORD), ('PageFaultCount', wintypes.DWORD),
+            ('PeakWorkingSetSize', ctypes.c_size_t), ('WorkingSetSize', ctypes.c_size_t),
+            ('QuotaPeakPagedPoolUsage', ctypes.c_size_t), ('QuotaPagedPoolUsage', ctypes.c_size_t),
+            ('QuotaPeakNonPagedPoolUsage', ctypes.c_size_t), ('QuotaNonPagedPoolUsage', ctypes.c_size_t),
+            ('PagefileUsage', ctypes.c_size_t), ('PeakPagefileUsage', ctypes.c_size_t),
+        ]
+    kernel32 = ctypes.windll.kernel32
+    # PROCESS_QUERY_LIMITED_INFORMATION
+    handle = kernel32.OpenProcess(0x1000, False, pid)
+    if not handle:
+        raise OSError(f'cannot open process {pid}')
+    try:
+        counters = PROCESS_MEMORY_COUNTERS()
+        counters.cb = ctypes.sizeof(counters)
+        if not kernel32.K32GetProcessMemoryInfo(handle, ctypes.byref(counters), counters.cb):
+            raise OSError(f'cannot read memory of process {pid}')
+    finally:
+        kernel32.CloseHandle(handle)
+    return counters.PeakWorkingSetSize
+
+
+def process_stats(pid):
+    """(peak RSS bytes, CPU seconds) of a running process; Nones where we can't tell."""
+    peak = None
+    try:
+        if os.name == 'nt':
+            peak = _windows_peak_rss(pid)
+        elif os.path.exists('/proc'):
+            peak = _linux_peak_rss(pid)
+    except (OSError, ValueError):
+        pass
+    return peak, qemu_telemetry.process_cpu_seconds(pid)
+
+
+def _image(value):
+    """Matrix image entry -> dict with iso or disk (and maybe system)."""
+    if isinstance(value, str):
+        key = 'iso' if value.lower().endswith('.iso') else 'disk'
+        return {key: value}
+    if not isinstance(value, dict) or not (value.get('iso') or value.get('disk')):
+        raise BenchError(f'Images need an "iso" or a "disk": {value!r}')
+    return dict(value)
+
+
+def image_name(image):
+    return os.path.basename(image.get('iso') or image.get('disk'))
+
+
+def load_matrix(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    if not isinstance(data, dict):
+        raise BenchError('Matrix file must contain a JSON object.')
+    known = set(DIMENSIONS) | {'images', 'ready_marker', 'switches', 'repeat', 'timeout'}
+    unknown = set(data) - known
+    if unknown:
+        raise BenchError(f'Unknown matrix keys: {", ".join(sorted(unknown))}')
+    if not data.get('images'):
+        raise BenchError('Matrix needs at least one entry in "images".')
+    if not data.get('ready_marker'):
+        raise BenchError('Matrix needs a "ready_marker" to tell when a guest is up.')
+    starts = data.get('start', DEFAULTS['start'])
+    for start in starts if isinstance(starts, list) else [starts]:
+        if start not in STARTS:
+            raise BenchError(f'Unknown start: {start} (pick one of {", ".join(STARTS)})')
+    data['images'] = [_image(i) for i in data['images']]
+    return data
+
+
+def configs(matrix):
+    """Every combination of the matrix dimensions, as dicts."""
+    values = []
+    for dim in DIMENSIONS:
+        if dim == 'image':
+            values.append(matrix['images'])
+            continue
+        value = matrix.get(dim, DEFAULTS[dim])
+        values.append(value if isinstance(value, list) else [value])
+    return [dict(zip(DIMENSIONS, combo)) for combo in itertools.product(*values)]
+
+
+def config_id(config):
+    """Stable name of a configuration, what baselines are matched on."""
+    parts = []
+    for dim in DIMENSIONS:
+        value = image_name(config['image']) if dim == 'image' else config[dim]
+        parts.append(f'{dim}={value}')
+    return ' '.join(parts)
+
+
+def make_spec(config, matrix, name):
+    image = config['image']
+    switches = matrix.get('switches', [])
+    spec = VMSpec(
+        system=config['system'] or image.get('system') or AUTO_SYSTEM,
+        ram=config['ram'],
+        iso=image.get('iso'),
+        disk=image.get('disk'),
+        switches=switches,
+        name=name,
+        accel=config['accel'],
+        smp=config['smp'],
+        io_profile=config['io_profile'],
+        # Applied by the fleet once autotune and the overlay are done
+        cache=config['cache'],
+        warm_start=config['start'] == 'warm',
+        ready_marker=matrix['ready_marker'],
+        ready_timeout=matrix.get('timeout', DEFAULT_TIMEOUT),
+        # Restored guests are only known to be up once QMP says they run
+        qmp_address=qemu_fleet.new_qmp_address(),
+    )
+    # Nobody is watching, don't open a window per run
+    if not spec.has_switch('-display', '-nographic'):
+        spec.switches += ['-display', 'none']
+    return spec
+
+
+async def _wait(condition, task, deadline):
+    """Poll condition() until it holds, task finishes or deadline passes."""
+    while not condition():
+        if task.done() or time.monotonic() > deadline:
+            return False
+        await asyncio.sleep(POLL)
+    return True
+
+
+async def _running(vm, task, deadline):
+    while not task.done() and time.monotonic() < deadline:
+        try:
+            qmp = await vm.qmp()
+            if (await qmp.execute('query-status')).get('status') == 'running':
+                return True
+        except qemu_qmp.QMPError:
+            pass
+        await asyncio.sleep(POLL)
+    return False
+
+
+def _empty_result():
+    result = {name: None for name in METRICS}
+    result.update({'error': None, 'warm': None, 'effective_io': None, 'command': None})
+    return result
+
+
+async def run_once(fleet, spec, expect_warm=None):
+    """Launch spec, stop it once ready and return what was measured.
+
+    expect_warm lists the warm start outcomes (vm.warm) the run is valid
+    with; any other outcome is recorded as the run's error.
+    """
+    result = _empty_result()
+    start = time.monotonic()
+    deadline = start + spec.ready_timeout
+    task = asyncio.ensure_future(fleet.run(spec))
+
+    vm = None
+    while vm is None and not task.done():
+        vm = next((v for v in fleet.vms if v.spec is spec), None)
+        await asyncio.sleep(0)
+    vm = vm or task.result()
+
+    if await _wait(lambda: vm.process is not None, task, deadline):
+        result['process_start'] = vm.started - start
+        # Set by the fleet's warm lookup before the spawn when there is a state to restore
+        if spec.incoming:
+            ready = await _running(vm, task, deadline)
+        else:
+            ready = await _wait(vm.ready.is_set, task, deadline)
+        if ready:
+            result['ready'] = time.monotonic() - start if spec.incoming else vm.ready_at - start
+            if spec.warm_start and not spec.incoming:
+                # First warm run: let the state get saved before stopping it
+                await _wait(lambda: vm.warm or vm.warm_error, task, deadline)
+        elif not task.done():
+            result['error'] = f'not ready after {spec.ready_timeout}s'
+        if vm.running:
+            peak, cpu = process_stats(vm.pid)
+            result['peak_rss_mb'] = round(peak / 1024 ** 2, 1) if peak else None
+            result['cpu_seconds'] = cpu
+        if vm.first_output_at:
+            result['first_output'] = vm.first_output_at - start
+        vm.terminate()
+
+    await task
+    if vm.error:
+        result['error'] = vm.error
+    elif result['ready'] is None and not result['error']:
+        result['error'] = f'QEMU exited with code {vm.returncode}: {vm.stderr.tail().strip()}'
+    result['warm'] = vm.warm or vm.warm_error
+    if expect_warm and not result['error'] and vm.warm not in expect_warm:
+        result['error'] = f'expected a {" or ".join(expect_warm)} warm start, got {result["warm"] or "a cold boot"}'
+    # What the guest ran with, an io_profile of null with a cache mode means compat
+    result['effective_io'] = spec.io['profile'] if spec.io else None
+    result['command'] = vm.command
+    for name in ('process_start', 'first_output', 'ready', 'cpu_seconds'):
+        if result[name] is not None:
+            result[name] = round(result[name], 3)
+    return result
+
+
+async def run_matrix(matrix, qemu_dir=None, repeat=None, progress=None):
+    """Run every configuration `repeat` times, one guest at a time; returns the runs."""
+    qemu_dir = qemu_dir or default_qemu_dir()
+    repeat = repeat or matrix.get('repeat', DEFAULT_REPEAT)
+    # One at a time and nothing polling them, runs shouldn't disturb each other
+    fleet = qemu_fleet.Fleet(qemu_dir, parallel=1)
+    runs = []
+    for n, config in enumerate(configs(matrix)):
+        cid = config_id(config)
+        row = {'config': cid}
+        row.update({dim: image_name(config['image']) if dim == 'image' else config[dim] for dim in DIMENSIONS})
+
+        def spec(rep):
+            return make_spec(config, matrix, f'bench-{n}-{rep}')
+
+        warm = config['start'] == 'warm'
+        primed = None
+        if warm:
+            # Makes sure a saved state exists, not measured
+            primed = await run_once(fleet, spec('prime'), expect_warm=('saved', 'restored'))
+        for rep in range(repeat):
+            if primed and primed['error']:
+                # Nothing to restore, cold boots would pass for warm ones
+                result = dict(_empty_result(), error=f'no warm state to start from: {primed["error"]}',
+                              warm=primed['warm'])
+            else:
+                result = await run_once(fleet, spec(rep), expect_warm=('restored',) if warm else None)
+            runs.append(dict(row, rep=rep, **result))
+            if progress:
+                progress(runs[-1])
+    return runs
+
+
+def summarize(runs):
+    """Per configuration: runs, failures and the median of every metric."""
+    grouped = {}
+    for run in runs:
+        grouped.setdefault(run['config'], []).append(run)
+    summary = {}
+    for cid, group in grouped.items():
+        ok = [r for r in group if not r['error']]
+        entry = {'runs': len(group), 'failures': len(group) - len(ok)}
+        for name in METRICS:
+            values = [r[name] for r in ok if r[name] is not None]
+            entry[name] = round(statistics.median(values), 3) if values else None
+        summary[cid] = entry
+    return summary
+
+
+def compare(summary, baseline, threshold=DEFAULT_THRESHOLD):
+    """(regressions, improvements) against a baseline summary, as lists of dicts."""
+    regressions, improvements = [], []
+    for cid, entry in summary.items():
+        old = baseline.get(cid)
+        if not old:
+            continue
+        for name in METRICS:
+            before, after = old.get(name), entry.get(name)
+            if before is None or after is None or abs(after - before) < NOISE[name]:
+                continue
+            change = {'config': cid, 'metric': name, 'baseline': before, 'current': after,
+                      'change': round((after - before) / before, 3) if before else None}
+            if after > before * (1 + threshold):
+                regressions.append(change)
+            elif after < before * (1 - threshold):
+                improvements.append(change)
+    return regressions, improvements
+
+
+def write_csv(runs, path):
+    columns = ['config'] + DIMENSIONS + ['rep'] + METRICS + ['warm', 'effective_io', 'error']
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, columns, extrasaction='ignore')
+        writer.writeheader()
+        writer.writerows(runs)
+
+
+def _fmt(value):
+    return '-' if value is None else f'{value:g}'
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark QEMU launch configurations.')
+    parser.add_argument('matrix', help='JSON file with images and the dimensions to try')
+    parser.add_argument('--qemu-dir', default=default_qemu_dir(), help='directory holding the qemu-system-* binaries')
+    parser.add_argument('--repeat', type=int, help=f'runs per configuration (default: matrix "repeat" or {DEFAULT_REPEAT})')
+    parser.add_argument('--json', dest='json_path', help='write runs and summary here, usable as a later --baseline')
+    parser.add_argument('--csv', dest='csv_path', help='write one row per run here')
+    parser.add_argument('--baseline', help='earlier --json output to compare against')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='relative slowdown that counts as a regression')
+    args = parser.parse_args(argv)
+
+    try:
+        matrix = load_matrix(args.matrix)
+        baseline = None
+        if args.baseline:
+            with open(args.baseline, 'r', encoding='utf-8') as f:
+                baseline = json.load(f)['summary']
+    except (OSError, ValueError, KeyError, BenchError) as e:
+        parser.error(str(e))
+
+    def progress(run):
+        status = run['error'] or f'ready {_fmt(run["ready"])}s'
+        print(f'{run["config"]} #{run["rep"]}: {status}', file=sys.stderr)
+
+    runs = asyncio.run(run_matrix(matrix, args.qemu_dir, args.repeat, progress))
+    summary = summarize(runs)
+
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump({'created': time.time(), 'matrix': matrix, 'runs': runs, 'summary': summary}, f, indent=1)
+    if args.csv_path:
+        write_csv(runs, args.csv_path)
+
+    for cid, entry in summary.items():
+        metrics = ' '.join(f'{name}={_fmt(entry[name])}' for name in METRICS)
+        print(f'{cid}\n    {metrics} ({entry["failures"]}/{entry["runs"]} failed)')
+
+    failed = any(entry['failures'] for entry in summary.values())
+    if baseline is not None:
+        regressions, improvements = compare(summary, baseline, args.threshold)
+        for label, changes in (('regression', regressions), ('improvement', improvements)):
+            for c in changes:
+                print(f'{label}: {c["config"]} {c["metric"]} {_fmt(c["baseline"])} -> {_fmt(c["current"])}')
+        failed = failed or bool(regressions)
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,280 @@
+"""Thin qcow2 overlays on top of golden base images, for disposable guests.
+
+Every disposable launch gets its own overlay backed by the (never written)
+base image, so N guests share one copy of the base on disk and in the page
+cache. A few spare overlays per base are created ahead of time so a launch
+only has to rename a file, and overlays of guests that are gone get
+garbage collected.
+
+Usage:
+    python qemu_disk.py prepare BASE [--spares N]
+    python qemu_disk.py gc
+    python qemu_disk.py status
+"""
+import argparse
+import hashlib
+import json
+import os
+import re
+import subprocess
+import sys
+import threading
+import time
+import uuid
+
+from qemu_launch import EXE_SUFFIX, cache_dir, default_qemu_dir
+
+
+QEMU_IMG_TIMEOUT = 60
+
+DEFAULT_SPARES = 4
+
+# Overlays nobody claimed within this many seconds belong to launches that died
+UNCLAIMED_GRACE = 600
+
+
+class DiskError(Exception):
+    pass
+
+
+def qemu_img_binary(qemu_dir):
+    return os.path.join(qemu_dir, f'qemu-img{EXE_SUFFIX}')
+
+
+def pid_alive(pid):
+    """True if a process with this pid is still running."""
+    if os.name == 'nt':
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        # PROCESS_QUERY_LIMITED_INFORMATION
+        handle = kernel32.OpenProcess(0x1000, False, pid)
+        if not handle:
+            return False
+        code = ctypes.c_ulong()
+        ok = kernel32.GetExitCodeProcess(handle, ctypes.byref(code))
+        kernel32.CloseHandle(handle)
+        # STILL_ACTIVE
+        return bool(ok) and code.value == 259
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _qemu_img(qemu_img, *args):
+    try:
+        result = subprocess.run(
+            [qemu_img, *args], capture_output=True, text=True, timeout=QEMU_IMG_TIMEOUT
+        )
+    except (OSError, subprocess.TimeoutExpired) as e:
+        raise DiskError(f'{qemu_img}: {e}')
+    if result.returncode != 0:
+        raise DiskError(f'qemu-img {args[0]} failed: {result.stderr.strip()}')
+    return result.stdout
+
+
+def image_format(qemu_img, path):
+    info = json.loads(_qemu_img(qemu_img, 'info', '--output=json', path))
+    return info['format']
+
+
+def create_overlay(qemu_img, base, path, base_format):
+    """Create a qcow2 overlay at path whose backing file is base."""
+    _qemu_img(qemu_img, 'create', '-q', '-f', 'qcow2', '-b', base, '-F', base_format, path)
+
+
+def _fingerprint(path):
+    st = os.stat(path)
+    return {'path': path, 'size': st.st_size, 'mtime': st.st_mtime_ns}
+
+
+def _remove(*paths):
+    for path in paths:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+class OverlayPool:
+    """Hands out overlays for base images, keeping `spares` ready per base.
+
+    Layout under root:
+        spare/<base key>/base.json       which base the spares belong to
+        spare/<base key>/<uuid>.qcow2    ready to be handed out
+        live/<name>-<uuid>.qcow2         in use by a guest
+        live/<name>-<uuid>.qcow2.json    owner of that overlay
+    """
+
+    def __init__(self, qemu_dir=None, root=None, spares=DEFAULT_SPARES):
+        self.qemu_img = qemu_img_binary(qemu_dir or default_qemu_dir())
+        self.root = root or os.path.join(cache_dir(), 'overlays')
+        self.spares = spares
+        self.live_dir = os.path.join(self.root, 'live')
+        os.makedirs(self.live_dir, exist_ok=True)
+        self.lock = threading.Lock()
+        self.base_locks = {}
+        self.formats = {}
+        self.filling = set()
+
+    def _spare_dir(self, base):
+        key = hashlib.sha1(base.encode('utf-8')).hexdigest()[:16]
+        return os.path.join(self.root, 'spare', key)
+
+    def _base_lock(self, base):
+        with self.lock:
+            return self.base_locks.setdefault(base, threading.Lock())
+
+    def _base_format(self, base, fingerprint):
+        cached = self.formats.get(base)
+        if cached and cached[0] == fingerprint:
+            return cached[1]
+        fmt = image_format(self.qemu_img, base)
+        self.formats[base] = (fingerprint, fmt)
+        return fmt
+
+    def _spares_for(self, base):
+        """Spare overlays of base; drops them all if base changed since they were made."""
+        spare_dir = self._spare_dir(base)
+        os.makedirs(spare_dir, exist_ok=True)
+        meta = os.path.join(spare_dir, 'base.json')
+        fingerprint = _fingerprint(base)
+        try:
+            with open(meta, 'r', encoding='utf-8') as f:
+                current = json.load(f) == fingerprint
+        except (OSError, ValueError):
+            current = False
+
+        names = [n for n in os.listdir(spare_dir) if n.endswith('.qcow2')]
+        if not current:
+            # Overlays on top of a modified base are garbage
+            _remove(*(os.path.join(spare_dir, n) for n in names))
+            with open(meta, 'w', encoding='utf-8') as f:
+                json.dump(fingerprint, f)
+            names = []
+        return spare_dir, fingerprint, names
+
+    def fill(self, base, count=None):
+        """Create spare overlays for base until there are `count` of them."""
+        base = os.path.abspath(base)
+        count = self.spares if count is None else count
+        with self._base_lock(base):
+            if base in self.filling:
+                return
+            self.filling.add(base)
+
+        try:
+            while True:
+                with self._base_lock(base):
+                    spare_dir, fingerprint, names = self._spares_for(base)
+                    fmt = self._base_format(base, fingerprint)
+                if len(names) >= count:
+                    break
+                # Created without holding the base lock, acquire() must never wait on us.
+                # Built under a temp name so acquire never grabs a half written file.
+                path = os.path.join(spare_dir, f'{uuid.uuid4().hex}.qcow2')
+                tmp = f'{path}.tmp'
+                create_overlay(self.qemu_img, base, tmp, fmt)
+                os.replace(tmp, path)
+        finally:
+            with self._base_lock(base):
+                self.filling.discard(base)
+
+    def acquire(self, base, name='vm'):
+        """Return the path of a fresh overlay of base for guest `name`."""
+        base = os.path.abspath(base)
+        if not os.path.exists(base):
+            raise DiskError(f'Base image {base} does not exist')
+        safe_name = re.sub(r'[^\w.-]', '_', name)
+        path = os.path.join(self.live_dir, f'{safe_name}-{uuid.uuid4().hex[:8]}.qcow2')
+
+        with self._base_lock(base):
+            spare_dir, fingerprint, names = self._spares_for(base)
+            if names:
+                os.replace(os.path.join(spare_dir, names[0]), path)
+            else:
+                # Pool ran dry, pay for qemu-img create this once
+                create_overlay(self.qemu_img, base, path, self._base_format(base, fingerprint))
+
+        self._write_owner(path, {'base': base, 'name': name, 'pid': None, 'created': time.time()})
+        return path
+
+    def _write_owner(self, path, owner):
+        with open(f'{path}.json', 'w', encoding='utf-8') as f:
+            json.dump(owner, f)
+
+    def owner(self, path):
+        try:
+            with open(f'{path}.json', 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def claim(self, path, pid):
+        """Record the pid of the guest using path, so gc knows when it is gone."""
+        owner = self.owner(path) or {'created': time.time()}
+        owner['pid'] = pid
+        self._write_owner(path, owner)
+
+    def release(self, path):
+        """Delete an overlay once its guest has exited."""
+        _remove(path, f'{path}.json')
+
+    def live(self):
+        return [
+            os.path.join(self.live_dir, n) for n in sorted(os.listdir(self.live_dir))
+            if n.endswith('.qcow2')
+        ]
+
+    def gc(self):
+        """Delete overlays whose guest has exited; return the removed paths."""
+        removed = []
+        now = time.time()
+        for path in self.live():
+            owner = self.owner(path)
+            if owner and owner.get('pid'):
+                dead = not pid_alive(owner['pid'])
+            else:
+                created = owner.get('created', 0) if owner else os.path.getmtime(path)
+                dead = now - created > UNCLAIMED_GRACE
+            if dead:
+                self.release(path)
+                removed.append(path)
+        return removed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Manage the copy-on-write overlay pool.')
+    parser.add_argument('--qemu-dir', default=default_qemu_dir())
+    sub = parser.add_subparsers(dest='action', required=True)
+    prepare = sub.add_parser('prepare', help='pre-create spare overlays for base images')
+    prepare.add_argument('bases', nargs='+')
+    prepare.add_argument('--spares', type=int, default=DEFAULT_SPARES)
+    sub.add_parser('gc', help='delete overlays of guests that have exited')
+    sub.add_parser('status', help='list overlays in use')
+    args = parser.parse_args(argv)
+
+    pool = OverlayPool(args.qemu_dir)
+    try:
+        if args.action == 'prepare':
+            for base in args.bases:
+                pool.fill(base, args.spares)
+                print(f'{base}: {args.spares} spare overlays ready')
+        elif args.action == 'gc':
+            for path in pool.gc():
+                print(f'removed {path}')
+        else:
+            for path in pool.live():
+                owner = pool.owner(path) or {}
+                print(f'{path} base={owner.get("base")} pid={owner.get("pid")}')
+    except (DiskError, OSError) as e:
+        print(e, file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,615 @@
+"""Launch and supervise many QEMU guests from one asyncio event loop.
+
+Usage:
+    python qemu_fleet.py specs.json [--parallel N] [--qemu-dir DIR]
+
+specs.json holds a list of VM specs, e.g.
+
+    [{"name": "deb", "system": "x86_64", "ram": 1024, "iso": "debian.iso", "count": 10}]
+
+"system": "auto" picks the system from the ISO (see qemu_isolib).
+"""
+import argparse
+import asyncio
+import collections
+import json
+import os
+import shutil
+import signal
+import sys
+import threading
+import time
+
+from qemu_launch import AUTO_SYSTEM, VMSpec, build_command, cache_dir, default_qemu_dir
+import qemu_balloon
+import qemu_disk
+import qemu_ioprofile
+import qemu_isolib
+import qemu_probe
+import qemu_qmp
+import qemu_sched
+import qemu_snapshot
+import qemu_telemetry
+
+
+DEFAULT_BUFFER_SIZE = 64 * 1024
+
+
+class RingBuffer:
+    """Keep only the last `size` bytes written to it."""
+
+    def __init__(self, size=DEFAULT_BUFFER_SIZE):
+        self.size = size
+        self.chunks = collections.deque()
+        self.length = 0
+        self.total = 0
+
+    def write(self, data):
+        if not data:
+            return
+        self.total += len(data)
+        if len(data) >= self.size:
+            self.chunks.clear()
+            self.chunks.append(bytes(data[-self.size:]))
+            self.length = self.size
+            return
+        self.chunks.append(bytes(data))
+        self.length += len(data)
+        # Drop whole chunks first, then trim the oldest one that remains
+        while self.length - len(self.chunks[0]) >= self.size:
+            self.length -= len(self.chunks.popleft())
+        if self.length > self.size:
+            extra = self.length - self.size
+            self.chunks[0] = self.chunks[0][extra:]
+            self.length = self.size
+
+    def getvalue(self):
+        return b''.join(self.chunks)
+
+    def text(self):
+        return self.getvalue().decode('utf-8', errors='replace')
+
+    def tail(self, lines=10):
+        return '\n'.join(self.text().splitlines()[-lines:])
+
+
+class VMProcess:
+    """One launched guest: its command, output buffers and exit status."""
+
+    def __init__(self, spec, command, buffer_size=DEFAULT_BUFFER_SIZE):
+        self.spec = spec
+        self.command = command
+        self.stdout = RingBuffer(buffer_size)
+        self.stderr = RingBuffer(buffer_size)
+        self.process = None
+        self.returncode = None
+        self.error = None
+        self.started = None
+        self.ended = None
+        self.first_output_at = None
+        # Set once the ready marker shows up on stdout
+        self.ready = asyncio.Event()
+        self.ready_at = None
+        self._marker = spec.ready_marker.encode('utf-8') if spec.ready_marker else None
+        self._marker_tail = b''
+        # 'restored' or 'saved' for warm start launches
+        self.warm = None
+        self.warm_error = None
+        # Stopped by us, a nonzero exit code doesn't mean it failed to run
+        self.terminated = False
+        self._qmp = None
+        self._qmp_lock = asyncio.Lock()
+
+    @property
+    def name(self):
+        return self.spec.name
+
+    @property
+    def pid(self):
+        return self.process.pid if self.process else None
+
+    @property
+    def running(self):
+        return self.process is not None and self.returncode is None
+
+    @property
+    def failed(self):
+        return self.error is not None or self.returncode not in (0, None)
+
+    def summary(self):
+        return {
+            'name': self.name,
+            'pid': self.pid,
+            'returncode': self.returncode,
+            'error': self.error,
+            'runtime': round(self.ended - self.started, 3) if self.started and self.ended else None,
+            'first_output': round(self.first_output_at - self.started, 3) if self.started and self.first_output_at else None,
+            'ready': round(self.ready_at - self.started, 3) if self.started and self.ready_at else None,
+            'warm': self.warm,
+            'warm_error': self.warm_error,
+        }
+
+    async def qmp(self):
+        """The guest's QMP connection, shared by everyone who talks to it.
+
+        QEMU serves one QMP client per socket, so telemetry, warm start and
+        friends all go through this one.
+        """
+        async with self._qmp_lock:
+            if not self.running:
+                raise qemu_qmp.QMPError(f'{self.name} is not running')
+            if self._qmp is None:
+                if not self.spec.qmp_address:
+                    raise qemu_qmp.QMPError(f'{self.name} has no QMP socket')
+                client = qemu_qmp.QMPClient(self.spec.qmp_address)
+                await client.connect()
+                self._qmp = client
+            return self._qmp
+
+    async def close_qmp(self):
+        if self._qmp is not None:
+            await self._qmp.close()
+            self._qmp = None
+
+    def watch_stdout(self, data):
+        """Look for the ready marker, also when it is split across reads."""
+        if self.first_output_at is None:
+            self.first_output_at = time.monotonic()
+        if not self._marker or self.ready.is_set():
+            return
+        window = self._marker_tail + data
+        if self._marker in window:
+            self.ready_at = time.monotonic()
+            self.ready.set()
+            return
+        self._marker_tail = window[-(len(self._marker) - 1):] if len(self._marker) > 1 else b''
+
+    def terminate(self):
+        if self.running:
+            self.terminated = True
+            try:
+                self.process.terminate()
+            except ProcessLookupError:
+                pass
+
+
+class Fleet:
+    """Start VM specs with at most `parallel` guests running at once.
+
+    With autotune on, each spec gets the fastest accelerator, CPU model and
+    -smp its QEMU binary supports (see qemu_probe). Disposable disk guests
+    boot from a throwaway overlay out of `pool` (see qemu_disk). Warm start
+    specs are restored from, or saved into, `snapshots` (see qemu_snapshot).
+    With `telemetry` every guest gets a QMP socket and is polled for live
+    stats (see qemu_telemetry). With a `scheduler` guests only start when the
+    host has RAM and CPUs left for them (see qemu_sched). Balloon specs are
+    handed to the `balloon` controller (see qemu_balloon). Specs with system
+    "auto" get the system their ISO was indexed with in `isos` (see
+    qemu_isolib).
+    """
+
+    def __init__(self, qemu_dir=None, parallel=None, buffer_size=DEFAULT_BUFFER_SIZE, autotune=True, pool=None,
+                 snapshots=None, telemetry=None, scheduler=None, balloon=None, isos=None):
+        self.qemu_dir = qemu_dir or default_qemu_dir()
+        self.parallel = parallel
+        self.buffer_size = buffer_size
+        self.autotune = autotune
+        self.pool = pool
+        self.snapshots = snapshots
+        self.telemetry = telemetry
+        self.scheduler = scheduler
+        self.balloon = balloon
+        self.isos = isos
+        # Launches in flight; finished ones belong to whoever awaited run()
+        self.vms = []
+        self.active = 0
+        # Set by terminate(), nothing new gets started after that
+        self.stopping = False
+        self._slots = None
+        self._background = set()
+
+    def _slot(self):
+        # Created lazily so the semaphore belongs to the loop that runs us
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.parallel) if self.parallel else _NoLimit()
+        return self._slots
+
+    async def _in_thread(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+    def _in_background(self, func, *args):
+        task = asyncio.ensure_future(self._in_thread(func, *args))
+        # Keep a reference until done, and don't let a failed refill go unnoticed
+        self._background.add(task)
+        task.add_done_callback(self._background_done)
+
+    def _background_done(self, task):
+        self._background.discard(task)
+        if not task.cancelled() and task.exception():
+            print(f'qemu_fleet: background task failed: {task.exception()}', file=sys.stderr)
+
+    async def _capabilities(self, spec):
+        """Probe result for spec's binary (cached), or None if it can't be probed."""
+        try:
+            return await self._in_thread(qemu_probe.capabilities, self.qemu_dir, spec.system)
+        except qemu_probe.ProbeError:
+            return None
+
+    async def _overlay_pool(self):
+        if self.pool is None:
+            self.pool = qemu_disk.OverlayPool(self.qemu_dir)
+            # Leftovers of guests from an earlier run that never got cleaned up
+            await self._in_thread(self.pool.gc)
+        return self.pool
+
+    async def _snapshot_cache(self):
+        if self.snapshots is None:
+            self.snapshots = qemu_snapshot.SnapshotCache()
+            # States of ISOs or QEMU installs that changed since they were saved
+            await self._in_thread(self.snapshots.prune)
+        return self.snapshots
+
+    @property
+    def running(self):
+        return [vm for vm in self.vms if vm.running]
+
+    async def run(self, spec):
+        """Launch spec, wait for the guest to exit and return its VMProcess."""
+        vm = VMProcess(spec, [], self.buffer_size)
+        self.vms.append(vm)
+        self.active += 1
+        try:
+            await self._run(vm)
+            return vm
+        finally:
+            self.active -= 1
+            self.vms.remove(vm)
+
+    def _stopped(self, vm):
+        if self.stopping:
+            vm.error = 'Launch cancelled, the fleet is stopping.'
+        return self.stopping
+
+    async def _run(self, vm):
+        spec = vm.spec
+        if spec.system == AUTO_SYSTEM and spec.iso:
+            library = self.isos or qemu_isolib.default_library()
+            # Left as "auto" when the ISO doesn't tell, validate() reports that
+            spec.system = await self._in_thread(library.system_for, spec.iso) or AUTO_SYSTEM
+        if self.autotune:
+            try:
+                # Cached after the first call, but the first one runs the binary
+                await self._in_thread(qemu_probe.autotune, spec, self.qemu_dir)
+            except qemu_probe.ProbeError:
+                # Launch as specified, a missing binary gets reported by the spawn
+                pass
+        try:
+            spec.validate()
+        except ValueError as e:
+            vm.error = str(e)
+            return
+        if self._stopped(vm):
+            return
+
+        async with self._slot():
+            admission = None
+            if self.scheduler:
+                try:
+                    admission = await self.scheduler.admit(spec)
+                except qemu_sched.AdmissionError as e:
+                    vm.error = str(e)
+                    return
+            try:
+                # Waited for a slot or room while the fleet was told to stop
+                if not self._stopped(vm):
+                    await self._launch(vm, admission)
+            finally:
+                if admission:
+                    # Wakes up whoever is queued for room
+                    await self.scheduler.release(admission)
+
+    async def _launch(self, vm, admission=None):
+        spec = vm.spec
+        warm = None
+        if spec.warm_start:
+            try:
+                warm = await self._warm_lookup(spec)
+            except OSError as e:
+                vm.error = f'Warm start failed: {e}'
+                return
+
+        pool = None
+        if spec.disk and spec.disposable:
+            pool = await self._overlay_pool()
+            try:
+                spec.overlay = await self._in_thread(pool.acquire, spec.disk, spec.name)
+                if warm and warm['hit'] and warm['hit']['disk']:
+                    # The saved state expects the disk exactly as it was when saved
+                    await self._in_thread(qemu_snapshot.restore_overlay, warm['cache'], warm['key'], spec.overlay)
+            except (qemu_disk.DiskError, OSError) as e:
+                vm.error = f'Failed to create disk overlay: {e}'
+                if spec.overlay:
+                    await self._in_thread(pool.release, spec.overlay)
+                return
+            # Top the spares back up for the next launch
+            self._in_background(pool.fill, spec.disk)
+
+        pinned = admission is not None and admission.cpus
+        balloon = spec.balloon and self.balloon is not None
+        if (self.telemetry or pinned or balloon) and not spec.qmp_address:
+            spec.qmp_address = new_qmp_address()
+
+        helpers = []
+        try:
+            caps = await self._capabilities(spec)
+            if (spec.io_profile or spec.cache) and spec.io is None:
+                # Needs the overlay in place, O_DIRECT support depends on where it lives
+                host = await self._in_thread(qemu_ioprofile.host_io, spec, caps)
+                spec.io = qemu_ioprofile.choose(spec, host)
+            vm.command = build_command(spec, self.qemu_dir)
+            if self._stopped(vm):
+                return
+            if caps:
+                try:
+                    qemu_ioprofile.validate_devices(vm.command, caps)
+                except ValueError as e:
+                    vm.error = str(e)
+                    return
+            await self._spawn(vm)
+            if vm.process:
+                if pool:
+                    await self._in_thread(pool.claim, spec.overlay, vm.pid)
+                if pinned:
+                    self.scheduler.pin_process(admission, vm.pid)
+                    helpers.append(asyncio.ensure_future(self._pin_vcpus(vm, admission)))
+                if warm and warm['hit']:
+                    vm.warm = 'restored'
+                elif warm:
+                    helpers.append(asyncio.ensure_future(self._warm_save(vm, warm)))
+                if self.telemetry:
+                    helpers.append(asyncio.ensure_future(self.telemetry.watch(vm)))
+                if balloon:
+                    helpers.append(asyncio.ensure_future(self.balloon.manage(vm)))
+                await self._supervise(vm)
+        finally:
+            for helper in helpers:
+                helper.cancel()
+            await asyncio.gather(*helpers, return_exceptions=True)
+            await vm.close_qmp()
+            qemu_qmp.remove_address(spec.qmp_address)
+            if pool and spec.overlay:
+                await self._in_thread(pool.release, spec.overlay)
+        if warm and warm['hit'] and vm.returncode and not vm.terminated:
+            # Most likely the state no longer loads, cold boot next time
+            await self._in_thread(warm['cache'].discard, warm['key'])
+
+    async def _pin_vcpus(self, vm, admission):
+        try:
+            await self.scheduler.pin_vcpus(admission, vm)
+        except qemu_qmp.QMPError:
+            # Still pinned as a whole by pin_process, just not per vCPU
+            pass
+
+    async def _warm_lookup(self, spec):
+        """Find a saved state for spec; point it at -incoming or give it a QMP port to save one."""
+        cache = await self._snapshot_cache()
+        fingerprints = await self._in_thread(qemu_snapshot.spec_fingerprints, spec, self.qemu_dir)
+        key = qemu_snapshot.config_key(spec, fingerprints)
+        hit = await self._in_thread(cache.lookup, key)
+        if hit:
+            spec.incoming = f'file:{cache.paths(key)["state"]}'
+        elif not spec.qmp_address:
+            spec.qmp_address = new_qmp_address()
+        return {'cache': cache, 'key': key, 'fingerprints': fingerprints, 'hit': hit}
+
+    async def _warm_save(self, vm, warm):
+        """Once vm is ready, migrate its state to the cache and let it carry on."""
+        spec, cache, key = vm.spec, warm['cache'], warm['key']
+        try:
+            await asyncio.wait_for(vm.ready.wait(), spec.ready_timeout)
+        except asyncio.TimeoutError:
+            # No marker (or it never came): the timeout is the readiness condition
+            pass
+        if not vm.running:
+            return
+
+        pending = await self._in_thread(cache.begin_save, key)
+        if pending is None:
+            # Another launch of the same configuration saved it or is saving it
+            return
+        committed = False
+        try:
+            qmp = await vm.qmp()
+            await qmp.execute('migrate', {'uri': f'file:{pending["state"]}'})
+            while True:
+                status = (await qmp.execute('query-migrate')).get('status')
+                if status == 'completed':
+                    break
+                if status in ('failed', 'cancelled'):
+                    raise qemu_qmp.QMPError(f'migration {status}')
+                await asyncio.sleep(0.2)
+            # Guest is paused now, its overlay is consistent with the saved state
+            if spec.overlay:
+                await self._in_thread(shutil.copyfile, spec.overlay, pending['disk'])
+            await qmp.execute('cont')
+            await self._in_thread(cache.commit, key, pending, warm['fingerprints'], bool(spec.overlay))
+            committed = True
+            vm.warm = 'saved'
+        except (qemu_qmp.QMPError, OSError) as e:
+            vm.warm_error = str(e)
+        finally:
+            if not committed:
+                # Also when cancelled because the guest exited mid-save
+                cache.abandon(key, pending)
+
+    async def _spawn(self, vm):
+        try:
+            vm.process = await asyncio.create_subprocess_exec(
+                *vm.command,
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+        except OSError as e:
+            vm.error = f'Failed to start VM: {e}'
+            return
+        vm.started = time.monotonic()
+
+    async def _supervise(self, vm):
+        await asyncio.gather(
+            _pump(vm.process.stdout, vm.stdout, vm.watch_stdout),
+            _pump(vm.process.stderr, vm.stderr),
+        )
+        vm.returncode = await vm.process.wait()
+        vm.ended = time.monotonic()
+
+    async def run_all(self, specs):
+        return await asyncio.gather(*(self.run(spec) for spec in specs))
+
+    async def wait_idle(self, poll=0.5):
+        """Return once no guest is running or waiting to start."""
+        while self.active:
+            await asyncio.sleep(poll)
+
+    def terminate(self):
+        """Stop every running guest; launches still waiting won't start."""
+        self.stopping = True
+        for vm in self.running:
+            vm.terminate()
+
+
+def new_qmp_address():
+    """Where a new guest's QMP socket goes (see qemu_qmp.new_address)."""
+    return qemu_qmp.new_address(os.path.join(cache_dir(), 'qmp'))
+
+
+class _NoLimit:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+async def _pump(stream, buffer, watch=None):
+    while True:
+        data = await stream.read(4096)
+        if not data:
+            break
+        buffer.write(data)
+        if watch:
+            watch(data)
+
+
+class FleetThread:
+    """Run a Fleet on a background event loop so a GUI thread can submit launches."""
+
+    def __init__(self, fleet):
+        self.fleet = fleet
+        self.loop = asyncio.new_event_loop()
+        # Not a daemon: like the old per-VM threads it keeps us alive until the guests exit
+        self.thread = threading.Thread(target=self._run, name='qemu-fleet')
+        self.thread.start()
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+        self.loop.close()
+
+    def submit(self, coro):
+        """Schedule coro on the fleet loop and return a concurrent.futures.Future."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def launch(self, spec):
+        return self.submit(self.fleet.run(spec))
+
+    def close(self):
+        """Stop the loop once every running guest has exited."""
+        async def finish():
+            await self.fleet.wait_idle()
+            self.loop.stop()
+        self.submit(finish())
+
+
+def load_specs(path):
+    """Read a JSON list of VM specs; a "count" key launches that many copies."""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    if not isinstance(data, list):
+        raise ValueError('Spec file must contain a JSON list of VM specs.')
+
+    specs = []
+    for entry in data:
+        entry = dict(entry)
+        count = int(entry.pop('count', 1))
+        for i in range(count):
+            spec = VMSpec.from_dict(dict(entry))
+            if count > 1:
+                spec.name = f'{spec.name}-{i}'
+            specs.append(spec)
+    return specs
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Launch a fleet of QEMU guests headless.')
+    parser.add_argument('specs', help='JSON file with a list of VM specs')
+    parser.add_argument('--qemu-dir', default=default_qemu_dir(), help='directory holding the qemu-system-* binaries')
+    parser.add_argument('--parallel', type=int, default=4, help='maximum guests running at once (0 = unlimited)')
+    parser.add_argument('--buffer-size', type=int, default=DEFAULT_BUFFER_SIZE, help='bytes of stdout/stderr kept per guest')
+    parser.add_argument('--no-autotune', action='store_true', help="don't pick accelerator/CPU/-smp automatically")
+    parser.add_argument('--telemetry-interval', type=float, default=qemu_telemetry.DEFAULT_INTERVAL,
+                        help='seconds between QMP stats polls (0 = no telemetry)')
+    parser.add_argument('--prom-file', help='keep a Prometheus text file with live guest stats here')
+    parser.add_argument('--no-admission', action='store_true', help="start guests even if the host is full")
+    parser.add_argument('--mem-ratio', type=float, default=qemu_sched.DEFAULT_MEM_RATIO,
+                        help='guest RAM allowed per MB of host RAM')
+    parser.add_argument('--cpu-ratio', type=float, default=qemu_sched.DEFAULT_CPU_RATIO,
+                        help='guest vCPUs allowed per host CPU')
+    parser.add_argument('--reserve-mb', type=int, default=qemu_sched.DEFAULT_RESERVE_MB,
+                        help='host RAM kept out of reach of guests')
+    parser.add_argument('--pin', choices=qemu_sched.PIN_MODES, help='give each guest host cores of its own')
+    parser.add_argument('--balloon-interval', type=float, default=qemu_balloon.DEFAULT_INTERVAL,
+                        help='seconds between memory rebalancing rounds of "balloon" guests')
+    parser.add_argument('--json', action='store_true', help='print the results as JSON')
+    args = parser.parse_args(argv)
+
+    try:
+        specs = load_specs(args.specs)
+    except (OSError, ValueError, TypeError) as e:
+        parser.error(str(e))
+
+    telemetry = None
+    if args.telemetry_interval > 0:
+        telemetry = qemu_telemetry.Telemetry(args.telemetry_interval, prom_path=args.prom_file)
+    scheduler = None
+    if not args.no_admission:
+        scheduler = qemu_sched.Scheduler(mem_ratio=args.mem_ratio, cpu_ratio=args.cpu_ratio,
+                                         reserve_mb=args.reserve_mb, pin=args.pin)
+    fleet = Fleet(args.qemu_dir, parallel=args.parallel or None, buffer_size=args.buffer_size,
+                  autotune=not args.no_autotune, telemetry=telemetry, scheduler=scheduler,
+                  balloon=qemu_balloon.BalloonController(args.balloon_interval))
+    results = asyncio.run(_run_fleet(fleet, specs))
+
+    if args.json:
+        print(json.dumps([vm.summary() for vm in results], indent=2))
+    else:
+        for vm in results:
+            status = vm.error or f'exit={vm.returncode}'
+            if vm.warm or vm.warm_error:
+                status += f' (warm start: {vm.warm or vm.warm_error})'
+            print(f'{vm.name}: {status}')
+            if vm.returncode not in (0, None):
+                print(vm.stderr.tail())
+    return 1 if any(vm.failed for vm in results) else 0
+
+
+async def _run_fleet(fleet, specs):
+    loop = asyncio.get_running_loop()
+    if os.name != 'nt':
+        loop.add_signal_handler(signal.SIGINT, fleet.terminate)
+        loop.add_signal_handler(signal.SIGTERM, fleet.terminate)
+    return await fleet.run_all(specs)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,149 @@
+"""Disk and network I/O profiles picked to suit the host.
+
+    throughput    virtio-scsi with an iothread and one queue per vCPU, io_uring
+                  (or native) with cache=none, multiqueue virtio-net on tap
+    low-latency   virtio-blk with an iothread, native AIO (or io_uring) with
+                  cache=none, vhost-net on tap
+    compat        the machine's default disk/CD/NIC, cache=writeback, thread pool AIO
+
+throughput and low-latency also add a virtio-rng device. choose() turns a
+profile and what the host can do into a plain dict that build_command
+renders; validate_devices() checks the final command line against the
+devices the QEMU binary reported.
+"""
+import os
+import platform
+import re
+
+
+PROFILES = ('throughput', 'low-latency', 'compat')
+
+CACHE_MODES = ('none', 'writeback', 'writethrough', 'directsync', 'unsafe')
+# The ones that open images with O_DIRECT
+DIRECT_CACHE_MODES = ('none', 'directsync')
+
+# Preferred AIO engines per profile, first one the host supports wins
+AIO_PREFERENCE = {
+    'throughput': ['io_uring', 'native'],
+    'low-latency': ['native', 'io_uring'],
+    'compat': [],
+}
+
+
+def kernel_has_io_uring():
+    if platform.system() != 'Linux':
+        return False
+    match = re.match(r'(\d+)\.(\d+)', platform.release())
+    if not match or (int(match.group(1)), int(match.group(2))) < (5, 1):
+        return False
+    try:
+        with open('/proc/sys/kernel/io_uring_disabled', 'r') as f:
+            # 2 means disabled for everyone
+            return f.read().strip() != '2'
+    except OSError:
+        return True
+
+
+def supports_direct_io(path):
+    """True if path's filesystem allows O_DIRECT (cache=none needs it; tmpfs doesn't)."""
+    if os.name == 'nt':
+        return True
+    if not hasattr(os, 'O_DIRECT'):
+        return False
+    try:
+        fd = os.open(path, os.O_RDONLY | os.O_DIRECT)
+    except OSError:
+        return False
+    os.close(fd)
+    return True
+
+
+def host_io(spec, caps=None):
+    """What the host and QEMU binary can do for this spec's images."""
+    aio = list((caps or {}).get('aio_modes', []))
+    if 'io_uring' in aio and not kernel_has_io_uring():
+        aio.remove('io_uring')
+    # The overlay's reads fall through to its backing disk, both have to take O_DIRECT
+    images = [path for path in (spec.overlay, spec.disk) if path]
+    return {
+        'aio': aio,
+        'direct': bool(images) and all(supports_direct_io(path) for path in images),
+        'vhost': os.access('/dev/vhost-net', os.R_OK | os.W_OK),
+    }
+
+
+def choose(spec, host=None):
+    """Turn spec.io_profile and host facts into the settings build_command renders.
+
+    spec.cache, when set, overrides the cache mode the profile would pick; on
+    its own (no profile) it keeps the compat devices with that cache mode.
+    """
+    profile = spec.io_profile or ('compat' if spec.cache else None)
+    if profile not in PROFILES:
+        raise ValueError(f'Unknown I/O profile: {profile} (pick one of {", ".join(PROFILES)})')
+    # Without host facts assume nothing beyond what every QEMU can do
+    host = host or {'aio': [], 'direct': False, 'vhost': False}
+    queues = max(1, int(spec.smp or 1))
+
+    if profile == 'compat':
+        io = {
+            'profile': profile, 'iothread': False, 'disk_bus': None, 'cdrom_bus': None,
+            'cache': 'writeback', 'aio': 'threads', 'queues': 1,
+            'nic': None, 'net_queues': 1, 'vhost': False, 'rng': False,
+        }
+        return _force_cache(io, spec.cache)
+
+    # native AIO only works with O_DIRECT, io_uring works either way
+    usable = [a for a in AIO_PREFERENCE[profile] if a in host['aio'] and (a != 'native' or host['direct'])]
+    io = {
+        'profile': profile,
+        'iothread': True,
+        'disk_bus': 'virtio-scsi' if profile == 'throughput' else 'virtio-blk',
+        'cdrom_bus': 'virtio-scsi',
+        'cache': 'none' if host['direct'] else 'writeback',
+        'aio': usable[0] if usable else 'threads',
+        'queues': queues,
+        'nic': 'virtio-net-pci',
+        # Multiqueue needs a tap backend, user networking has a single queue
+        'net_queues': queues if spec.tap and profile == 'throughput' else 1,
+        'vhost': bool(spec.tap) and host['vhost'],
+        'rng': True,
+    }
+    return _force_cache(io, spec.cache)
+
+
+def _force_cache(io, cache):
+    if cache:
+        io['cache'] = cache
+        if cache not in DIRECT_CACHE_MODES and io['aio'] == 'native':
+            # native AIO refuses to run without O_DIRECT
+            io['aio'] = 'threads'
+    return io
+
+
+def command_devices(command):
+    """Device drivers named by -device and -nic model= in a command line."""
+    devices = []
+    for i, arg in enumerate(command[:-1]):
+        value = command[i + 1]
+        if arg == '-device':
+            driver = value.split(',')[0]
+            if driver.startswith('driver='):
+                driver = driver[len('driver='):]
+            devices.append(driver)
+        elif arg == '-nic':
+            match = re.search(r'(?:^|,)model=([^,]+)', value)
+            if match:
+                devices.append(match.group(1))
+    return devices
+
+
+def validate_devices(command, caps):
+    """Raise ValueError if the command uses devices the QEMU binary doesn't have."""
+    known = set(caps.get('devices', []))
+    if not known:
+        # Probe couldn't list devices, nothing to check against
+        return
+    missing = sorted({d for d in command_devices(command) if d not in known and d != 'help'})
+    if missing:
+        raise ValueError(f'This QEMU binary has no {", ".join(missing)} device, pick another I/O profile or switches.')
@@ -0,0 +1,433 @@
+"""Index of ISO images: volume label, architecture and BIOS/UEFI bootability.
+
+Only the ISO9660 volume descriptors, the El Torito boot catalog and the
+directories on the way to EFI/BOOT are read, through mmap, so indexing a
+multi-GB image touches a few sectors of it. The index lives in the cache dir
+and rescans skip images whose size and mtime haven't changed.
+
+The architecture comes from the UEFI loader name (EFI/BOOT/BOOTX64.EFI ...),
+then the El Torito platform, then keywords in the file name or label
+(amd64, arm64, ...). It's None when none of those tell.
+
+Usage:
+    python qemu_isolib.py add DIR [DIR ...]
+    python qemu_isolib.py scan
+    python qemu_isolib.py list [--arch ARCH] [QUERY]
+    python qemu_isolib.py show ISO
+"""
+import argparse
+import json
+import mmap
+import os
+import re
+import struct
+import sys
+import threading
+
+from qemu_launch import cache_dir
+
+
+# Bump when read_iso() learns something new, older entries get read again
+INDEX_VERSION = 1
+
+SECTOR = 2048
+# Volume descriptors start at sector 16
+DESCRIPTORS = 16 * SECTOR
+MAX_DESCRIPTORS = 64
+
+BOOT_RECORD = 0
+PRIMARY_VOLUME = 1
+TERMINATOR = 255
+
+EL_TORITO = b'EL TORITO SPECIFICATION'
+
+# El Torito platform ids
+PLATFORM_X86 = 0x00
+PLATFORM_PPC = 0x01
+PLATFORM_MAC = 0x02
+PLATFORM_EFI = 0xEF
+
+PLATFORM_NAMES = {PLATFORM_X86: 'bios', PLATFORM_PPC: 'ppc', PLATFORM_MAC: 'mac', PLATFORM_EFI: 'uefi'}
+
+# Removable media loader name -> QEMU system
+EFI_LOADERS = {
+    'BOOTX64.EFI': 'x86_64',
+    'BOOTIA32.EFI': 'i386',
+    'BOOTAA64.EFI': 'aarch64',
+    'BOOTARM.EFI': 'arm',
+    'BOOTRISCV64.EFI': 'riscv64',
+}
+
+# Checked in order, more specific names first (x86_64 before x86)
+ARCH_KEYWORDS = [
+    ('aarch64', ('aarch64', 'arm64')),
+    ('arm', ('armhf', 'armel', 'armv7', 'armv6')),
+    ('riscv64', ('riscv64', 'riscv')),
+    ('x86_64', ('x86_64', 'x86-64', 'amd64', 'x64')),
+    ('i386', ('i386', 'i486', 'i586', 'i686', 'x86', '32bit')),
+    ('ppc', ('ppc64le', 'ppc64el', 'ppc64', 'powerpc', 'ppc')),
+    ('mips', ('mips64el', 'mipsel', 'mips')),
+    ('sparc', ('sparc64', 'sparc')),
+]
+
+
+class IsoError(Exception):
+    pass
+
+
+def _u16(data, offset):
+    return struct.unpack_from('<H', data, offset)[0]
+
+
+def _u32(data, offset):
+    return struct.unpack_from('<I', data, offset)[0]
+
+
+def _text(raw):
+    return raw.decode('ascii', 'replace').strip(' \x00')
+
+
+def _sector(data, lba):
+    start = lba * SECTOR
+    if lba <= 0 or start + SECTOR > len(data):
+        raise IsoError(f'sector {lba} is outside the image')
+    return start
+
+
+def read_descriptors(data):
+    """Return (primary volume descriptor offset, boot catalog LBA or None)."""
+    pvd = catalog = None
+    for i in range(MAX_DESCRIPTORS):
+        offset = DESCRIPTORS + i * SECTOR
+        if offset + SECTOR > len(data) or data[offset + 1:offset + 6] != b'CD001':
+            break
+        kind = data[offset]
+        if kind == PRIMARY_VOLUME and pvd is None:
+            pvd = offset
+        elif kind == BOOT_RECORD and data[offset + 7:offset + 7 + len(EL_TORITO)] == EL_TORITO:
+            catalog = _u32(data, offset + 0x47)
+        elif kind == TERMINATOR:
+            break
+    if pvd is None:
+        raise IsoError('no ISO9660 primary volume descriptor')
+    return pvd, catalog
+
+
+def read_boot_catalog(data, lba):
+    """Platform ids with a bootable entry in the El Torito catalog."""
+    start = _sector(data, lba)
+    # Validation entry: header id 1 and the 0x55 0xAA key
+    if data[start] != 0x01 or data[start + 30:start + 32] != b'\x55\xaa':
+        raise IsoError('corrupt El Torito boot catalog')
+    platforms = set()
+    # The default entry right after it boots on the validation entry's platform
+    if data[start + 32] == 0x88:
+        platforms.add(data[start + 1])
+
+    offset = start + 64
+    end = start + SECTOR
+    while offset + 32 <= end:
+        header = data[offset]
+        if header not in (0x90, 0x91):
+            break
+        platform = data[offset + 1]
+        count = _u16(data, offset + 2)
+        offset += 32
+        for _ in range(count):
+            if offset + 32 > end:
+                break
+            # Section entries, possibly followed by extension entries (0x44)
+            if data[offset] == 0x88:
+                platforms.add(platform)
+            offset += 32
+            while offset + 32 <= end and data[offset] == 0x44:
+                offset += 32
+        if header == 0x91:
+            break
+    return platforms
+
+
+def _records(data, lba, length):
+    """(name, lba, length, is_dir) of every entry in a directory extent."""
+    start = _sector(data, lba)
+    end = min(start + length, len(data))
+    offset = start
+    while offset < end:
+        size = data[offset]
+        if size == 0:
+            # Records don't cross sectors, the rest of this one is padding
+            offset = (offset // SECTOR + 1) * SECTOR
+            continue
+        name_len = data[offset + 32]
+        name = data[offset + 33:offset + 33 + name_len]
+        if name not in (b'\x00', b'\x01'):
+            yield (
+                name.decode('ascii', 'replace').split(';')[0].rstrip('.').upper(),
+                _u32(data, offset + 2), _u32(data, offset + 10), bool(data[offset + 25] & 0x02),
+            )
+        offset += size
+
+
+def _find(data, lba, length, name, want_dir):
+    for entry_name, entry_lba, entry_length, is_dir in _records(data, lba, length):
+        if entry_name == name and is_dir == want_dir:
+            return entry_lba, entry_length
+    return None
+
+
+def efi_loaders(data, pvd):
+    """Names of the BOOT*.EFI files in EFI/BOOT."""
+    # Root directory record sits at offset 156 of the primary volume descriptor
+    lba, length = _u32(data, pvd + 156 + 2), _u32(data, pvd + 156 + 10)
+    for name in ('EFI', 'BOOT'):
+        found = _find(data, lba, length, name, True)
+        if not found:
+            return []
+        lba, length = found
+    return sorted(n for n, _, _, is_dir in _records(data, lba, length) if not is_dir and n in EFI_LOADERS)
+
+
+def keyword_arch(*texts):
+    """Guess the system from names like debian-12-amd64-netinst."""
+    words = ' '.join(t for t in texts if t).lower()
+    for system, keywords in ARCH_KEYWORDS:
+        for keyword in keywords:
+            if re.search(rf'(?<![a-z0-9]){re.escape(keyword)}(?![a-z0-9])', words):
+                return system
+    return None
+
+
+def read_iso(path):
+    """Volume label, system and boot methods of one ISO image."""
+    with open(path, 'rb') as f:
+        try:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            raise IsoError('empty file')
+        try:
+            pvd, catalog = read_descriptors(data)
+            label = _text(data[pvd + 40:pvd + 72])
+            platforms = read_boot_catalog(data, catalog) if catalog else set()
+            loaders = efi_loaders(data, pvd)
+        finally:
+            data.close()
+
+    # Multi-arch media: the first loader in EFI_LOADERS order wins
+    system = next((system for name, system in EFI_LOADERS.items() if name in loaders), None)
+    if not system and PLATFORM_X86 in platforms:
+        # 32 bit installers say so, the x86_64 binary boots them either way
+        system = 'i386' if keyword_arch(os.path.basename(path), label) == 'i386' else 'x86_64'
+    if not system and PLATFORM_PPC in platforms:
+        system = 'ppc'
+    if not system:
+        system = keyword_arch(os.path.basename(path), label)
+    return {
+        'label': label,
+        'system': system,
+        'bios': PLATFORM_X86 in platforms,
+        'uefi': PLATFORM_EFI in platforms or bool(loaders),
+        'efi_loaders': loaders,
+        'platforms': sorted(PLATFORM_NAMES.get(p, hex(p)) for p in platforms),
+    }
+
+
+def _is_iso(name):
+    return name.lower().endswith('.iso')
+
+
+class IsoLibrary:
+    """ISO directories and what is known about every image in them, as JSON."""
+
+    def __init__(self, path=None):
+        self.path = path or os.path.join(cache_dir(), 'isolib.json')
+        self.lock = threading.Lock()
+        self.data = None
+
+    def _load(self):
+        if self.data is None:
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self.data = json.load(f)
+            except (OSError, ValueError):
+                self.data = {}
+            self.data.setdefault('roots', [])
+            self.data.setdefault('images', {})
+        return self.data
+
+    def _save(self):
+        tmp = f'{self.path}.{os.getpid()}.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(self.data, f, indent=1)
+        os.replace(tmp, self.path)
+
+    @property
+    def roots(self):
+        with self.lock:
+            return list(self._load()['roots'])
+
+    def add_root(self, root):
+        root = os.path.abspath(root)
+        if not os.path.isdir(root):
+            raise IsoError(f'{root} is not a directory')
+        with self.lock:
+            roots = self._load()['roots']
+            if root not in roots:
+                roots.append(root)
+                self._save()
+        return root
+
+    def remove_root(self, root):
+        root = os.path.abspath(root)
+        with self.lock:
+            data = self._load()
+            if root in data['roots']:
+                data['roots'].remove(root)
+            prefix = os.path.join(root, '')
+            for path in [p for p in data['images'] if p.startswith(prefix)]:
+                del data['images'][path]
+            self._save()
+
+    def _entry(self, path, st, entry):
+        """entry if it still describes the file at path, else a freshly read one."""
+        key = {'size': st.st_size, 'mtime': st.st_mtime_ns, 'version': INDEX_VERSION}
+        if entry and entry.get('key') == key:
+            return entry, False
+        try:
+            info = read_iso(path)
+            info['error'] = None
+        except (OSError, IsoError, IndexError, struct.error) as e:
+            info = {'label': None, 'system': keyword_arch(os.path.basename(path)), 'bios': False,
+                    'uefi': False, 'efi_loaders': [], 'platforms': [], 'error': str(e)}
+        info['key'] = key
+        return info, True
+
+    def scan(self, roots=None):
+        """Index new and changed images under roots (default: every root); returns counts."""
+        roots = [os.path.abspath(r) for r in roots] if roots else self.roots
+        with self.lock:
+            known = dict(self._load()['images'])
+
+        counts = {'added': 0, 'updated': 0, 'removed': 0, 'unchanged': 0}
+        found = {}
+        for root in roots:
+            for dirpath, _, filenames in os.walk(root):
+                for name in filenames:
+                    if not _is_iso(name):
+                        continue
+                    path = os.path.join(dirpath, name)
+                    try:
+                        st = os.stat(path)
+                    except OSError:
+                        continue
+                    entry, changed = self._entry(path, st, known.get(path))
+                    found[path] = entry
+                    if not changed:
+                        counts['unchanged'] += 1
+                    elif path in known:
+                        counts['updated'] += 1
+                    else:
+                        counts['added'] += 1
+
+        prefixes = tuple(os.path.join(r, '') for r in roots)
+        with self.lock:
+            images = self._load()['images']
+            for path in [p for p in images if p.startswith(prefixes) and p not in found]:
+                del images[path]
+                counts['removed'] += 1
+            images.update(found)
+            self._save()
+        return counts
+
+    def lookup(self, path):
+        """Index entry of one image, read (and remembered) if it is new or changed."""
+        path = os.path.abspath(path)
+        st = os.stat(path)
+        with self.lock:
+            entry = self._load()['images'].get(path)
+        entry, changed = self._entry(path, st, entry)
+        if changed:
+            with self.lock:
+                self._load()['images'][path] = entry
+                self._save()
+        return entry
+
+    def system_for(self, path):
+        """QEMU system to boot path with, or None if it can't be told."""
+        try:
+            return self.lookup(path)['system']
+        except OSError:
+            return None
+
+    def find(self, query=None, system=None):
+        """(path, entry) of indexed images matching query (file name or label) and system."""
+        query = query.lower() if query else None
+        with self.lock:
+            images = list(self._load()['images'].items())
+        matches = []
+        for path, entry in sorted(images):
+            if system and entry.get('system') != system:
+                continue
+            if query and query not in os.path.basename(path).lower() and query not in (entry.get('label') or '').lower():
+                continue
+            matches.append((path, entry))
+        return matches
+
+
+_default_library = None
+
+
+def default_library():
+    global _default_library
+    if _default_library is None:
+        _default_library = IsoLibrary()
+    return _default_library
+
+
+def _describe(path, entry):
+    boot = '+'.join(sorted(set(entry.get('platforms', [])) | {b for b in ('bios', 'uefi') if entry.get(b)}))
+    boot = boot or 'not bootable'
+    if entry.get('error'):
+        boot = entry['error']
+    return f'{entry.get("system") or "?":8} {boot:12} {entry.get("label") or "":32} {path}'
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Index ISO images by label, architecture and boot method.')
+    sub = parser.add_subparsers(dest='action', required=True)
+    add = sub.add_parser('add', help='add directories to the library and scan them')
+    add.add_argument('dirs', nargs='+')
+    remove = sub.add_parser('remove', help='forget directories')
+    remove.add_argument('dirs', nargs='+')
+    sub.add_parser('scan', help='pick up new, changed and deleted images')
+    show = sub.add_parser('list', help='show indexed images')
+    show.add_argument('query', nargs='?', help='part of the file name or volume label')
+    show.add_argument('--arch', help='only images for this system')
+    one = sub.add_parser('show', help='read one image')
+    one.add_argument('iso')
+    args = parser.parse_args(argv)
+
+    library = default_library()
+    if args.action == 'add':
+        try:
+            roots = [library.add_root(d) for d in args.dirs]
+        except IsoError as e:
+            parser.error(str(e))
+        print(', '.join(f'{n} {k}' for k, n in library.scan(roots).items()))
+    elif args.action == 'remove':
+        for d in args.dirs:
+            library.remove_root(d)
+    elif args.action == 'scan':
+        print(', '.join(f'{n} {k}' for k, n in library.scan().items()))
+    elif args.action == 'list':
+        for path, entry in library.find(args.query, args.arch):
+            print(_describe(path, entry))
+    else:
+        try:
+            print(_describe(os.path.abspath(args.iso), library.lookup(args.iso)))
+        except OSError as e:
+            parser.error(str(e))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,233 @@
+"""Build QEMU command lines from plain VM specs, without any Qt."""
+import os
+from dataclasses import dataclass, field, fields
+
+import qemu_ioprofile
+from qemu_qmp import qmp_args
+
+
+EXE_SUFFIX = '.exe' if os.name == 'nt' else ''
+
+SYSTEMS = ['x86_64', 'i386', 'arm', 'aarch64', 'mips', 'ppc', 'sparc', 'riscv64']
+
+# Pick the system from the ISO (see qemu_isolib)
+AUTO_SYSTEM = 'auto'
+
+MIN_RAM = 128
+
+
+def default_qemu_dir():
+    """The qemu/ directory that sits next to the launcher scripts."""
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), 'qemu')
+
+
+def cache_dir():
+    """Per-user directory for probe results, snapshots and indexes."""
+    if os.name == 'nt':
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~')
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+    path = os.path.join(base, 'qemuuick')
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def qemu_binary(qemu_dir, system):
+    """Path of the qemu-system-<system> binary inside qemu_dir."""
+    return os.path.join(qemu_dir, f'qemu-system-{system}{EXE_SUFFIX}')
+
+
+def split_switches(switches):
+    """Accept custom switches either as a string or as a list of arguments."""
+    if not switches:
+        return []
+    if isinstance(switches, str):
+        return switches.split()
+    return [str(s) for s in switches]
+
+
+def qemu_opt_path(path):
+    """Escape a path for use inside a QEMU option string like -drive file=..."""
+    return path.replace(',', ',,')
+
+
+@dataclass
+class VMSpec:
+    """Everything needed to launch one guest."""
+    system: str
+    ram: int
+    iso: str = None
+    switches: list = field(default_factory=list)
+    name: str = None
+    accel: str = None
+    cpu: str = None
+    smp: int = None
+    disk: str = None
+    disposable: bool = True
+    overlay: str = None
+    warm_start: bool = False
+    ready_marker: str = None
+    ready_timeout: float = 120
+    # Socket path, or a TCP port on Windows (see qemu_qmp)
+    qmp_address: str = None
+    incoming: str = None
+    balloon: bool = False
+    balloon_min: int = None
+    balloon_device: str = None
+    io_profile: str = None
+    # Drive cache mode, overrides the one the I/O profile picks
+    cache: str = None
+    tap: str = None
+    io: dict = None
+
+    def __post_init__(self):
+        self.switches = split_switches(self.switches)
+        if not self.name:
+            image = self.iso or self.disk
+            self.name = os.path.splitext(os.path.basename(image))[0] if image else self.system
+
+    def has_switch(self, *names):
+        """True if the user passed any of names in the custom switches."""
+        return any(s in names for s in self.switches)
+
+    def validate(self):
+        """Raise ValueError with a user facing message if the spec can't be launched."""
+        if self.system == AUTO_SYSTEM:
+            raise ValueError(f'Could not tell which system {self.iso or self.disk} is for, please pick one.')
+        if self.system not in SYSTEMS:
+            raise ValueError(f'Unknown system: {self.system}')
+        try:
+            ram = int(self.ram)
+        except (TypeError, ValueError):
+            raise ValueError('Please enter a valid memory size in MB (minimum 128 MB).')
+        if ram < MIN_RAM:
+            raise ValueError('Please enter a valid memory size in MB (minimum 128 MB).')
+        self.ram = ram
+        if self.balloon_min is not None and not MIN_RAM <= int(self.balloon_min) <= ram:
+            raise ValueError(f'Balloon minimum must be between {MIN_RAM} MB and the VM memory size.')
+        if self.io_profile is not None and self.io_profile not in qemu_ioprofile.PROFILES:
+            raise ValueError(f'Unknown I/O profile: {self.io_profile}')
+        if self.cache is not None and self.cache not in qemu_ioprofile.CACHE_MODES:
+            raise ValueError(f'Unknown cache mode: {self.cache}')
+        if self.smp is not None and int(self.smp) < 1:
+            raise ValueError('-smp must be at least 1.')
+        if self.warm_start and self.disk and not self.disposable:
+            raise ValueError('Warm start needs an ISO or a disposable disk, a persistent disk would not match the saved state.')
+        if not self.iso and not self.disk:
+            raise ValueError('Please select an ISO path or a disk image.')
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a spec from a dict as found in a fleet spec file."""
+        known = {f.name for f in fields(cls)}
+        unknown = set(data) - known
+        if unknown:
+            raise ValueError(f'Unknown VM spec keys: {", ".join(sorted(unknown))}')
+        return cls(**data)
+
+
+def default_drive_args(spec, drive_opts=''):
+    # Disk: the per-launch overlay if we got one, else the image itself
+    args = []
+    if spec.overlay:
+        args += ['-drive', f'file={qemu_opt_path(spec.overlay)},format=qcow2{drive_opts}']
+    elif spec.disk:
+        args += ['-drive', f'file={qemu_opt_path(spec.disk)}{drive_opts}']
+
+    # Boot the ISO if there is one, otherwise the disk
+    if spec.iso:
+        args += ['-cdrom', spec.iso, '-boot', 'd']
+    else:
+        args += ['-boot', 'c']
+    return args
+
+
+def io_args(spec, io):
+    """Render the settings from qemu_ioprofile.choose() as QEMU arguments."""
+    drive_opts = f',cache={io["cache"]},aio={io["aio"]}'
+    if io['disk_bus'] is None:
+        # compat: machine default controllers, just pin down cache and AIO
+        return default_drive_args(spec, drive_opts)
+
+    args = []
+    iothread = ''
+    if io['iothread']:
+        args += ['-object', 'iothread,id=io0']
+        iothread = ',iothread=io0'
+
+    image = spec.overlay or spec.disk
+    if (image and io['disk_bus'] == 'virtio-scsi') or (spec.iso and io['cdrom_bus'] == 'virtio-scsi'):
+        args += ['-device', f'virtio-scsi-pci,id=scsi0{iothread},num_queues={io["queues"]}']
+
+    # The ISO boots first when there is one, bootindex replaces -boot
+    if spec.iso:
+        args += ['-drive', f'file={qemu_opt_path(spec.iso)},if=none,id=cd0,media=cdrom,readonly=on']
+        args += ['-device', 'scsi-cd,drive=cd0,bus=scsi0.0,bootindex=0']
+    if image:
+        fmt = ',format=qcow2' if spec.overlay else ''
+        args += ['-drive', f'file={qemu_opt_path(image)},if=none,id=disk0{fmt}{drive_opts},discard=unmap']
+        bootindex = 1 if spec.iso else 0
+        if io['disk_bus'] == 'virtio-scsi':
+            args += ['-device', f'scsi-hd,drive=disk0,bus=scsi0.0,bootindex={bootindex}']
+        else:
+            args += ['-device', f'virtio-blk-pci,drive=disk0{iothread},num-queues={io["queues"]},bootindex={bootindex}']
+
+    if io['nic']:
+        nic = f'{io["nic"]},netdev=net0'
+        if spec.tap:
+            netdev = f'tap,id=net0,ifname={spec.tap},script=no,downscript=no'
+            if io['net_queues'] > 1:
+                netdev += f',queues={io["net_queues"]}'
+                nic += f',mq=on,vectors={2 * io["net_queues"] + 2}'
+            if io['vhost']:
+                netdev += ',vhost=on'
+        else:
+            netdev = 'user,id=net0'
+        args += ['-netdev', netdev, '-device', nic]
+
+    if io['rng']:
+        args += ['-object', 'rng-builtin,id=rng0', '-device', 'virtio-rng-pci,rng=rng0']
+    return args
+
+
+def build_command(spec, qemu_dir=None):
+    """Return the argument list that launches spec."""
+    spec.validate()
+    qemu_dir = qemu_dir or default_qemu_dir()
+
+    # QEMU base command
+    command = [
+        qemu_binary(qemu_dir, spec.system),
+        '-m', str(spec.ram),
+    ]
+
+    # Disks, CD-ROM and NIC: tuned by an I/O profile, or QEMU's defaults
+    if spec.io_profile or spec.cache:
+        command += io_args(spec, spec.io or qemu_ioprofile.choose(spec))
+    else:
+        command += default_drive_args(spec)
+
+    # Accelerator and CPU, usually filled in by qemu_probe.autotune
+    if spec.accel:
+        command += ['-accel', spec.accel]
+    if spec.cpu:
+        command += ['-cpu', spec.cpu]
+    if spec.smp:
+        command += ['-smp', str(spec.smp)]
+
+    # Balloon so idle memory can be handed back, see qemu_balloon
+    if spec.balloon:
+        command += ['-device', f'{spec.balloon_device or "virtio-balloon-pci"},id=balloon0']
+
+    # Serial console on stdout so the fleet can watch for the ready marker
+    if spec.ready_marker and not spec.has_switch('-serial', '-nographic'):
+        command += ['-serial', 'stdio']
+    if spec.qmp_address:
+        command += qmp_args(spec.qmp_address)
+    # Resume a saved state instead of booting
+    if spec.incoming:
+        command += ['-incoming', spec.incoming]
+
+    # Add custom switches (if any)
+    command += spec.switches
+    return command
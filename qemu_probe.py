@@ -0,0 +1,330 @@
+"""Ask qemu-system-* binaries what they support and pick the fastest accelerator.
+
+Probing means running the binary a handful of times, so results are cached on
+disk keyed by binary path, size and mtime: a QEMU install is probed once.
+
+Usage:
+    python qemu_probe.py [--qemu-dir DIR] [--refresh] [system ...]
+"""
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import threading
+
+from qemu_launch import SYSTEMS, cache_dir, default_qemu_dir, qemu_binary
+
+
+PROBE_TIMEOUT = 30
+
+# Bump when probe() learns something new, older cache entries get probed again
+PROBE_VERSION = 4
+
+# Devices whose properties we want to know about, not just whether they exist
+PROPERTY_DEVICES = ['virtio-balloon-pci', 'virtio-balloon-device']
+
+# Besides the always available thread pool
+AIO_MODES = ['io_uring', 'native']
+
+# Fastest first; whichever the binary has and the host can actually run wins
+HW_ACCELS = ['kvm', 'hvf', 'whpx']
+MTTCG = 'tcg,thread=multi'
+
+# Machines known to take more than one CPU
+SMP_MACHINES = {'pc', 'q35', 'microvm', 'virt'}
+
+MAX_AUTO_SMP = 4
+
+
+class ProbeError(Exception):
+    pass
+
+
+def _run(binary, *args, stdin=None):
+    try:
+        result = subprocess.run(
+            [binary, *args], input=stdin, capture_output=True, text=True, timeout=PROBE_TIMEOUT
+        )
+    except (OSError, subprocess.TimeoutExpired) as e:
+        raise ProbeError(f'{binary}: {e}')
+    return result
+
+
+def _help_lines(binary, option, value='help'):
+    result = _run(binary, option, value)
+    if result.returncode != 0:
+        return []
+    return result.stdout.splitlines()
+
+
+def parse_accels(lines):
+    # "Accelerators supported in QEMU binary:" followed by one name per line
+    return [l.strip() for l in lines if l.strip() and not l.rstrip().endswith(':')]
+
+
+def parse_machines(lines):
+    """Return (machine names, default machine)."""
+    machines, default = [], None
+    for line in lines:
+        if not line.strip() or line.rstrip().endswith(':'):
+            continue
+        name = line.split()[0]
+        machines.append(name)
+        if '(default)' in line:
+            default = name
+    return machines, default
+
+
+# Words some targets put before every CPU model in -cpu help
+CPU_PREFIXES = ('x86', 'PowerPC', 'MIPS', 'Sparc', 's390')
+
+
+def parse_cpus(lines):
+    cpus = []
+    prefixed = False
+    for line in lines:
+        stripped = line.strip()
+        # x86 and s390x follow the model list with a CPUID flag dump, nothing useful after that
+        if stripped.startswith('Recognized'):
+            break
+        if not stripped or stripped.endswith(':'):
+            continue
+        word, _, rest = stripped.partition(' ')
+        if word in CPU_PREFIXES and rest.strip():
+            prefixed = True
+            model = rest.strip()
+        elif prefixed:
+            # Notes after a prefixed list, like sparc's feature flags
+            continue
+        else:
+            model = stripped
+        if word == 'Sparc':
+            # "Sparc  TI UltraSparc IIi IU ..." is -cpu TI-UltraSparc-IIi
+            model = '-'.join(model.split(' IU ')[0].split())
+        else:
+            model = model.split()[0]
+        cpus.append(model.strip("'"))
+    return cpus
+
+
+def parse_devices(lines):
+    return re.findall(r'^name "([^"]+)"', '\n'.join(lines), re.MULTILINE)
+
+
+def parse_properties(lines):
+    # "  free-page-reporting=<bool>   - (default: false)"
+    return [m.group(1) for m in (re.match(r'^\s+([\w.-]+)=', l) for l in lines) if m]
+
+
+def accel_works(binary, accel):
+    """Actually start an empty machine on accel, the binary listing it isn't enough."""
+    result = _run(
+        binary, '-machine', 'none', '-accel', accel, '-display', 'none',
+        '-nodefaults', '-S', '-monitor', 'stdio', stdin='quit\n'
+    )
+    return result.returncode == 0
+
+
+def aio_works(binary, aio):
+    """Open a scratch file with this AIO engine, QEMU builds differ in what they have."""
+    scratch = os.path.join(cache_dir(), f'aio-probe-{os.getpid()}-{threading.get_ident()}.img')
+    with open(scratch, 'wb') as f:
+        f.truncate(1024 * 1024)
+    # native AIO insists on O_DIRECT
+    direct = ',cache.direct=on' if aio == 'native' else ''
+    try:
+        result = _run(
+            binary, '-machine', 'none', '-display', 'none', '-nodefaults', '-S', '-monitor', 'stdio',
+            '-blockdev', f'driver=file,node-name=probe,filename={scratch.replace(",", ",,")},aio={aio}{direct}',
+            stdin='quit\n'
+        )
+    finally:
+        os.remove(scratch)
+    return result.returncode == 0
+
+
+def probe(binary):
+    """Collect accelerators, machines, CPU models and devices of one binary."""
+    if not os.path.exists(binary):
+        raise ProbeError(f'{binary} does not exist')
+
+    accels = parse_accels(_help_lines(binary, '-accel'))
+    machines, default_machine = parse_machines(_help_lines(binary, '-machine'))
+    candidates = [a for a in HW_ACCELS if a in accels]
+    if 'tcg' in accels:
+        candidates.append(MTTCG)
+    usable = [a for a in candidates if accel_works(binary, a)]
+    if 'tcg' in accels:
+        usable.append('tcg')
+
+    devices = parse_devices(_help_lines(binary, '-device'))
+    properties = {
+        dev: parse_properties(_help_lines(binary, '-device', f'{dev},help'))
+        for dev in PROPERTY_DEVICES if dev in devices
+    }
+
+    return {
+        'aio_modes': [aio for aio in AIO_MODES if aio_works(binary, aio)],
+        'accels': accels,
+        'usable_accels': usable,
+        'machines': machines,
+        'default_machine': default_machine,
+        'cpus': parse_cpus(_help_lines(binary, '-cpu')),
+        'devices': devices,
+        'device_properties': properties,
+    }
+
+
+class ProbeCache:
+    """Probe results stored as JSON, invalidated when a binary changes on disk."""
+
+    def __init__(self, path=None):
+        self.path = path or os.path.join(cache_dir(), 'probe.json')
+        self.lock = threading.Lock()
+        self.binary_locks = {}
+        self.entries = None
+
+    def _load(self):
+        if self.entries is None:
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self.entries = json.load(f)
+            except (OSError, ValueError):
+                self.entries = {}
+        return self.entries
+
+    def _save(self):
+        tmp = f'{self.path}.{os.getpid()}.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f, indent=1)
+        os.replace(tmp, self.path)
+
+    def get(self, binary, refresh=False):
+        """Return cached capabilities of binary, probing it if it is new or changed."""
+        binary = os.path.abspath(binary)
+        try:
+            st = os.stat(binary)
+        except OSError as e:
+            raise ProbeError(f'{binary}: {e}')
+        key = {'size': st.st_size, 'mtime': st.st_mtime_ns, 'version': PROBE_VERSION}
+
+        with self.lock:
+            binary_lock = self.binary_locks.setdefault(binary, threading.Lock())
+
+        # One probe per binary even when fifty launches ask at once
+        with binary_lock:
+            with self.lock:
+                entry = self._load().get(binary)
+            if entry and not refresh and entry['key'] == key:
+                return entry['caps']
+
+            caps = probe(binary)
+            with self.lock:
+                self._load()[binary] = {'key': key, 'caps': caps}
+                self._save()
+            return caps
+
+
+_default_cache = None
+
+
+def default_cache():
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = ProbeCache()
+    return _default_cache
+
+
+def capabilities(qemu_dir, system, cache=None):
+    return (cache or default_cache()).get(qemu_binary(qemu_dir, system))
+
+
+def best_accel(caps):
+    """Fastest accelerator from a probe result."""
+    for accel in caps['usable_accels']:
+        # /dev/kvm can disappear (module unloaded, permissions) after the probe ran
+        if accel == 'kvm' and not os.access('/dev/kvm', os.R_OK | os.W_OK):
+            continue
+        return accel
+    return None
+
+
+def default_smp():
+    return max(1, min(MAX_AUTO_SMP, (os.cpu_count() or 1) // 2))
+
+
+def balloon_device(caps):
+    """virtio-balloon device for this binary, with free page reporting when it has it."""
+    devices = caps['devices']
+    # virtio-mmio machines only have the bare device
+    if 'virtio-balloon-device' in devices and 'virtio-balloon-pci' not in devices:
+        device = 'virtio-balloon-device'
+    else:
+        device = 'virtio-balloon-pci'
+    if 'free-page-reporting' in caps.get('device_properties', {}).get(device, []):
+        device += ',free-page-reporting=on'
+    return device
+
+
+def _switch_value(switches, *names):
+    for i, s in enumerate(switches[:-1]):
+        if s in names:
+            return switches[i + 1]
+    return None
+
+
+def autotune(spec, qemu_dir=None, cache=None):
+    """Fill in accel, cpu and smp on spec unless the user already chose them."""
+    caps = capabilities(qemu_dir or default_qemu_dir(), spec.system, cache)
+
+    accel_given = (
+        spec.accel or spec.has_switch('-accel', '-enable-kvm')
+        or any('accel=' in s for s in spec.switches)
+    )
+    if not accel_given:
+        spec.accel = best_accel(caps)
+
+    # Only pick a CPU model when we know which accelerator it runs on
+    if spec.accel and not spec.cpu and not spec.has_switch('-cpu'):
+        if spec.accel in ('kvm', 'hvf') and 'host' in caps['cpus']:
+            spec.cpu = 'host'
+        elif 'max' in caps['cpus']:
+            spec.cpu = 'max'
+
+    if spec.balloon and not spec.balloon_device:
+        spec.balloon_device = balloon_device(caps)
+
+    if not spec.smp and not spec.has_switch('-smp') and spec.accel != 'tcg':
+        machine = _switch_value(spec.switches, '-M', '-machine') or caps['default_machine'] or ''
+        machine = machine.split(',')[0]
+        if machine in SMP_MACHINES or machine.startswith(('pc-', 'virt-')):
+            spec.smp = default_smp()
+    return spec
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Probe QEMU binaries and show what would be used.')
+    parser.add_argument('systems', nargs='*', default=SYSTEMS)
+    parser.add_argument('--qemu-dir', default=default_qemu_dir())
+    parser.add_argument('--refresh', action='store_true', help='ignore the cache and probe again')
+    args = parser.parse_args(argv)
+
+    cache = default_cache()
+    for system in args.systems:
+        binary = qemu_binary(args.qemu_dir, system)
+        if not os.path.exists(binary):
+            continue
+        try:
+            caps = cache.get(binary, refresh=args.refresh)
+        except ProbeError as e:
+            print(f'{system}: {e}')
+            continue
+        print(f'{system}: accels={",".join(caps["usable_accels"])} best={best_accel(caps)} '
+              f'machines={len(caps["machines"])} cpus={len(caps["cpus"])} devices={len(caps["devices"])}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
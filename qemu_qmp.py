@@ -0,0 +1,169 @@
+"""Minimal asyncio client for the QEMU Machine Protocol (QMP).
+
+QMP gives full control over a guest (including migrating it into any file
+QEMU can write), so on POSIX guests get a unix socket in a directory only
+we can enter. Windows gets a local TCP port instead:
+
+    -qmp unix:<dir>/<name>.sock,server=on,wait=off
+    -qmp tcp:127.0.0.1:<port>,server=on,wait=off
+
+An address is the socket path (str) or the TCP port (int).
+"""
+import asyncio
+import collections
+import json
+import os
+import socket
+import tempfile
+import uuid
+
+
+CONNECT_TIMEOUT = 10
+
+# sun_path is 108 bytes on Linux, 104 on macOS
+MAX_SOCKET_PATH = 100
+
+TEMP_PREFIX = 'qemuuick-qmp-'
+
+MAX_EVENTS = 256
+
+
+class QMPError(Exception):
+    pass
+
+
+def free_port():
+    """A local TCP port nobody listens on right now."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def _private_dir(directory):
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    # makedirs leaves an existing directory's mode alone
+    os.chmod(directory, 0o700)
+    return directory
+
+
+def new_address(directory):
+    """QMP address for a new guest: a socket in directory (made private), a TCP port on Windows."""
+    if os.name == 'nt' or not hasattr(socket, 'AF_UNIX'):
+        return free_port()
+    name = f'{uuid.uuid4().hex[:16]}.sock'
+    path = os.path.join(_private_dir(directory), name)
+    if len(path.encode('utf-8')) > MAX_SOCKET_PATH:
+        # Deep cache dir, mkdtemp makes its directories 0700 too
+        path = os.path.join(tempfile.mkdtemp(prefix=TEMP_PREFIX), name)
+    return path
+
+
+def remove_address(address):
+    """Remove a socket QEMU left behind (it does so when killed)."""
+    if isinstance(address, str):
+        try:
+            os.remove(address)
+        except FileNotFoundError:
+            pass
+        directory = os.path.dirname(address)
+        if os.path.basename(directory).startswith(TEMP_PREFIX):
+            try:
+                os.rmdir(directory)
+            except OSError:
+                pass
+
+
+def qmp_args(address):
+    if isinstance(address, str):
+        return ['-qmp', f'unix:{address.replace(",", ",,")},server=on,wait=off']
+    return ['-qmp', f'tcp:127.0.0.1:{address},server=on,wait=off']
+
+
+class QMPClient:
+    """One QMP connection; commands are sent one at a time."""
+
+    def __init__(self, address, host='127.0.0.1'):
+        self.host = host
+        self.address = address
+        self.reader = None
+        self.writer = None
+        self.greeting = None
+        self.events = collections.deque(maxlen=MAX_EVENTS)
+        self._lock = asyncio.Lock()
+        self._ids = 0
+
+    @property
+    def connected(self):
+        return self.writer is not None
+
+    async def connect(self, timeout=CONNECT_TIMEOUT):
+        """Connect and negotiate capabilities, retrying while QEMU is still starting."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while True:
+            try:
+                if isinstance(self.address, str):
+                    self.reader, self.writer = await asyncio.open_unix_connection(self.address)
+                else:
+                    self.reader, self.writer = await asyncio.open_connection(self.host, self.address)
+                break
+            except OSError as e:
+                if loop.time() >= deadline:
+                    raise QMPError(f'Could not connect to QMP on {self.address}: {e}')
+                await asyncio.sleep(0.1)
+
+        self.greeting = await self._read()
+        if 'QMP' not in self.greeting:
+            raise QMPError(f'Unexpected QMP greeting: {self.greeting}')
+        await self.execute('qmp_capabilities')
+        return self
+
+    async def _read(self):
+        while True:
+            line = await self.reader.readline()
+            if not line:
+                raise QMPError('QMP connection closed')
+            line = line.strip()
+            if line:
+                return json.loads(line)
+
+    async def execute(self, command, arguments=None):
+        """Run a QMP command and return its 'return' value."""
+        if not self.connected:
+            raise QMPError('QMP not connected')
+        async with self._lock:
+            self._ids += 1
+            request = {'execute': command, 'id': self._ids}
+            if arguments:
+                request['arguments'] = arguments
+            self.writer.write(json.dumps(request).encode('utf-8') + b'\n')
+            await self.writer.drain()
+
+            while True:
+                message = await self._read()
+                if 'event' in message:
+                    self.events.append(message)
+                    continue
+                if message.get('id') != self._ids:
+                    continue
+                if 'error' in message:
+                    error = message['error']
+                    raise QMPError(f'{command}: {error.get("desc", error)}')
+                return message.get('return')
+
+    async def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            try:
+                await self.writer.wait_closed()
+            except OSError:
+                pass
+            self.writer = None
+            self.reader = None
+
+    async def __aenter__(self):
+        return await self.connect()
+
+    async def __aexit__(self, *exc):
+        await self.close()
+        return False
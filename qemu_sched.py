@@ -0,0 +1,311 @@
+"""Admission control: only start a guest when the host has room for it.
+
+The scheduler knows the host's RAM and CPUs (from /proc and /sys on Linux)
+and the -m/-smp committed to every guest it admitted. A launch that would
+push either past its overcommit ratio waits in a FIFO queue until enough
+guests have exited.
+
+Optionally each admitted guest gets whole host cores of its own (pin='core')
+or whole cores from a single NUMA node (pin='numa'), and its vCPU threads are
+pinned to them so neighbours don't fight over the same cores and caches.
+Pinning needs os.sched_setaffinity, i.e. Linux.
+"""
+import asyncio
+import collections
+import glob
+import os
+import re
+
+
+# QEMU's own footprint on top of guest RAM (device emulation, TCG buffers, ...)
+VM_OVERHEAD_MB = 64
+
+DEFAULT_MEM_RATIO = 1.0
+DEFAULT_CPU_RATIO = 2.0
+DEFAULT_RESERVE_MB = 1024
+
+PIN_MODES = ('core', 'numa')
+
+
+class AdmissionError(Exception):
+    pass
+
+
+def parse_cpulist(text):
+    """'0-3,8,10-11' -> [0, 1, 2, 3, 8, 10, 11]"""
+    cpus = []
+    for part in text.strip().split(','):
+        if not part:
+            continue
+        if '-' in part:
+            start, end = part.split('-')
+            cpus.extend(range(int(start), int(end) + 1))
+        else:
+            cpus.append(int(part))
+    return cpus
+
+
+def _read(path):
+    with open(path, 'r') as f:
+        return f.read().strip()
+
+
+def host_memory_mb(meminfo='/proc/meminfo'):
+    try:
+        with open(meminfo, 'r') as f:
+            for line in f:
+                if line.startswith('MemTotal:'):
+                    return int(line.split()[1]) // 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    if os.name == 'nt':
+        import ctypes
+
+        class MEMORYSTATUSEX(ctypes.Structure):
+            _fields_ = [
+                ('dwLength', ctypes.c_ulong), ('dwMemoryLoad', ctypes.c_ulong),
+                ('ullTotalPhys', ctypes.c_ulonglong), ('ullAvailPhys', ctypes.c_ulonglong),
+                ('ullTotalPageFile', ctypes.c_ulonglong), ('ullAvailPageFile', ctypes.c_ulonglong),
+                ('ullTotalVirtual', ctypes.c_ulonglong), ('ullAvailVirtual', ctypes.c_ulonglong),
+                ('ullAvailExtendedVirtual', ctypes.c_ulonglong),
+            ]
+        status = MEMORYSTATUSEX()
+        status.dwLength = ctypes.sizeof(MEMORYSTATUSEX)
+        ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(status))
+        return status.ullTotalPhys // 1024 ** 2
+    return os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES') // 1024 ** 2
+
+
+def host_cpus():
+    """CPUs we are allowed to run on."""
+    if hasattr(os, 'sched_getaffinity'):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def cpu_topology(cpus, sysfs='/sys/devices/system'):
+    """Map cpu -> (numa node, core key); a core key is shared by hyperthread siblings."""
+    nodes = {}
+    for path in glob.glob(os.path.join(sysfs, 'node', 'node[0-9]*')):
+        node = int(re.search(r'(\d+)$', path).group(1))
+        try:
+            for cpu in parse_cpulist(_read(os.path.join(path, 'cpulist'))):
+                nodes[cpu] = node
+        except (OSError, ValueError):
+            continue
+
+    topology = {}
+    for cpu in cpus:
+        base = os.path.join(sysfs, 'cpu', f'cpu{cpu}', 'topology')
+        try:
+            core = (int(_read(os.path.join(base, 'physical_package_id'))), int(_read(os.path.join(base, 'core_id'))))
+        except (OSError, ValueError):
+            # No topology info, treat every CPU as its own core
+            core = (0, cpu)
+        topology[cpu] = (nodes.get(cpu, 0), core)
+    return topology
+
+
+class Host:
+    """What the scheduler may hand out."""
+
+    def __init__(self, memory_mb=None, cpus=None, topology=None):
+        self.memory_mb = memory_mb if memory_mb is not None else host_memory_mb()
+        self.cpus = cpus if cpus is not None else host_cpus()
+        self.topology = topology if topology is not None else cpu_topology(self.cpus)
+
+    def cores(self):
+        """Cores as (node, core key, [cpus]) sorted by node."""
+        grouped = collections.OrderedDict()
+        for cpu in sorted(self.cpus):
+            node, core = self.topology.get(cpu, (0, (0, cpu)))
+            grouped.setdefault((node, core), []).append(cpu)
+        return [(node, core, cpus) for (node, core), cpus in sorted(grouped.items())]
+
+
+def spec_vcpus(spec):
+    """vCPUs a spec asks for, from spec.smp or an -smp switch."""
+    if spec.smp:
+        return int(spec.smp)
+    for i, switch in enumerate(spec.switches[:-1]):
+        if switch == '-smp':
+            value = spec.switches[i + 1]
+            match = re.match(r'^(?:cpus=)?(\d+)', value) or re.search(r'(?:^|,)cpus=(\d+)', value)
+            if match:
+                return int(match.group(1))
+    return 1
+
+
+class Admission:
+    """What one admitted guest holds."""
+
+    def __init__(self, name, memory_mb, vcpus, cpus=None):
+        self.name = name
+        self.memory_mb = memory_mb
+        self.vcpus = vcpus
+        self.cpus = cpus or []
+
+
+class Scheduler:
+    """FIFO admission of guests within memory and CPU overcommit ratios."""
+
+    def __init__(self, host=None, mem_ratio=DEFAULT_MEM_RATIO, cpu_ratio=DEFAULT_CPU_RATIO,
+                 reserve_mb=DEFAULT_RESERVE_MB, pin=None):
+        if pin not in (None,) + PIN_MODES:
+            raise ValueError(f'Unknown pin mode: {pin}')
+        self.host = host or Host()
+        self.mem_ratio = mem_ratio
+        self.cpu_ratio = cpu_ratio
+        self.reserve_mb = reserve_mb
+        self.pin = pin
+        self.admitted = []
+        self.queue = collections.deque()
+        self._changed = None
+
+    @property
+    def memory_capacity_mb(self):
+        return max(0, self.host.memory_mb - self.reserve_mb) * self.mem_ratio
+
+    @property
+    def cpu_capacity(self):
+        return len(self.host.cpus) * self.cpu_ratio
+
+    @property
+    def committed_mb(self):
+        return sum(a.memory_mb for a in self.admitted)
+
+    @property
+    def committed_vcpus(self):
+        return sum(a.vcpus for a in self.admitted)
+
+    def waiting(self):
+        """Names of specs queued for room, oldest first."""
+        return [spec.name for spec in list(self.queue)]
+
+    def _condition(self):
+        # Created lazily so it belongs to the loop that runs us
+        if self._changed is None:
+            self._changed = asyncio.Condition()
+        return self._changed
+
+    def _free_cores(self):
+        taken = {cpu for a in self.admitted for cpu in a.cpus}
+        return [(node, cpus) for node, _, cpus in self.host.cores() if not taken & set(cpus)]
+
+    def _pick_cpus(self, vcpus):
+        """Whole free cores covering vcpus threads, or None if there aren't enough."""
+        free = self._free_cores()
+        if self.pin == 'numa':
+            # Everything from the node with the most free CPUs that can hold us
+            by_node = collections.OrderedDict()
+            for node, cpus in free:
+                by_node.setdefault(node, []).append(cpus)
+            candidates = sorted(by_node.values(), key=lambda cores: -sum(len(c) for c in cores))
+        else:
+            candidates = [[cpus for _, cpus in free]]
+
+        for cores in candidates:
+            picked = []
+            for cpus in cores:
+                if len(picked) >= vcpus:
+                    break
+                picked.extend(cpus)
+            if len(picked) >= vcpus:
+                return picked
+        return None
+
+    def _max_pinnable(self):
+        """Most vCPUs _pick_cpus() could ever cover, i.e. on an idle host."""
+        cores = self.host.cores()
+        if self.pin == 'numa':
+            per_node = collections.Counter()
+            for node, _, cpus in cores:
+                per_node[node] += len(cpus)
+            return max(per_node.values(), default=0)
+        return sum(len(cpus) for _, _, cpus in cores)
+
+    def _fits(self, memory_mb, vcpus):
+        """CPUs to pin to ([] when not pinning) if the guest fits now, else None."""
+        if self.admitted and self.committed_mb + memory_mb > self.memory_capacity_mb:
+            return None
+        if self.admitted and self.committed_vcpus + vcpus > self.cpu_capacity:
+            return None
+        if self.pin:
+            return self._pick_cpus(vcpus)
+        return []
+
+    def check(self, spec):
+        """Raise AdmissionError if spec could never fit, even on an idle host."""
+        memory_mb = int(spec.ram) + VM_OVERHEAD_MB
+        vcpus = spec_vcpus(spec)
+        if memory_mb > self.memory_capacity_mb:
+            raise AdmissionError(
+                f'{spec.name} needs {memory_mb} MB, the host only allows {self.memory_capacity_mb:.0f} MB for guests')
+        if vcpus > self.cpu_capacity:
+            raise AdmissionError(f'{spec.name} wants {vcpus} vCPUs, the host only allows {self.cpu_capacity:.0f}')
+        if self.pin:
+            # Otherwise it would wait at the head of the queue forever, and everyone behind it too
+            pinnable = self._max_pinnable()
+            if vcpus > pinnable:
+                where = 'one NUMA node' if self.pin == 'numa' else 'the host'
+                raise AdmissionError(
+                    f'{spec.name} wants {vcpus} vCPUs but can only be pinned to {pinnable} CPUs of {where}')
+
+    async def admit(self, spec):
+        """Wait until spec fits and return its Admission; hand it back with release()."""
+        self.check(spec)
+        memory_mb = int(spec.ram) + VM_OVERHEAD_MB
+        vcpus = spec_vcpus(spec)
+        changed = self._condition()
+        async with changed:
+            self.queue.append(spec)
+            try:
+                while True:
+                    # First come first served, a big guest doesn't starve behind small ones
+                    if self.queue[0] is spec:
+                        cpus = self._fits(memory_mb, vcpus)
+                        if cpus is not None:
+                            break
+                    await changed.wait()
+            finally:
+                self.queue.remove(spec)
+                changed.notify_all()
+            admission = Admission(spec.name, memory_mb, vcpus, cpus)
+            self.admitted.append(admission)
+            return admission
+
+    async def release(self, admission):
+        changed = self._condition()
+        async with changed:
+            if admission in self.admitted:
+                self.admitted.remove(admission)
+            changed.notify_all()
+
+    def pin_process(self, admission, pid):
+        """Restrict every thread of pid to the admission's CPUs."""
+        if not admission.cpus or not hasattr(os, 'sched_setaffinity'):
+            return
+        for tid in _threads(pid):
+            try:
+                os.sched_setaffinity(tid, admission.cpus)
+            except OSError:
+                pass
+
+    async def pin_vcpus(self, admission, vm):
+        """Pin each vCPU thread of a running fleet VMProcess to one CPU of its own."""
+        if not admission.cpus or not hasattr(os, 'sched_setaffinity'):
+            return
+        qmp = await vm.qmp()
+        vcpus = await qmp.execute('query-cpus-fast')
+        for i, cpu in enumerate(sorted(vcpus, key=lambda c: c.get('cpu-index', 0))):
+            try:
+                os.sched_setaffinity(cpu['thread-id'], [admission.cpus[i % len(admission.cpus)]])
+            except (OSError, KeyError):
+                pass
+
+
+def _threads(pid):
+    try:
+        return [int(tid) for tid in os.listdir(f'/proc/{pid}/task')]
+    except OSError:
+        return [pid]
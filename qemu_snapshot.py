@@ -0,0 +1,276 @@
+"""Warm-start cache: save booted guests once, restore them instead of cold booting.
+
+The first warm-start launch of a configuration boots normally until it is
+ready (its ready marker shows up on the serial console, or ready_timeout
+passes), then its state is migrated to a file over QMP and the guest carries
+on. Later launches with the same configuration start with -incoming from
+that file. Entries are keyed by a hash of arch, RAM, accelerator, switches
+and fingerprints of the ISO, disk and QEMU binary, and evicted LRU once the
+cache grows past max_bytes. When several launches of one configuration miss
+at once, only one of them saves.
+
+Restoring needs QEMU 8.2 or newer (file: migration URIs).
+
+Usage:
+    python qemu_snapshot.py list
+    python qemu_snapshot.py prune [--max-bytes N]
+    python qemu_snapshot.py clear
+"""
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import sys
+import threading
+import time
+import uuid
+
+from qemu_launch import cache_dir, default_qemu_dir, qemu_binary
+
+
+DEFAULT_MAX_BYTES = 20 * 1024 ** 3
+
+# Temp files of saves this old are leftovers of a crashed run
+STALE_TMP_SECONDS = 24 * 3600
+
+# Fingerprints hash this much from both ends of a file instead of all of it
+SAMPLE_BYTES = 1024 * 1024
+
+
+def fingerprint(path):
+    """Cheap identity of a (possibly huge) file: size, mtime and a head/tail sample."""
+    path = os.path.abspath(path)
+    st = os.stat(path)
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        digest.update(f.read(SAMPLE_BYTES))
+        if st.st_size > 2 * SAMPLE_BYTES:
+            f.seek(-SAMPLE_BYTES, os.SEEK_END)
+            digest.update(f.read(SAMPLE_BYTES))
+    return {'path': path, 'size': st.st_size, 'mtime': st.st_mtime_ns, 'sample': digest.hexdigest()}
+
+
+def _same_file(fp):
+    """True if the file fp was taken from is still there and unchanged."""
+    try:
+        return fingerprint(fp['path']) == fp
+    except OSError:
+        return False
+
+
+def spec_fingerprints(spec, qemu_dir=None):
+    fps = {'binary': fingerprint(qemu_binary(qemu_dir or default_qemu_dir(), spec.system))}
+    if spec.iso:
+        fps['iso'] = fingerprint(spec.iso)
+    if spec.disk:
+        fps['disk'] = fingerprint(spec.disk)
+    return fps
+
+
+def config_key(spec, fingerprints):
+    """Hash of everything that has to match for a saved state to be restorable."""
+    config = {
+        'system': spec.system,
+        'ram': spec.ram,
+        'accel': spec.accel,
+        'cpu': spec.cpu,
+        'smp': spec.smp,
+        'switches': spec.switches,
+        'ready_marker': spec.ready_marker,
+        # A state only loads into the same devices it was saved from
+        'io_profile': spec.io_profile,
+        'io': spec.io,
+        'cache': spec.cache,
+        'tap': spec.tap,
+        'balloon_device': spec.balloon_device if spec.balloon else None,
+        'files': {name: {k: v for k, v in fp.items() if k != 'path'} for name, fp in fingerprints.items()},
+    }
+    return hashlib.sha256(json.dumps(config, sort_keys=True).encode('utf-8')).hexdigest()[:32]
+
+
+class SnapshotCache:
+    """Saved VM states on disk.
+
+    Layout under root:
+        <key>.state    migration stream
+        <key>.qcow2    disk overlay as it was when the state was saved (disk guests)
+        <key>.json     metadata: fingerprints, size, last use
+    """
+
+    def __init__(self, root=None, max_bytes=DEFAULT_MAX_BYTES):
+        self.root = root or os.path.join(cache_dir(), 'snapshots')
+        self.max_bytes = max_bytes
+        os.makedirs(self.root, exist_ok=True)
+        self.lock = threading.Lock()
+        # Keys some launch is saving right now
+        self.saving = set()
+
+    def paths(self, key):
+        base = os.path.join(self.root, key)
+        return {'state': f'{base}.state', 'disk': f'{base}.qcow2', 'meta': f'{base}.json'}
+
+    def _read_meta(self, path):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_meta(self, meta):
+        path = self.paths(meta['key'])['meta']
+        tmp = f'{path}.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(meta, f, indent=1)
+        os.replace(tmp, path)
+
+    def entries(self):
+        metas = []
+        for name in os.listdir(self.root):
+            if name.endswith('.json'):
+                meta = self._read_meta(os.path.join(self.root, name))
+                if meta:
+                    metas.append(meta)
+        return metas
+
+    def lookup(self, key):
+        """Metadata of the saved state for key, or None; counts as a use for LRU."""
+        with self.lock:
+            paths = self.paths(key)
+            meta = self._read_meta(paths['meta'])
+            if not meta or not os.path.exists(paths['state']):
+                return None
+            if meta.get('disk') and not os.path.exists(paths['disk']):
+                return None
+            meta['last_used'] = time.time()
+            self._write_meta(meta)
+            return meta
+
+    def begin_save(self, key):
+        """Claim saving key's state: temp files to write it to, or None if that's taken care of.
+
+        Only one launch per key saves; the others find the state already
+        saved or being saved. Hand the claim back with commit() or abandon().
+        """
+        paths = self.paths(key)
+        with self.lock:
+            if key in self.saving or os.path.exists(paths['meta']):
+                return None
+            self.saving.add(key)
+        token = uuid.uuid4().hex[:12]
+        return {'state': f'{paths["state"]}.{token}.tmp', 'disk': f'{paths["disk"]}.{token}.tmp'}
+
+    def commit(self, key, pending, fingerprints, with_disk=False):
+        """Move a state written to begin_save()'s temp files into the cache."""
+        with self.lock:
+            try:
+                paths = self.paths(key)
+                os.replace(pending['state'], paths['state'])
+                size = os.path.getsize(paths['state'])
+                if with_disk:
+                    os.replace(pending['disk'], paths['disk'])
+                    size += os.path.getsize(paths['disk'])
+                now = time.time()
+                self._write_meta({
+                    'key': key, 'fingerprints': fingerprints, 'disk': with_disk,
+                    'size': size, 'created': now, 'last_used': now,
+                })
+            finally:
+                self.saving.discard(key)
+        self.evict()
+
+    def abandon(self, key, pending):
+        """Give up a save: drop its temp files, leave any saved state alone."""
+        with self.lock:
+            for path in pending.values():
+                _remove_file(path)
+            self.saving.discard(key)
+
+    def discard(self, key):
+        with self.lock:
+            self._remove(key)
+
+    def _remove(self, key):
+        for path in self.paths(key).values():
+            _remove_file(path)
+
+    def _remove_stale_tmp(self, max_age):
+        now = time.time()
+        for name in os.listdir(self.root):
+            path = os.path.join(self.root, name)
+            if not name.endswith('.tmp') or name.split('.')[0] in self.saving:
+                continue
+            try:
+                if now - os.path.getmtime(path) >= max_age:
+                    os.remove(path)
+            except OSError:
+                pass
+
+    def evict(self):
+        """Drop least recently used states until the cache fits in max_bytes."""
+        removed = []
+        with self.lock:
+            metas = sorted(self.entries(), key=lambda m: m.get('last_used', 0))
+            total = sum(m.get('size', 0) for m in metas)
+            while metas and total > self.max_bytes:
+                meta = metas.pop(0)
+                self._remove(meta['key'])
+                total -= meta.get('size', 0)
+                removed.append(meta['key'])
+        return removed
+
+    def prune(self):
+        """Drop states whose ISO, disk or QEMU binary changed or disappeared."""
+        removed = []
+        with self.lock:
+            self._remove_stale_tmp(STALE_TMP_SECONDS)
+            for meta in self.entries():
+                if not all(_same_file(fp) for fp in meta.get('fingerprints', {}).values()):
+                    self._remove(meta['key'])
+                    removed.append(meta['key'])
+        return removed + self.evict()
+
+    def clear(self):
+        with self.lock:
+            for meta in self.entries():
+                self._remove(meta['key'])
+            self._remove_stale_tmp(0)
+
+
+def _remove_file(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def restore_overlay(cache, key, overlay):
+    """Put the disk saved along with key's state in place of a fresh overlay."""
+    shutil.copyfile(cache.paths(key)['disk'], overlay)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Manage the warm-start snapshot cache.')
+    parser.add_argument('--max-bytes', type=int, default=DEFAULT_MAX_BYTES)
+    sub = parser.add_subparsers(dest='action', required=True)
+    sub.add_parser('list', help='show saved states')
+    sub.add_parser('prune', help='drop stale states and evict down to --max-bytes')
+    sub.add_parser('clear', help='drop every saved state')
+    args = parser.parse_args(argv)
+
+    cache = SnapshotCache(max_bytes=args.max_bytes)
+    if args.action == 'list':
+        for meta in sorted(cache.entries(), key=lambda m: m.get('last_used', 0), reverse=True):
+            files = ', '.join(os.path.basename(fp['path']) for fp in meta.get('fingerprints', {}).values())
+            used = time.strftime('%Y-%m-%d %H:%M', time.localtime(meta.get('last_used', 0)))
+            print(f'{meta["key"]} {meta.get("size", 0) // 1024 ** 2} MB last used {used} ({files})')
+    elif args.action == 'prune':
+        for key in cache.prune():
+            print(f'removed {key}')
+    else:
+        cache.clear()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,263 @@
+"""Live per-VM performance samples polled over QMP.
+
+Every watched guest is polled from the fleet's event loop (one task per VM,
+no threads) for run state, vCPU thread times, block stats and memory/balloon
+size. Samples go into a fixed-size ring per VM; the latest ones can be read
+from any thread (the GUI stats panel does) and written out as a Prometheus
+text file for the node_exporter textfile collector.
+"""
+import asyncio
+import collections
+import os
+import threading
+import time
+
+import qemu_qmp
+
+
+DEFAULT_INTERVAL = 2.0
+
+DEFAULT_HISTORY = 120
+
+
+def _linux_cpu_seconds(stat_path):
+    with open(stat_path, 'r') as f:
+        # The command name can contain spaces, fields start after its closing paren
+        fields = f.read().rsplit(')', 1)[1].split()
+    # utime and stime are fields 14 and 15 of the stat line
+    return (int(fields[11]) + int(fields[12])) / os.sysconf('SC_CLK_TCK')
+
+
+def _windows_cpu_seconds(kind, ident):
+    import ctypes
+    from ctypes import wintypes
+    kernel32 = ctypes.windll.kernel32
+    if kind == 'thread':
+        # THREAD_QUERY_LIMITED_INFORMATION
+        handle = kernel32.OpenThread(0x0800, False, ident)
+        get_times = kernel32.GetThreadTimes
+    else:
+        # PROCESS_QUERY_LIMITED_INFORMATION
+        handle = kernel32.OpenProcess(0x1000, False, ident)
+        get_times = kernel32.GetProcessTimes
+    if not handle:
+        raise OSError(f'cannot open {kind} {ident}')
+    times = [wintypes.FILETIME() for _ in range(4)]
+    ok = get_times(handle, *(ctypes.byref(t) for t in times))
+    kernel32.CloseHandle(handle)
+    if not ok:
+        raise OSError(f'cannot read times of {kind} {ident}')
+    # kernel + user time, in 100ns units
+    return sum((t.dwHighDateTime << 32 | t.dwLowDateTime) for t in times[2:]) / 1e7
+
+
+def _cpu_seconds(stat_path, kind, ident):
+    try:
+        if os.name == 'nt':
+            return _windows_cpu_seconds(kind, ident)
+        if os.path.exists('/proc'):
+            return _linux_cpu_seconds(stat_path)
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+def thread_cpu_seconds(pid, tid):
+    """CPU seconds used by one thread of pid, or None where we can't tell."""
+    return _cpu_seconds(f'/proc/{pid}/task/{tid}/stat', 'thread', tid)
+
+
+def process_cpu_seconds(pid):
+    """CPU seconds used by all threads of pid, or None where we can't tell."""
+    return _cpu_seconds(f'/proc/{pid}/stat', 'process', pid)
+
+
+class VMStats:
+    """Ring of samples for one guest."""
+
+    def __init__(self, name, pid, history=DEFAULT_HISTORY):
+        self.name = name
+        self.pid = pid
+        self.samples = collections.deque(maxlen=history)
+        self.lock = threading.Lock()
+        self.exited = False
+        self.error = None
+
+    def add(self, sample):
+        with self.lock:
+            self.samples.append(sample)
+
+    def latest(self):
+        with self.lock:
+            return self.samples[-1] if self.samples else None
+
+    def history(self):
+        with self.lock:
+            return list(self.samples)
+
+
+async def _optional(qmp, command, arguments=None):
+    # Not every guest has every device (no balloon, no block devices, old QEMU)
+    try:
+        return await qmp.execute(command, arguments)
+    except qemu_qmp.QMPError:
+        return None
+
+
+async def poll_once(qmp, pid, previous=None):
+    """Take one sample over qmp; rates are computed against previous."""
+    now = time.monotonic()
+    sample = {'time': time.time(), 'monotonic': now}
+
+    status = await qmp.execute('query-status')
+    sample['status'] = status.get('status')
+
+    vcpus = {}
+    for cpu in await _optional(qmp, 'query-cpus-fast') or []:
+        seconds = thread_cpu_seconds(pid, cpu.get('thread-id'))
+        if seconds is not None:
+            vcpus[cpu.get('cpu-index')] = seconds
+    sample['vcpu_seconds'] = vcpus
+
+    block = {}
+    for dev in await _optional(qmp, 'query-blockstats') or []:
+        name = dev.get('device') or dev.get('qdev') or dev.get('node-name')
+        stats = dev.get('stats', {})
+        block[name] = {k: stats.get(k, 0) for k in (
+            'rd_bytes', 'wr_bytes', 'rd_operations', 'wr_operations', 'flush_operations')}
+    sample['block'] = block
+
+    memory = await _optional(qmp, 'query-memory-size-summary') or {}
+    sample['memory'] = memory.get('base-memory')
+    balloon = await _optional(qmp, 'query-balloon') or {}
+    sample['balloon'] = balloon.get('actual')
+
+    sample['cpu_percent'] = None
+    sample['read_rate'] = sample['write_rate'] = None
+    if previous:
+        elapsed = now - previous['monotonic']
+        if elapsed > 0:
+            used = sum(vcpus.values()) - sum(previous['vcpu_seconds'].get(i, 0) for i in vcpus)
+            if vcpus:
+                sample['cpu_percent'] = max(0.0, 100.0 * used / elapsed)
+            for key, rate in (('rd_bytes', 'read_rate'), ('wr_bytes', 'write_rate')):
+                delta = sum(d[key] for d in block.values()) - sum(d[key] for d in previous['block'].values())
+                sample[rate] = max(0.0, delta / elapsed)
+    return sample
+
+
+def _label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def prometheus_text(stats):
+    """Render the latest sample of every VMStats in Prometheus text format."""
+    metrics = collections.OrderedDict((
+        ('qemu_vm_up', ('gauge', 'Guest process is running')),
+        ('qemu_vm_running', ('gauge', 'Guest run state is "running"')),
+        ('qemu_vm_vcpu_seconds_total', ('counter', 'CPU time used by a vCPU thread')),
+        ('qemu_vm_block_read_bytes_total', ('counter', 'Bytes read by a block device')),
+        ('qemu_vm_block_written_bytes_total', ('counter', 'Bytes written by a block device')),
+        ('qemu_vm_block_read_ops_total', ('counter', 'Read operations of a block device')),
+        ('qemu_vm_block_write_ops_total', ('counter', 'Write operations of a block device')),
+        ('qemu_vm_memory_bytes', ('gauge', 'Guest RAM size')),
+        ('qemu_vm_balloon_bytes', ('gauge', 'Guest RAM left after ballooning')),
+    ))
+    lines = {name: [] for name in metrics}
+
+    for vm in stats:
+        labels = f'vm="{_label(vm.name)}",pid="{vm.pid}"'
+        lines['qemu_vm_up'].append(f'qemu_vm_up{{{labels}}} {0 if vm.exited else 1}')
+        sample = vm.latest()
+        if not sample or vm.exited:
+            continue
+        lines['qemu_vm_running'].append(f'qemu_vm_running{{{labels}}} {int(sample["status"] == "running")}')
+        for cpu, seconds in sorted(sample['vcpu_seconds'].items()):
+            lines['qemu_vm_vcpu_seconds_total'].append(
+                f'qemu_vm_vcpu_seconds_total{{{labels},cpu="{cpu}"}} {seconds:.3f}')
+        for dev, counters in sorted(sample['block'].items()):
+            dev_labels = f'{labels},device="{_label(dev)}"'
+            for metric, key in (
+                ('qemu_vm_block_read_bytes_total', 'rd_bytes'),
+                ('qemu_vm_block_written_bytes_total', 'wr_bytes'),
+                ('qemu_vm_block_read_ops_total', 'rd_operations'),
+                ('qemu_vm_block_write_ops_total', 'wr_operations'),
+            ):
+                lines[metric].append(f'{metric}{{{dev_labels}}} {counters[key]}')
+        if sample['memory'] is not None:
+            lines['qemu_vm_memory_bytes'].append(f'qemu_vm_memory_bytes{{{labels}}} {sample["memory"]}')
+        if sample['balloon'] is not None:
+            lines['qemu_vm_balloon_bytes'].append(f'qemu_vm_balloon_bytes{{{labels}}} {sample["balloon"]}')
+
+    out = []
+    for name, (kind, help_text) in metrics.items():
+        out.append(f'# HELP {name} {help_text}')
+        out.append(f'# TYPE {name} {kind}')
+        out.extend(lines[name])
+    return '\n'.join(out) + '\n'
+
+
+class Telemetry:
+    """Polls every watched guest each `interval` seconds."""
+
+    def __init__(self, interval=DEFAULT_INTERVAL, history=DEFAULT_HISTORY, prom_path=None):
+        self.interval = interval
+        self.history = history
+        self.prom_path = prom_path
+        self.stats = collections.OrderedDict()
+        self.lock = threading.Lock()
+        self._export_task = None
+
+    def snapshot(self):
+        """VMStats of every watched guest; safe to call from any thread."""
+        with self.lock:
+            return list(self.stats.values())
+
+    async def watch(self, vm):
+        """Poll vm (a running qemu_fleet.VMProcess) until it exits or we get cancelled."""
+        stats = VMStats(vm.name, vm.pid, self.history)
+        with self.lock:
+            self.stats[vm.pid] = stats
+        if self.prom_path and self._export_task is None:
+            self._export_task = asyncio.ensure_future(self._export_loop())
+
+        previous = None
+        try:
+            qmp = await vm.qmp()
+            while vm.running:
+                try:
+                    previous = await poll_once(qmp, vm.pid, previous)
+                except qemu_qmp.QMPError as e:
+                    # Connection dropped, the guest is most likely on its way out
+                    stats.error = str(e)
+                    break
+                stats.add(previous)
+                await asyncio.sleep(self.interval)
+        except qemu_qmp.QMPError as e:
+            stats.error = str(e)
+        finally:
+            stats.exited = True
+            if self.prom_path:
+                # Let the scraper see it go down once before it disappears
+                try:
+                    self.export()
+                except OSError:
+                    pass
+            with self.lock:
+                self.stats.pop(vm.pid, None)
+
+    async def _export_loop(self):
+        while True:
+            try:
+                self.export()
+            except OSError:
+                pass
+            await asyncio.sleep(self.interval)
+
+    def export(self, path=None):
+        """Write the Prometheus text file (atomically, scrapers never see half a file)."""
+        path = path or self.prom_path
+        tmp = f'{path}.{os.getpid()}.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            f.write(prometheus_text(self.snapshot()))
+        os.replace(tmp, path)
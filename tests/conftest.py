@@ -0,0 +1,56 @@
+import os
+import stat
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+FAKE_QEMU = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fake_qemu.py')
+FAKE_QEMU_IMG = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fake_qemu_img.py')
+
+
+@pytest.fixture(autouse=True)
+def cache(tmp_path, monkeypatch):
+    """Keep probe results, snapshots and indexes out of the real cache dir."""
+    path = tmp_path / 'cache'
+    monkeypatch.setenv('XDG_CACHE_HOME', str(path))
+    monkeypatch.setenv('LOCALAPPDATA', str(path))
+    return path
+
+
+def _stub(path, script):
+    path.write_text(f'#!/bin/sh\nexec "{sys.executable}" "{script}" "$@"\n')
+    path.chmod(path.stat().st_mode | stat.S_IXUSR)
+
+
+@pytest.fixture
+def qemu_dir(tmp_path, monkeypatch):
+    """A QEMU directory whose qemu-system-x86_64 is fake_qemu.py and qemu-img fake_qemu_img.py."""
+    if os.name == 'nt':
+        pytest.skip('the stub QEMU is a shell script')
+    path = tmp_path / 'qemu'
+    path.mkdir()
+    _stub(path / 'qemu-system-x86_64', FAKE_QEMU)
+    _stub(path / 'qemu-img', FAKE_QEMU_IMG)
+    monkeypatch.setenv('FAKE_RUNTIME', '0.2')
+    monkeypatch.setenv('FAKE_QEMU_IMG_LOG', str(tmp_path / 'qemu-img.log'))
+    return str(path)
+
+
+@pytest.fixture
+def qemu_img_calls(tmp_path, qemu_dir):
+    """qemu-img subcommands run so far (create, info, ...), oldest first."""
+    log = tmp_path / 'qemu-img.log'
+
+    def calls():
+        return [line.split()[0] for line in log.read_text().splitlines()] if log.exists() else []
+    return calls
+
+
+@pytest.fixture
+def iso(tmp_path):
+    path = tmp_path / 'guest.iso'
+    path.write_bytes(b'\0' * 4096)
+    return str(path)
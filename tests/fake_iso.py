@@ -0,0 +1,115 @@
+"""Builds tiny ISO9660 images, enough of them for qemu_isolib.
+
+Layout (2048 byte sectors):
+    16      primary volume descriptor
+    17      El Torito boot record (when there are boot platforms)
+    18      terminator
+    19      boot catalog
+    20      root directory
+    21      EFI
+    22..    EFI/BOOT, as many sectors as its records need
+"""
+import struct
+
+SECTOR = 2048
+
+
+def record(name, lba, length, is_dir):
+    """One directory record; name b'\\x00' is ".", b'\\x01' is ".."."""
+    raw = name if isinstance(name, bytes) else name.encode('ascii')
+    # Padded to an even length
+    size = 33 + len(raw) + (1 - len(raw) % 2)
+    rec = bytearray(size)
+    rec[0] = size
+    struct.pack_into('<I', rec, 2, lba)
+    struct.pack_into('>I', rec, 6, lba)
+    struct.pack_into('<I', rec, 10, length)
+    struct.pack_into('>I', rec, 14, length)
+    rec[25] = 0x02 if is_dir else 0
+    rec[32] = len(raw)
+    rec[33:33 + len(raw)] = raw
+    return bytes(rec)
+
+
+def _directory(records):
+    """Records packed into sectors; a record never crosses a sector boundary."""
+    sectors = [bytearray()]
+    for rec in records:
+        if len(sectors[-1]) + len(rec) > SECTOR:
+            sectors.append(bytearray())
+        sectors[-1] += rec
+    return [bytes(s.ljust(SECTOR, b'\0')) for s in sectors]
+
+
+def _catalog(platforms):
+    """Validation entry, default entry for platforms[0], one section per other platform."""
+    catalog = bytearray(SECTOR)
+    catalog[0] = 0x01
+    catalog[1] = platforms[0]
+    catalog[30:32] = b'\x55\xaa'
+    catalog[32] = 0x88
+    offset = 64
+    rest = platforms[1:]
+    for i, platform in enumerate(rest):
+        catalog[offset] = 0x91 if i == len(rest) - 1 else 0x90
+        catalog[offset + 1] = platform
+        struct.pack_into('<H', catalog, offset + 2, 1)
+        catalog[offset + 32] = 0x88
+        offset += 64
+    return bytes(catalog)
+
+
+def build_iso(path, label='TEST', platforms=(), loaders=(), efi=True, filler=0):
+    """Write an image booting on platforms (El Torito ids) with loaders in EFI/BOOT.
+
+    filler adds that many dummy files before the loaders, to spread EFI/BOOT
+    over more than one sector.
+    """
+    boot_names = [f'FILE{i:04}.TXT;1' for i in range(filler)] + [f'{name};1' for name in loaders]
+    boot_sectors = _directory(
+        [record(b'\x00', 22, 0, True), record(b'\x01', 21, SECTOR, True)]
+        + [record(name, 40, 10, False) for name in boot_names])
+    boot_length = len(boot_sectors) * SECTOR
+    # "." of EFI/BOOT has to carry its own length, rebuild with it
+    boot_sectors = _directory(
+        [record(b'\x00', 22, boot_length, True), record(b'\x01', 21, SECTOR, True)]
+        + [record(name, 40, 10, False) for name in boot_names])
+
+    image = bytearray(SECTOR * (22 + len(boot_sectors) + 1))
+
+    def put(lba, data):
+        image[lba * SECTOR:lba * SECTOR + len(data)] = data
+
+    pvd = bytearray(SECTOR)
+    pvd[0] = 1
+    pvd[1:6] = b'CD001'
+    pvd[6] = 1
+    pvd[40:72] = label.ljust(32).encode('ascii')
+    pvd[156:156 + 34] = record(b'\x00', 20, SECTOR, True)
+    put(16, pvd)
+
+    if platforms:
+        boot = bytearray(SECTOR)
+        boot[1:6] = b'CD001'
+        boot[6] = 1
+        boot[7:30] = b'EL TORITO SPECIFICATION'
+        struct.pack_into('<I', boot, 0x47, 19)
+        put(17, boot)
+        put(19, _catalog(list(platforms)))
+    terminator = bytearray(SECTOR)
+    terminator[0] = 255
+    terminator[1:6] = b'CD001'
+    put(18, terminator)
+
+    root = [record(b'\x00', 20, SECTOR, True), record(b'\x01', 20, SECTOR, True)]
+    if efi:
+        root.append(record('EFI', 21, SECTOR, True))
+    put(20, _directory(root)[0])
+    put(21, _directory([record(b'\x00', 21, SECTOR, True), record(b'\x01', 20, SECTOR, True),
+                        record('BOOT', 22, boot_length, True)])[0])
+    for i, sector in enumerate(boot_sectors):
+        put(22 + i, sector)
+
+    with open(path, 'wb') as f:
+        f.write(image)
+    return str(path)
@@ -0,0 +1,144 @@
+"""Stand-in for qemu-system-*, enough of it for the launcher's own logic.
+
+Answers -accel/-machine/-cpu/-device help, accepts -machine none probes,
+serves QMP if asked to, prints a boot banner and "login: " on stdout and
+exits after FAKE_RUNTIME seconds (exit code 3 with -fail).
+
+Environment:
+    FAKE_RUNTIME   seconds to stay up after booting (default 1)
+    FAKE_BOOT      seconds from start to "login: " (default 0.2)
+"""
+import json
+import os
+import socket
+import sys
+import threading
+import time
+
+
+HELP = {
+    '-accel': 'Accelerators supported in QEMU binary:\ntcg\nkvm\n',
+    '-machine': 'Supported machines are:\npc                   Standard PC (alias of pc-i440fx-9.0)\n'
+                'pc-i440fx-9.0        Standard PC (default)\nq35                  Standard PC (Q35)\n',
+    '-cpu': 'Available CPUs:\nx86 host                  host\nx86 max                   max\n',
+    '-device': 'Storage devices:\nname "virtio-blk-pci", bus PCI\nname "ide-cd", bus IDE\n'
+               'name "virtio-scsi-pci", bus PCI\nname "scsi-cd", bus SCSI\nname "scsi-hd", bus SCSI\n\n'
+               'Network devices:\nname "e1000", bus PCI\nname "virtio-net-pci", bus PCI\n\n'
+               'Misc devices:\nname "virtio-balloon-pci", bus PCI\nname "virtio-rng-pci", bus PCI\n',
+}
+
+MB = 1024 * 1024
+
+
+def opt(args, name):
+    return args[args.index(name) + 1] if name in args[:-1] else None
+
+
+class Guest:
+    def __init__(self, args):
+        self.args = args
+        self.ram = int(opt(args, '-m') or 128) * MB
+        self.status = 'running'
+        self.balloon = self.ram
+        self.migration = 'none'
+        self.lock = threading.Lock()
+
+    def execute(self, command, arguments):
+        with self.lock:
+            if command == 'qmp_capabilities':
+                return {}
+            if command == 'query-status':
+                return {'status': self.status, 'running': self.status == 'running'}
+            if command == 'cont':
+                self.status = 'running'
+                return {}
+            if command == 'migrate':
+                with open(arguments['uri'][len('file:'):], 'wb') as f:
+                    f.write(b'STATE' * 100)
+                self.status = 'postmigrate'
+                self.migration = 'completed'
+                return {}
+            if command == 'query-migrate':
+                return {'status': self.migration}
+            if command == 'query-cpus-fast':
+                return [{'cpu-index': 0, 'thread-id': threading.get_native_id()}]
+            if command == 'query-blockstats':
+                return [{'device': 'ide0-hd0', 'stats': {
+                    'rd_bytes': 4096, 'wr_bytes': 1024, 'rd_operations': 2, 'wr_operations': 1, 'flush_operations': 0}}]
+            if command == 'query-balloon':
+                return {'actual': self.balloon}
+            if command == 'balloon':
+                self.balloon = arguments['value']
+                return {}
+            if command == 'query-memory-size-summary':
+                return {'base-memory': self.ram}
+            if command in ('qom-set', 'qom-get'):
+                return {}
+        raise KeyError(command)
+
+
+def serve(guest, conn):
+    f = conn.makefile('rwb')
+    f.write(b'{"QMP": {"version": {}, "capabilities": []}}\n')
+    f.flush()
+    for line in f:
+        request = json.loads(line)
+        try:
+            reply = {'return': guest.execute(request['execute'], request.get('arguments', {}))}
+        except KeyError:
+            reply = {'error': {'class': 'CommandNotFound', 'desc': f'The command {request["execute"]} has not been found'}}
+        reply['id'] = request.get('id')
+        f.write(json.dumps(reply).encode('utf-8') + b'\n')
+        f.flush()
+
+
+def listen(address):
+    # unix:<path>,server=on,wait=off or tcp:127.0.0.1:<port>,server=on,wait=off
+    kind, rest = address.split(':', 1)
+    target = rest.replace(',,', '\0').split(',')[0].replace('\0', ',')
+    if kind == 'unix':
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(target)
+    else:
+        host, port = target.rsplit(':', 1)
+        server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        server.bind((host, int(port)))
+    server.listen(4)
+    return server
+
+
+def main(args):
+    if len(args) == 2 and args[1] == 'help':
+        sys.stdout.write(HELP.get(args[0], ''))
+        return 0
+    if len(args) == 2 and args[1].endswith(',help'):
+        # Device properties, none worth reporting
+        return 0
+    if opt(args, '-machine') == 'none':
+        sys.stdin.read()
+        return 0
+
+    guest = Guest(args)
+    qmp = opt(args, '-qmp')
+    if qmp:
+        server = listen(qmp)
+
+        def accept():
+            while True:
+                conn, _ = server.accept()
+                threading.Thread(target=serve, args=(guest, conn), daemon=True).start()
+        threading.Thread(target=accept, daemon=True).start()
+
+    print('SeaBIOS (fake)', flush=True)
+    if opt(args, '-incoming'):
+        print('restored from ' + opt(args, '-incoming'), flush=True)
+    else:
+        time.sleep(float(os.environ.get('FAKE_BOOT', '0.2')))
+        print('booting...\nlogin: ', flush=True)
+    time.sleep(float(os.environ.get('FAKE_RUNTIME', '1')))
+    return 3 if '-fail' in args else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
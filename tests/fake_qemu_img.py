@@ -0,0 +1,49 @@
+"""Stand-in for qemu-img: info --output=json and create -f qcow2 -b BASE -F FMT.
+
+Overlays it creates are a qcow2 magic followed by JSON naming the backing
+file, and `info` says qcow2 for those and raw for anything else. Every call
+is appended to $FAKE_QEMU_IMG_LOG (one line of arguments) when it is set.
+"""
+import json
+import os
+import sys
+
+MAGIC = b'QFI\xfb'
+
+
+def opt(args, name):
+    return args[args.index(name) + 1] if name in args[:-1] else None
+
+
+def main(args):
+    log = os.environ.get('FAKE_QEMU_IMG_LOG')
+    if log:
+        with open(log, 'a', encoding='utf-8') as f:
+            f.write(' '.join(args) + '\n')
+
+    if args[0] == 'info':
+        path = args[-1]
+        try:
+            with open(path, 'rb') as f:
+                magic = f.read(len(MAGIC))
+        except OSError as e:
+            sys.stderr.write(f"qemu-img: Could not open '{path}': {e.strerror}\n")
+            return 1
+        print(json.dumps({'filename': path, 'format': 'qcow2' if magic == MAGIC else 'raw'}))
+        return 0
+
+    if args[0] == 'create':
+        base, path = opt(args, '-b'), args[-1]
+        if not os.path.exists(base):
+            sys.stderr.write(f"qemu-img: {path}: Could not open backing file '{base}'\n")
+            return 1
+        with open(path, 'wb') as f:
+            f.write(MAGIC + json.dumps({'backing': base, 'backing_format': opt(args, '-F')}).encode('utf-8'))
+        return 0
+
+    sys.stderr.write(f'qemu-img: unknown command {args[0]}\n')
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,60 @@
+"""Local asyncio QMP server with canned replies, for client-side tests."""
+import asyncio
+import json
+
+
+class FakeQMP:
+    """Serve QMP on a unix socket; `replies` maps command -> return value or callable(arguments).
+
+    A reply that is an Exception instance is sent as a QMP error. Commands
+    without a reply get CommandNotFound, like an old QEMU would answer.
+    """
+
+    def __init__(self, path, replies=None, events=()):
+        self.path = path
+        self.replies = dict(replies or {})
+        # Sent before the reply to the next command, the client has to skip them
+        self.events = list(events)
+        self.received = []
+        self.server = None
+
+    async def __aenter__(self):
+        self.server = await asyncio.start_unix_server(self._serve, self.path)
+        return self
+
+    async def __aexit__(self, *exc):
+        self.server.close()
+        await self.server.wait_closed()
+        return False
+
+    async def _send(self, writer, message):
+        writer.write(json.dumps(message).encode('utf-8') + b'\n')
+        await writer.drain()
+
+    async def _serve(self, reader, writer):
+        await self._send(writer, {'QMP': {'version': {}, 'capabilities': []}})
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            request = json.loads(line)
+            command = request['execute']
+            self.received.append((command, request.get('arguments')))
+            for event in self.events:
+                await self._send(writer, {'event': event, 'data': {}})
+            self.events = []
+            if command == 'qmp_capabilities':
+                reply = {'return': {}}
+            elif command not in self.replies:
+                reply = {'error': {'class': 'CommandNotFound', 'desc': f'The command {command} has not been found'}}
+            else:
+                value = self.replies[command]
+                if callable(value):
+                    value = value(request.get('arguments'))
+                if isinstance(value, Exception):
+                    reply = {'error': {'class': 'GenericError', 'desc': str(value)}}
+                else:
+                    reply = {'return': value}
+            reply['id'] = request.get('id')
+            await self._send(writer, reply)
+        writer.close()
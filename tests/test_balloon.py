@@ -0,0 +1,127 @@
+import asyncio
+
+import qemu_balloon
+from qemu_balloon import MIN_CHANGE_MB, BalloonController, GuestMemory, plan
+
+
+class SimGuest:
+    """Guest whose workload always uses `used` MB, whatever its balloon is set to."""
+
+    def __init__(self, name, actual, used, min_mb=256, max_mb=None, fail=None):
+        self.name = name
+        self.actual = actual
+        self.used = used
+        self.min_mb = min_mb
+        self.max_mb = max_mb or actual
+        self.fail = fail
+        self.targets = []
+
+    async def read(self):
+        if self.fail:
+            error, self.fail = self.fail, None
+            raise error
+        available = max(0, self.actual - self.used)
+        return GuestMemory(self.name, self.actual, self.min_mb, self.max_mb, available)
+
+    async def set_target(self, mb):
+        self.targets.append(mb)
+        self.actual = mb
+
+
+def test_idle_guest_shrinks_one_step():
+    g = GuestMemory('idle', 4096, 512, 4096, available=3000)
+    # Uses 1096, but never more than MAX_STEP in one round
+    assert plan([g]) == {'idle': 3072}
+
+
+def test_idle_guest_keeps_headroom_and_min():
+    near = GuestMemory('near', 1000, 256, 1000, available=500)
+    assert plan([near]) == {'near': 750}
+    floor = GuestMemory('floor', 4096, 3500, 4096, available=3000)
+    assert plan([floor]) == {'floor': 3500}
+
+
+def test_small_changes_are_skipped():
+    # Shrinking 100 -> 75 MB isn't worth a round trip
+    g = GuestMemory('small', 100, 16, 100, available=40)
+    assert 100 - 75 < MIN_CHANGE_MB
+    assert plan([g]) == {}
+
+
+def test_pressured_guest_grows_from_reclaimed_memory():
+    idle = GuestMemory('idle', 4096, 512, 4096, available=3000)
+    busy = GuestMemory('busy', 1024, 256, 4096, available=50)
+    targets = plan([idle, busy], host_available_mb=0)
+    assert targets == {'idle': 3072, 'busy': 1280}
+
+
+def test_growth_stays_within_host_budget():
+    busy = GuestMemory('busy', 1024, 256, 4096, available=50)
+    assert plan([busy], host_available_mb=qemu_balloon.HOST_RESERVE_MB) == {}
+    assert plan([busy], host_available_mb=qemu_balloon.HOST_RESERVE_MB + 100) == {'busy': 1124}
+
+
+def test_growth_stops_at_max():
+    capped = GuestMemory('capped', 2000, 256, 2048, available=10)
+    assert plan([capped], host_available_mb=8192) == {'capped': 2048}
+    full = GuestMemory('full', 2030, 256, 2048, available=10)
+    assert plan([full], host_available_mb=8192) == {}
+
+
+def test_most_starved_guest_is_served_first():
+    tight = GuestMemory('tight', 1024, 256, 4096, available=10)
+    loose = GuestMemory('loose', 1024, 256, 4096, available=90)
+    budget = qemu_balloon.HOST_RESERVE_MB + 256
+    assert plan([loose, tight], host_available_mb=budget) == {'tight': 1280}
+
+
+def test_swapping_guest_is_pressured():
+    g = GuestMemory('swap', 1024, 256, 2048, available=500, swapped_in=3)
+    assert g.pressured and not g.idle
+    assert plan([g], host_available_mb=8192) == {'swap': 1280}
+
+
+def test_guest_without_stats_is_left_alone():
+    g = GuestMemory('quiet', 4096, 256, 8192)
+    assert plan([g], host_available_mb=8192) == {}
+
+
+def test_controller_moves_memory_between_guests():
+    idle = SimGuest('idle', 4096, used=800)
+    busy = SimGuest('busy', 1024, used=1000, max_mb=2048)
+    controller = BalloonController(interval=0, host_available=lambda: 0)
+    controller.guests = {g.name: g for g in (idle, busy)}
+
+    assert asyncio.run(controller.step()) == {'idle': 3072, 'busy': 1280}
+    # Settles: idle shrinks down to its headroom, busy stops growing once comfortable
+    for _ in range(5):
+        asyncio.run(controller.step())
+    assert idle.actual == 1000
+    assert busy.actual == 1280
+    assert idle.actual >= idle.min_mb and busy.actual <= busy.max_mb
+    # The last round had nothing left to move
+    assert len(controller.history) == 5
+
+
+def test_controller_survives_unexpected_errors():
+    flaky = SimGuest('flaky', 4096, used=800, fail=RuntimeError('driver went away'))
+    controller = BalloonController(interval=0.01, host_available=lambda: 0)
+
+    async def main():
+        controller.add(flaky)
+        while not flaky.targets:
+            await asyncio.sleep(0.01)
+        controller.remove(flaky)
+        await asyncio.sleep(0.05)
+        assert controller._task is None
+
+        # And a new guest starts it again
+        again = SimGuest('again', 4096, used=800)
+        controller.add(again)
+        while not again.targets:
+            await asyncio.sleep(0.01)
+        controller.remove(again)
+        await asyncio.sleep(0.05)
+
+    asyncio.run(asyncio.wait_for(main(), 5))
+    assert flaky.targets[0] == 3072
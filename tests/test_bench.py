@@ -0,0 +1,117 @@
+import asyncio
+import csv
+import json
+
+import pytest
+
+import qemu_bench
+from qemu_bench import BenchError, compare, configs, config_id, load_matrix, run_matrix, summarize
+
+
+def _matrix(tmp_path, **data):
+    path = tmp_path / 'matrix.json'
+    path.write_text(json.dumps(dict({'images': ['guest.iso'], 'ready_marker': 'login:'}, **data)))
+    return load_matrix(str(path))
+
+
+def _run(config, rep, **metrics):
+    run = dict({name: None for name in qemu_bench.METRICS}, config=config, rep=rep, error=None)
+    run.update(metrics)
+    return run
+
+
+def test_configs_cover_every_combination(tmp_path):
+    matrix = _matrix(tmp_path, images=['a.iso', {'disk': 'b.qcow2', 'system': 'aarch64'}],
+                     smp=[1, 4], start=['cold', 'warm'])
+    found = configs(matrix)
+    assert len(found) == 8
+    assert found[0] == {'image': {'iso': 'a.iso'}, 'system': None, 'accel': None, 'smp': 1, 'ram': 1024,
+                        'io_profile': None, 'cache': None, 'start': 'cold'}
+    assert config_id(found[-1]) == (
+        'image=b.qcow2 system=None accel=None smp=4 ram=1024 io_profile=None cache=None start=warm')
+    assert len({config_id(c) for c in found}) == 8
+
+
+def test_load_matrix_rejects_mistakes(tmp_path):
+    with pytest.raises(BenchError, match='Unknown matrix keys: smpp'):
+        _matrix(tmp_path, smpp=[1])
+    with pytest.raises(BenchError, match='Unknown start: hot'):
+        _matrix(tmp_path, start=['cold', 'hot'])
+    with pytest.raises(BenchError, match='"iso" or a "disk"'):
+        _matrix(tmp_path, images=[{'system': 'x86_64'}])
+
+
+def test_summarize_takes_medians_of_good_runs():
+    runs = [
+        _run('a', 0, ready=1.0, peak_rss_mb=100),
+        _run('a', 1, ready=3.0, peak_rss_mb=None),
+        _run('a', 2, ready=2.0, peak_rss_mb=120),
+        _run('a', 3, ready=50.0, error='not ready after 120s'),
+        _run('b', 0, error='QEMU exited with code 1'),
+    ]
+    summary = summarize(runs)
+    assert summary['a']['runs'] == 4 and summary['a']['failures'] == 1
+    assert summary['a']['ready'] == 2.0
+    assert summary['a']['peak_rss_mb'] == 110
+    assert summary['b'] == dict({name: None for name in qemu_bench.METRICS}, runs=1, failures=1)
+
+
+def test_compare_applies_threshold_and_noise():
+    baseline = {'a': {'ready': 10.0, 'process_start': 0.1, 'peak_rss_mb': 100, 'cpu_seconds': 2.0}, 'gone': {}}
+    summary = {
+        'a': {'ready': 12.0, 'process_start': 0.13, 'peak_rss_mb': 80, 'cpu_seconds': 2.1},
+        'new': {'ready': 1.0},
+    }
+    regressions, improvements = compare(summary, baseline, threshold=0.10)
+    # process_start +30% but only 30ms, under the noise floor; cpu_seconds +5% is within the threshold
+    assert regressions == [{'config': 'a', 'metric': 'ready', 'baseline': 10.0, 'current': 12.0, 'change': 0.2}]
+    assert improvements == [{'config': 'a', 'metric': 'peak_rss_mb', 'baseline': 100, 'current': 80, 'change': -0.2}]
+
+
+def test_run_matrix_end_to_end(tmp_path, qemu_dir, iso):
+    matrix = _matrix(tmp_path, images=[iso], system='x86_64', smp=2, start=['cold', 'warm'],
+                     io_profile=[None, 'throughput'], cache=[None, 'writethrough'], repeat=2, timeout=10)
+    runs = asyncio.run(run_matrix(matrix, qemu_dir))
+
+    assert len(runs) == 16
+    assert [r for r in runs if r['error']] == []
+    for run in runs:
+        assert 0 < run['process_start'] <= run['ready']
+        if run['start'] == 'warm':
+            assert run['warm'] == 'restored'
+        else:
+            assert run['warm'] is None and run['first_output'] is not None
+        # A cache mode without a profile runs on the compat devices, and says so
+        expected = run['io_profile'] or ('compat' if run['cache'] else None)
+        assert run['effective_io'] == expected
+        if run['io_profile'] == 'throughput':
+            # Chosen at launch, with the -smp the run ended up with
+            assert 'num_queues=2' in ' '.join(run['command'])
+
+    summary = summarize(runs)
+    assert len(summary) == 8 and not any(entry['failures'] for entry in summary.values())
+
+    path = tmp_path / 'runs.csv'
+    qemu_bench.write_csv(runs, str(path))
+    rows = list(csv.DictReader(path.open()))
+    assert len(rows) == 16 and rows[0]['image'] == 'guest.iso'
+
+
+def test_warm_config_fails_without_saved_state(tmp_path, qemu_dir, iso):
+    # The marker never shows up, so the prime run can't save a state
+    matrix = _matrix(tmp_path, images=[iso], system='x86_64', ready_marker='never printed',
+                     start='warm', repeat=2, timeout=5)
+    runs = asyncio.run(run_matrix(matrix, qemu_dir))
+    assert len(runs) == 2
+    assert all(r['error'].startswith('no warm state to start from: QEMU exited') for r in runs)
+    assert all(r['command'] is None for r in runs)
+    assert summarize(runs)[runs[0]['config']]['failures'] == 2
+
+
+def test_warm_run_that_boots_cold_is_an_error(qemu_dir, iso, monkeypatch):
+    matrix = {'images': [{'iso': iso}], 'system': 'x86_64', 'ready_marker': 'login:', 'start': 'warm',
+              'repeat': 1, 'timeout': 10}
+    # The prime run saves a state the measured run then can't find
+    monkeypatch.setattr(qemu_bench.qemu_fleet.qemu_snapshot.SnapshotCache, 'lookup', lambda self, key: None)
+    runs = asyncio.run(run_matrix(matrix, qemu_dir))
+    assert runs[0]['error'] == 'expected a restored warm start, got a cold boot'
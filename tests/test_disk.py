@@ -0,0 +1,136 @@
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+import qemu_disk
+from qemu_disk import UNCLAIMED_GRACE, DiskError, OverlayPool
+from qemu_fleet import Fleet
+from qemu_launch import VMSpec
+
+
+@pytest.fixture
+def base(tmp_path):
+    path = tmp_path / 'golden.raw'
+    path.write_bytes(b'\0' * 65536)
+    return str(path)
+
+
+@pytest.fixture
+def pool(qemu_dir, tmp_path):
+    return OverlayPool(qemu_dir, root=str(tmp_path / 'overlays'), spares=2)
+
+
+def _spares(pool, base):
+    spare_dir = pool._spare_dir(os.path.abspath(base))
+    return sorted(n for n in os.listdir(spare_dir) if n.endswith('.qcow2'))
+
+
+def _backing(path):
+    with open(path, 'rb') as f:
+        return json.loads(f.read()[4:])
+
+
+def test_acquire_takes_a_spare(pool, base, qemu_img_calls):
+    pool.fill(base)
+    assert len(_spares(pool, base)) == 2
+    assert qemu_img_calls() == ['info', 'create', 'create']
+
+    spares = _spares(pool, base)
+    path = pool.acquire(base, 'web 1')
+    # Renamed, not created
+    assert qemu_img_calls() == ['info', 'create', 'create']
+    left = _spares(pool, base)
+    assert len(left) == 1 and set(left) < set(spares)
+    assert os.path.dirname(path) == pool.live_dir and os.path.basename(path).startswith('web_1-')
+    assert _backing(path) == {'backing': base, 'backing_format': 'raw'}
+    assert pool.owner(path)['name'] == 'web 1' and pool.owner(path)['pid'] is None
+
+
+def test_acquire_creates_when_pool_is_dry(pool, base, qemu_img_calls):
+    path = pool.acquire(base)
+    assert qemu_img_calls() == ['info', 'create']
+    assert _backing(path)['backing'] == base
+
+
+def test_fill_tops_spares_back_up(pool, base, qemu_img_calls):
+    pool.fill(base)
+    pool.acquire(base)
+    pool.acquire(base)
+    assert _spares(pool, base) == []
+    pool.fill(base)
+    assert len(_spares(pool, base)) == 2
+    # The format of an unchanged base is only asked once
+    assert qemu_img_calls().count('info') == 1
+    assert qemu_img_calls().count('create') == 4
+    # Already full, nothing to do
+    pool.fill(base)
+    assert qemu_img_calls().count('create') == 4
+
+
+def test_spares_dropped_when_base_changes(pool, base, qemu_img_calls):
+    pool.fill(base)
+    old = _spares(pool, base)
+
+    st = os.stat(base)
+    os.utime(base, ns=(st.st_atime_ns, st.st_mtime_ns + 10 ** 9))
+    path = pool.acquire(base)
+    # No stale spare handed out, a new overlay made instead
+    assert _spares(pool, base) == []
+    assert qemu_img_calls()[-2:] == ['info', 'create']
+    assert os.path.basename(path) not in old
+
+    pool.fill(base)
+    again = _spares(pool, base)
+    with open(base, 'ab') as f:
+        f.write(b'\0' * 512)
+    pool.fill(base)
+    assert len(_spares(pool, base)) == 2
+    assert not set(again) & set(_spares(pool, base))
+
+
+def test_create_failure_is_a_disk_error(pool, base):
+    with pytest.raises(DiskError, match='does not exist'):
+        pool.acquire(base + '.missing')
+    # qemu-img reports the missing backing file itself
+    with pytest.raises(DiskError, match='Could not open backing file'):
+        qemu_disk.create_overlay(pool.qemu_img, base + '.gone', os.path.join(pool.live_dir, 'x.qcow2'), 'raw')
+
+
+def test_gc_removes_overlays_of_dead_guests(pool, base):
+    finished = subprocess.Popen([sys.executable, '-c', 'pass'])
+    finished.wait()
+
+    dead = pool.acquire(base, 'dead')
+    pool.claim(dead, finished.pid)
+    alive = pool.acquire(base, 'alive')
+    pool.claim(alive, os.getpid())
+    fresh = pool.acquire(base, 'fresh')
+    stale = pool.acquire(base, 'stale')
+    owner = pool.owner(stale)
+    owner['created'] = time.time() - UNCLAIMED_GRACE - 1
+    pool._write_owner(stale, owner)
+    # Owner file lost, the overlay's own mtime tells its age
+    orphan = pool.acquire(base, 'orphan')
+    os.remove(f'{orphan}.json')
+    old = time.time() - UNCLAIMED_GRACE - 1
+    os.utime(orphan, (old, old))
+
+    assert sorted(pool.gc()) == sorted([dead, stale, orphan])
+    assert pool.live() == sorted([alive, fresh])
+    assert not os.path.exists(f'{dead}.json')
+
+
+def test_fleet_boots_disk_guest_from_overlay(qemu_dir, base, cache):
+    fleet = Fleet(qemu_dir, autotune=False)
+    spec = VMSpec(system='x86_64', ram=256, disk=base, name='d', switches=['-display', 'none'])
+    vm = asyncio.run(fleet.run(spec))
+    assert vm.returncode == 0 and vm.error is None
+    drive = next(arg for arg in vm.command if arg.startswith('file='))
+    assert drive.startswith(f'file={cache}') and drive.endswith('.qcow2,format=qcow2')
+    # Released once the guest exited
+    assert not os.path.exists(spec.overlay)
@@ -0,0 +1,114 @@
+import asyncio
+import json
+import os
+import signal
+
+import pytest
+
+from qemu_fleet import Fleet, RingBuffer, load_specs
+from qemu_launch import VMSpec
+
+
+def test_ring_buffer_keeps_last_bytes():
+    buf = RingBuffer(10)
+    buf.write(b'hello ')
+    buf.write(b'world, again')
+    assert buf.getvalue() == b'rld, again'
+    assert len(buf.getvalue()) == 10
+
+
+def test_ring_buffer_text_and_tail():
+    buf = RingBuffer(1024)
+    buf.write('line one\nline two\n'.encode('utf-8'))
+    buf.write(b'line three\n')
+    assert buf.text() == 'line one\nline two\nline three\n'
+    assert 'line three' in buf.tail()
+
+
+def test_load_specs_expands_count(tmp_path):
+    path = tmp_path / 'specs.json'
+    path.write_text(json.dumps([
+        {'name': 'deb', 'system': 'x86_64', 'ram': 512, 'iso': 'debian.iso', 'count': 3},
+        {'system': 'i386', 'ram': 256, 'iso': 'dos.iso'},
+    ]))
+    specs = load_specs(str(path))
+    assert [s.name for s in specs] == ['deb-0', 'deb-1', 'deb-2', 'dos']
+    assert all(s.ram == 512 for s in specs[:3])
+    # Copies must not share the switches list
+    specs[0].switches.append('-S')
+    assert specs[1].switches == []
+
+
+def test_load_specs_rejects_unknown_keys(tmp_path):
+    path = tmp_path / 'specs.json'
+    path.write_text(json.dumps([{'system': 'x86_64', 'ram': 512, 'iso': 'a.iso', 'colour': 'blue'}]))
+    with pytest.raises(ValueError, match='colour'):
+        load_specs(str(path))
+
+
+def test_load_specs_needs_a_list(tmp_path):
+    path = tmp_path / 'specs.json'
+    path.write_text(json.dumps({'system': 'x86_64'}))
+    with pytest.raises(ValueError):
+        load_specs(str(path))
+
+
+def _spec(iso, name, switches=(), **kwargs):
+    return VMSpec(system='x86_64', ram=256, iso=iso, name=name, switches=['-display', 'none', *switches], **kwargs)
+
+
+def test_run_all_against_stub(qemu_dir, iso):
+    fleet = Fleet(qemu_dir, parallel=2, autotune=False)
+    specs = [_spec(iso, f'vm-{i}', ready_marker='login:') for i in range(3)] + [
+        _spec(iso, 'broken', switches=['-fail']),
+        VMSpec(system='x86_64', ram=64, iso=iso, name='tiny'),
+    ]
+    results = asyncio.run(fleet.run_all(specs))
+
+    by_name = {vm.name: vm for vm in results}
+    for i in range(3):
+        vm = by_name[f'vm-{i}']
+        assert vm.returncode == 0 and not vm.failed
+        assert vm.ready_at is not None
+        assert b'login:' in vm.stdout.getvalue()
+        assert '-serial' in vm.command
+    assert by_name['broken'].returncode == 3
+    assert by_name['tiny'].error.startswith('Please enter a valid memory size')
+    # Finished guests are handed back, not kept around
+    assert fleet.vms == [] and fleet.active == 0
+
+
+def test_parallel_limit(qemu_dir, iso):
+    fleet = Fleet(qemu_dir, parallel=2, autotune=False)
+    peak = 0
+
+    async def main():
+        nonlocal peak
+        task = asyncio.ensure_future(fleet.run_all([_spec(iso, f'vm-{i}') for i in range(4)]))
+        while not task.done():
+            peak = max(peak, len(fleet.running))
+            await asyncio.sleep(0.02)
+        return task.result()
+
+    results = asyncio.run(main())
+    assert peak == 2
+    assert all(vm.returncode == 0 for vm in results)
+
+
+@pytest.mark.skipif(os.name == 'nt', reason='needs POSIX signals')
+def test_terminate_cancels_waiting_launches(qemu_dir, iso, monkeypatch):
+    monkeypatch.setenv('FAKE_RUNTIME', '10')
+    fleet = Fleet(qemu_dir, parallel=2, autotune=False)
+
+    async def main():
+        task = asyncio.ensure_future(fleet.run_all([_spec(iso, f'vm-{i}') for i in range(5)]))
+        while len(fleet.running) < 2:
+            await asyncio.sleep(0.02)
+        fleet.terminate()
+        return await task
+
+    results = asyncio.run(main())
+    assert [vm.returncode for vm in results[:2]] == [-signal.SIGTERM] * 2
+    for vm in results[2:]:
+        assert vm.process is None
+        assert 'stopping' in vm.error
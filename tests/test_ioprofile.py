@@ -0,0 +1,62 @@
+import pytest
+
+import qemu_ioprofile
+from qemu_launch import VMSpec, build_command
+
+
+@pytest.fixture
+def direct(monkeypatch):
+    """Paths whose filesystem takes O_DIRECT."""
+    paths = set()
+    monkeypatch.setattr(qemu_ioprofile, 'supports_direct_io', lambda path: path in paths)
+    return paths
+
+
+def _host(spec):
+    return qemu_ioprofile.host_io(spec, {'aio_modes': ['threads', 'native']})
+
+
+def test_direct_needs_overlay_and_backing_disk(direct):
+    spec = VMSpec(system='x86_64', ram=1024, disk='/tmpfs/base.qcow2', overlay='/ssd/overlay.qcow2',
+                  io_profile='low-latency')
+    direct.add('/ssd/overlay.qcow2')
+    host = _host(spec)
+    assert host['direct'] is False
+    io = qemu_ioprofile.choose(spec, host)
+    assert (io['cache'], io['aio']) == ('writeback', 'threads')
+
+    direct.add('/tmpfs/base.qcow2')
+    io = qemu_ioprofile.choose(spec, _host(spec))
+    assert (io['cache'], io['aio']) == ('none', 'native')
+
+
+def test_direct_without_overlay(direct):
+    spec = VMSpec(system='x86_64', ram=1024, disk='/ssd/base.qcow2')
+    assert _host(spec)['direct'] is False
+    direct.add('/ssd/base.qcow2')
+    assert _host(spec)['direct'] is True
+    assert _host(VMSpec(system='x86_64', ram=1024))['direct'] is False
+
+
+def test_cache_mode_overrides_profile():
+    host = {'aio': ['native'], 'direct': True, 'vhost': False}
+    spec = VMSpec(system='x86_64', ram=1024, disk='/ssd/base.qcow2', io_profile='low-latency', cache='writeback')
+    io = qemu_ioprofile.choose(spec, host)
+    # native AIO needs O_DIRECT, which writeback doesn't open with
+    assert (io['profile'], io['cache'], io['aio']) == ('low-latency', 'writeback', 'threads')
+    spec.cache = 'directsync'
+    assert qemu_ioprofile.choose(spec, host)['aio'] == 'native'
+
+
+def test_cache_mode_without_profile_keeps_compat_devices():
+    spec = VMSpec(system='x86_64', ram=1024, disk='/ssd/base.qcow2', cache='writethrough')
+    io = qemu_ioprofile.choose(spec)
+    assert (io['profile'], io['disk_bus'], io['cache']) == ('compat', None, 'writethrough')
+    command = build_command(spec, '/opt/qemu')
+    assert 'file=/ssd/base.qcow2,cache=writethrough,aio=threads' in command
+    assert qemu_ioprofile.choose(VMSpec(system='x86_64', ram=1024, disk='/ssd/base.qcow2', cache='none'))['cache'] == 'none'
+
+
+def test_unknown_cache_mode():
+    with pytest.raises(ValueError, match='Unknown cache mode: fast'):
+        VMSpec(system='x86_64', ram=1024, disk='/ssd/base.qcow2', cache='fast').validate()
@@ -0,0 +1,165 @@
+import os
+
+import pytest
+
+import qemu_isolib
+from qemu_isolib import IsoError, IsoLibrary, keyword_arch, read_iso
+
+from fake_iso import SECTOR, build_iso
+
+
+def test_bios_and_efi_image(tmp_path):
+    path = build_iso(tmp_path / 'ubuntu.iso', 'Ubuntu 24.04 LTS amd64', platforms=[0x00, 0xEF],
+                     loaders=['BOOTX64.EFI', 'GRUBX64.EFI'])
+    assert read_iso(path) == {
+        'label': 'Ubuntu 24.04 LTS amd64', 'system': 'x86_64', 'bios': True, 'uefi': True,
+        'efi_loaders': ['BOOTX64.EFI'], 'platforms': ['bios', 'uefi'],
+    }
+
+
+def test_efi_only_arm_image(tmp_path):
+    path = build_iso(tmp_path / 'install.iso', 'CDROM', platforms=[0xEF], loaders=['BOOTAA64.EFI'])
+    info = read_iso(path)
+    assert (info['system'], info['bios'], info['uefi']) == ('aarch64', False, True)
+    assert info['platforms'] == ['uefi']
+
+
+def test_loader_beats_keywords_and_first_loader_wins(tmp_path):
+    # Named i386 but ships a 64 bit ARM loader
+    path = build_iso(tmp_path / 'weird-i386.iso', platforms=[0xEF], loaders=['BOOTAA64.EFI'])
+    assert read_iso(path)['system'] == 'aarch64'
+    multi = build_iso(tmp_path / 'multi.iso', platforms=[0xEF], loaders=['BOOTAA64.EFI', 'BOOTX64.EFI'])
+    assert read_iso(multi)['system'] == 'x86_64'
+    assert read_iso(multi)['efi_loaders'] == ['BOOTAA64.EFI', 'BOOTX64.EFI']
+
+
+def test_loader_found_past_first_directory_sector(tmp_path):
+    path = build_iso(tmp_path / 'big.iso', platforms=[0xEF], loaders=['BOOTX64.EFI'], filler=80)
+    assert os.path.getsize(path) > 24 * SECTOR
+    assert read_iso(path)['efi_loaders'] == ['BOOTX64.EFI']
+
+
+def test_bios_only_uses_keywords_for_32_bit(tmp_path):
+    plain = build_iso(tmp_path / 'alpine-std.iso', 'alpine-std', platforms=[0x00], efi=False)
+    assert read_iso(plain)['system'] == 'x86_64'
+    old = build_iso(tmp_path / 'slackware-i686.iso', platforms=[0x00], efi=False)
+    assert read_iso(old)['system'] == 'i386'
+    assert read_iso(old)['uefi'] is False
+
+
+def test_keyword_fallback_without_boot_info(tmp_path):
+    path = build_iso(tmp_path / 'data.iso', 'Debian 12 riscv64', efi=False)
+    info = read_iso(path)
+    assert info['system'] == 'riscv64'
+    assert info['platforms'] == [] and info['bios'] is False
+    ppc = build_iso(tmp_path / 'yaboot.iso', platforms=[0x01], efi=False)
+    assert read_iso(ppc)['system'] == 'ppc'
+    assert read_iso(build_iso(tmp_path / 'mystery.iso', efi=False))['system'] is None
+
+
+def test_keyword_arch():
+    assert keyword_arch('debian-12.5.0-amd64-netinst.iso') == 'x86_64'
+    assert keyword_arch('Fedora-Server-dvd-x86_64-40.iso') == 'x86_64'
+    assert keyword_arch('ubuntu-24.04-live-server-arm64.iso') == 'aarch64'
+    assert keyword_arch('openbsd-install-sparc64.iso') == 'sparc'
+    # Whole words only
+    assert keyword_arch('champs64.iso') is None
+    assert keyword_arch(None, '') is None
+
+
+def test_corrupt_images_raise_iso_error(tmp_path):
+    good = build_iso(tmp_path / 'good.iso', platforms=[0x00], loaders=['BOOTX64.EFI'])
+    with open(good, 'rb') as f:
+        data = f.read()
+
+    truncated = tmp_path / 'truncated.iso'
+    # Descriptors intact, the boot catalog is cut off
+    truncated.write_bytes(data[:19 * SECTOR])
+    with pytest.raises(IsoError, match='outside the image'):
+        read_iso(str(truncated))
+
+    bad_catalog = bytearray(data)
+    bad_catalog[19 * SECTOR + 30] = 0
+    (tmp_path / 'catalog.iso').write_bytes(bytes(bad_catalog))
+    with pytest.raises(IsoError, match='corrupt El Torito'):
+        read_iso(str(tmp_path / 'catalog.iso'))
+
+    (tmp_path / 'junk.iso').write_bytes(b'x' * 40000)
+    with pytest.raises(IsoError, match='no ISO9660 primary volume descriptor'):
+        read_iso(str(tmp_path / 'junk.iso'))
+
+    (tmp_path / 'empty.iso').write_bytes(b'')
+    with pytest.raises(IsoError, match='empty file'):
+        read_iso(str(tmp_path / 'empty.iso'))
+
+
+def test_scan_records_errors_instead_of_raising(tmp_path):
+    root = tmp_path / 'isos'
+    (root / 'sub').mkdir(parents=True)
+    build_iso(root / 'ubuntu.iso', platforms=[0x00, 0xEF], loaders=['BOOTX64.EFI'])
+    (root / 'sub' / 'broken-arm64.iso').write_bytes(b'x' * 5000)
+    (root / 'notes.txt').write_text('not an image')
+
+    library = IsoLibrary(str(tmp_path / 'isolib.json'))
+    library.add_root(str(root))
+    assert library.scan() == {'added': 2, 'updated': 0, 'removed': 0, 'unchanged': 0}
+
+    broken = library.lookup(str(root / 'sub' / 'broken-arm64.iso'))
+    assert broken['error'] == 'no ISO9660 primary volume descriptor'
+    # The file name still tells the architecture
+    assert broken['system'] == 'aarch64' and broken['bios'] is False
+    assert library.lookup(str(root / 'ubuntu.iso'))['error'] is None
+    assert [os.path.basename(p) for p, _ in library.find(system='x86_64')] == ['ubuntu.iso']
+
+
+def test_rescan_is_incremental(tmp_path, monkeypatch):
+    root = tmp_path / 'isos'
+    root.mkdir()
+    a = build_iso(root / 'a-amd64.iso', platforms=[0x00])
+    b = build_iso(root / 'b.iso', platforms=[0xEF], loaders=['BOOTAA64.EFI'])
+    build_iso(root / 'c.iso', platforms=[0x00])
+
+    library = IsoLibrary(str(tmp_path / 'isolib.json'))
+    library.add_root(str(root))
+    library.scan()
+
+    reads = []
+    real_read_iso = qemu_isolib.read_iso
+
+    def read_iso(path):
+        reads.append(os.path.basename(path))
+        return real_read_iso(path)
+    monkeypatch.setattr(qemu_isolib, 'read_iso', read_iso)
+
+    # A fresh library reading the saved index: nothing changed, nothing read
+    library = IsoLibrary(str(tmp_path / 'isolib.json'))
+    assert library.scan() == {'added': 0, 'updated': 0, 'removed': 0, 'unchanged': 3}
+    assert reads == []
+
+    # Same size, new mtime
+    st = os.stat(a)
+    os.utime(a, ns=(st.st_atime_ns, st.st_mtime_ns + 10 ** 9))
+    # Same mtime, new size
+    st = os.stat(b)
+    with open(b, 'ab') as f:
+        f.write(b'\0' * SECTOR)
+    os.utime(b, ns=(st.st_atime_ns, st.st_mtime_ns))
+    os.remove(root / 'c.iso')
+    assert library.scan() == {'added': 0, 'updated': 2, 'removed': 1, 'unchanged': 0}
+    assert sorted(reads) == ['a-amd64.iso', 'b.iso']
+    assert sorted(os.path.basename(p) for p, _ in library.find()) == ['a-amd64.iso', 'b.iso']
+
+    # A newer index format reads everything again
+    reads.clear()
+    monkeypatch.setattr(qemu_isolib, 'INDEX_VERSION', qemu_isolib.INDEX_VERSION + 1)
+    assert library.scan()['updated'] == 2
+    assert len(reads) == 2
+
+
+def test_system_for_reads_unindexed_images(tmp_path):
+    library = IsoLibrary(str(tmp_path / 'isolib.json'))
+    path = build_iso(tmp_path / 'x.iso', platforms=[0xEF], loaders=['BOOTAA64.EFI'])
+    assert library.system_for(path) == 'aarch64'
+    assert library.system_for(str(tmp_path / 'missing.iso')) is None
+    # Remembered for next time
+    assert IsoLibrary(str(tmp_path / 'isolib.json')).find()[0][0] == path
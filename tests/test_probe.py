@@ -0,0 +1,179 @@
+import os
+
+import pytest
+
+import qemu_probe
+from qemu_probe import (ProbeCache, ProbeError, parse_accels, parse_cpus, parse_devices, parse_machines,
+                        parse_properties)
+
+
+# Trimmed output of real QEMU 8.2 binaries
+ACCEL_HELP = """\
+Accelerators supported in QEMU binary:
+tcg
+kvm
+"""
+
+MACHINE_HELP = """\
+Supported machines are:
+microvm              microvm (i386)
+pc                   Standard PC (i440FX + PIIX, 1996) (alias of pc-i440fx-8.2)
+pc-i440fx-8.2        Standard PC (i440FX + PIIX, 1996) (default)
+q35                  Standard PC (Q35 + ICH9, 2009) (alias of pc-q35-8.2)
+pc-q35-8.2           Standard PC (Q35 + ICH9, 2009)
+none                 empty machine
+"""
+
+X86_CPU_HELP = """\
+Available CPUs:
+x86 486                   (alias configured by machine type)
+x86 486-v1
+x86 Broadwell             (alias configured by machine type)
+x86 EPYC-v4               AMD EPYC Processor
+x86 base                  base CPU model type with no features enabled
+x86 host                  processor with all supported host features
+x86 max                   Enables all features supported by the accelerator in the current host
+
+Recognized CPUID flags:
+  3dnow 3dnowext 3dnowprefetch abm ace2 acpi adx aes amd-no-ssb
+"""
+
+ARM_CPU_HELP = """\
+Available CPUs:
+  a64fx
+  cortex-a53
+  cortex-a72
+  host
+  max
+"""
+
+PPC_CPU_HELP = """\
+PowerPC 601_v1           PVR 00010001
+PowerPC 601              (alias for 601_v2)
+PowerPC 7457a_v1.2       PVR 80030102
+PowerPC power9_v2.2      PVR 004e1202
+PowerPC power9           (alias for power9_v2.2)
+PowerPC host
+"""
+
+MIPS_CPU_HELP = """\
+MIPS '4Kc'
+MIPS '24Kf'
+MIPS 'I6400'
+MIPS 'Loongson-3A4000'
+"""
+
+SPARC_CPU_HELP = """\
+Sparc  Fujitsu MB86904 IU 0000000004000000 FPU 00000000 MMU 00000000 NWINS 8
+Sparc  TI MicroSparc I IU 0000000041000000 FPU 00000000 MMU 41000000 NWINS 7
+Sparc  TI UltraSparc IIi IU 0017001200000000 FPU 00000000 MMU 00000000 NWINS 8
+Default CPU feature flags (use '-' to remove): float swap mul div flush fsqrt fmul
+Available CPU feature flags (use '+' to add): float128 vis1 vis2 fsmuld hypv cmt gl
+Numbers of register windows should be multiple of 8 and less than or equal to 32.
+"""
+
+S390_CPU_HELP = """\
+Available CPUs:
+s390 z900-base       IBM zSeries 900 GA1 (static, migration-safe)
+s390 gen16a          IBM 3931 GA1 (migration-safe)
+s390 host            Enables all features supported by the accelerator in the current host
+s390 max             Enables all features supported by the accelerator in the current host
+
+Recognized feature flags:
+s390 aen             AEN facility
+"""
+
+DEVICE_HELP = """\
+Storage devices:
+name "ide-cd", bus IDE, desc "virtual IDE CD-ROM"
+name "virtio-blk-pci", bus PCI, alias "virtio-blk"
+
+Misc devices:
+name "virtio-balloon-pci", bus PCI, alias "virtio-balloon"
+"""
+
+BALLOON_HELP = """\
+virtio-balloon-pci options:
+  deflate-on-oom=<bool>  -  (default: false)
+  free-page-reporting=<bool> -  (default: false)
+  guest-stats-polling-interval=<int>
+"""
+
+
+def test_parse_accels_and_machines():
+    assert parse_accels(ACCEL_HELP.splitlines()) == ['tcg', 'kvm']
+    machines, default = parse_machines(MACHINE_HELP.splitlines())
+    assert machines == ['microvm', 'pc', 'pc-i440fx-8.2', 'q35', 'pc-q35-8.2', 'none']
+    assert default == 'pc-i440fx-8.2'
+
+
+@pytest.mark.parametrize('text, expected', [
+    (X86_CPU_HELP, ['486', '486-v1', 'Broadwell', 'EPYC-v4', 'base', 'host', 'max']),
+    (ARM_CPU_HELP, ['a64fx', 'cortex-a53', 'cortex-a72', 'host', 'max']),
+    (PPC_CPU_HELP, ['601_v1', '601', '7457a_v1.2', 'power9_v2.2', 'power9', 'host']),
+    (MIPS_CPU_HELP, ['4Kc', '24Kf', 'I6400', 'Loongson-3A4000']),
+    (SPARC_CPU_HELP, ['Fujitsu-MB86904', 'TI-MicroSparc-I', 'TI-UltraSparc-IIi']),
+    (S390_CPU_HELP, ['z900-base', 'gen16a', 'host', 'max']),
+], ids=['x86', 'arm', 'ppc', 'mips', 'sparc', 's390x'])
+def test_parse_cpus(text, expected):
+    assert parse_cpus(text.splitlines()) == expected
+
+
+def test_parse_devices_and_properties():
+    assert parse_devices(DEVICE_HELP.splitlines()) == ['ide-cd', 'virtio-blk-pci', 'virtio-balloon-pci']
+    assert parse_properties(BALLOON_HELP.splitlines()) == [
+        'deflate-on-oom', 'free-page-reporting', 'guest-stats-polling-interval']
+
+
+def test_probe_against_stub(qemu_dir):
+    caps = qemu_probe.probe(os.path.join(qemu_dir, 'qemu-system-x86_64'))
+    assert caps['cpus'] == ['host', 'max']
+    assert caps['default_machine'] == 'pc-i440fx-9.0'
+    assert 'virtio-balloon-pci' in caps['devices']
+    assert 'tcg' in caps['usable_accels']
+
+
+@pytest.fixture
+def probes(monkeypatch):
+    """Binaries probe() was called for."""
+    calls = []
+
+    def probe(binary):
+        calls.append(binary)
+        return {'cpus': [f'probe-{len(calls)}']}
+    monkeypatch.setattr(qemu_probe, 'probe', probe)
+    return calls
+
+
+def test_probe_cache_keys_on_size_mtime_and_version(tmp_path, probes, monkeypatch):
+    binary = tmp_path / 'qemu-system-x86_64'
+    binary.write_bytes(b'\x7fELF')
+    path = str(tmp_path / 'probe.json')
+
+    cache = ProbeCache(path)
+    assert cache.get(str(binary))['cpus'] == ['probe-1']
+    assert cache.get(str(binary))['cpus'] == ['probe-1']
+    # Kept on disk for the next process
+    assert ProbeCache(path).get(str(binary))['cpus'] == ['probe-1']
+    assert len(probes) == 1
+
+    st = os.stat(binary)
+    os.utime(binary, ns=(st.st_atime_ns, st.st_mtime_ns + 10 ** 9))
+    assert cache.get(str(binary))['cpus'] == ['probe-2']
+
+    # Upgraded in place, same mtime
+    st = os.stat(binary)
+    binary.write_bytes(b'\x7fELF, but newer')
+    os.utime(binary, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert cache.get(str(binary))['cpus'] == ['probe-3']
+
+    monkeypatch.setattr(qemu_probe, 'PROBE_VERSION', qemu_probe.PROBE_VERSION + 1)
+    assert ProbeCache(path).get(str(binary))['cpus'] == ['probe-4']
+    assert cache.get(str(binary), refresh=True)['cpus'] == ['probe-5']
+    assert len(probes) == 5
+
+
+def test_probe_cache_missing_binary(tmp_path, probes):
+    with pytest.raises(ProbeError):
+        ProbeCache(str(tmp_path / 'probe.json')).get(str(tmp_path / 'qemu-system-nope'))
+    assert probes == []
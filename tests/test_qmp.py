@@ -0,0 +1,85 @@
+import asyncio
+import os
+import stat
+
+import pytest
+
+import qemu_qmp
+from qemu_fleet import Fleet
+from qemu_launch import VMSpec
+from qemu_telemetry import Telemetry
+
+from fake_qmp import FakeQMP
+
+pytestmark = pytest.mark.skipif(os.name == 'nt', reason='QMP goes over TCP on Windows')
+
+
+def test_new_address_is_private_socket(tmp_path):
+    directory = tmp_path / 'qmp'
+    directory.mkdir(mode=0o755)
+    address = qemu_qmp.new_address(str(directory))
+    assert os.path.dirname(address) == str(directory)
+    assert stat.S_IMODE(os.stat(directory).st_mode) == 0o700
+    assert qemu_qmp.qmp_args(address) == ['-qmp', f'unix:{address},server=on,wait=off']
+    assert qemu_qmp.new_address(str(directory)) != address
+
+
+def test_qmp_args_tcp():
+    assert qemu_qmp.qmp_args(4444) == ['-qmp', 'tcp:127.0.0.1:4444,server=on,wait=off']
+
+
+def test_execute_skips_events_and_reports_errors(tmp_path):
+    path = str(tmp_path / 'q.sock')
+
+    async def main():
+        replies = {'query-status': {'status': 'running'}, 'cont': RuntimeError('guest is dead')}
+        async with FakeQMP(path, replies, events=['RESUME']) as server:
+            async with qemu_qmp.QMPClient(path) as client:
+                assert (await client.execute('query-status'))['status'] == 'running'
+                assert [e['event'] for e in client.events] == ['RESUME']
+                with pytest.raises(qemu_qmp.QMPError, match='guest is dead'):
+                    await client.execute('cont')
+                with pytest.raises(qemu_qmp.QMPError, match='has not been found'):
+                    await client.execute('query-balloon')
+        return server.received
+
+    received = asyncio.run(main())
+    assert [command for command, _ in received] == ['qmp_capabilities', 'query-status', 'cont', 'query-balloon']
+
+
+def test_connect_gives_up(tmp_path):
+    async def main():
+        await qemu_qmp.QMPClient(str(tmp_path / 'nobody.sock')).connect(timeout=0.3)
+
+    with pytest.raises(qemu_qmp.QMPError, match='Could not connect'):
+        asyncio.run(main())
+
+
+def test_fleet_guest_gets_unix_socket(qemu_dir, iso):
+    telemetry = Telemetry(interval=0.05)
+    fleet = Fleet(qemu_dir, autotune=False, telemetry=telemetry)
+    spec = VMSpec(system='x86_64', ram=256, iso=iso, name='q', switches=['-display', 'none'])
+    seen = []
+
+    async def main():
+        task = asyncio.ensure_future(fleet.run(spec))
+        while not seen and not task.done():
+            seen.extend(s for s in telemetry.snapshot() if s.latest())
+            await asyncio.sleep(0.02)
+        return await task
+
+    vm = asyncio.run(main())
+    assert vm.returncode == 0
+    assert isinstance(spec.qmp_address, str)
+    assert seen and seen[0].latest()['status'] == 'running'
+    # Cleaned up after the guest exited
+    assert not os.path.exists(spec.qmp_address)
+
+
+def test_long_cache_dir_falls_back_to_temp(tmp_path):
+    address = qemu_qmp.new_address(str(tmp_path / ('x' * 100)))
+    directory = os.path.dirname(address)
+    assert os.path.basename(directory).startswith(qemu_qmp.TEMP_PREFIX)
+    assert stat.S_IMODE(os.stat(directory).st_mode) == 0o700
+    qemu_qmp.remove_address(address)
+    assert not os.path.exists(directory)
@@ -0,0 +1,162 @@
+import asyncio
+
+import pytest
+
+from qemu_launch import VMSpec
+from qemu_sched import VM_OVERHEAD_MB, AdmissionError, Host, Scheduler, parse_cpulist, spec_vcpus
+
+
+def _host(nodes=1, cores=4, threads=1, memory_mb=8192):
+    """nodes x cores x threads CPUs, numbered node by node."""
+    topology = {}
+    for node in range(nodes):
+        for core in range(cores):
+            for thread in range(threads):
+                cpu = (node * cores + core) * threads + thread
+                topology[cpu] = (node, (node, core))
+    return Host(memory_mb=memory_mb, cpus=sorted(topology), topology=topology)
+
+
+def _spec(name, ram=512, smp=1):
+    # ram is what the scheduler counts, QEMU's overhead taken off
+    return VMSpec(system='x86_64', ram=ram - VM_OVERHEAD_MB, iso='guest.iso', name=name, smp=smp)
+
+
+async def _settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def test_parse_cpulist():
+    assert parse_cpulist('0-3,8,10-11\n') == [0, 1, 2, 3, 8, 10, 11]
+    assert parse_cpulist('5') == [5]
+    assert parse_cpulist('') == []
+
+
+def test_spec_vcpus():
+    assert spec_vcpus(_spec('a', smp=3)) == 3
+    assert spec_vcpus(VMSpec(system='x86_64', ram=512, iso='g.iso', switches='-smp 4')) == 4
+    assert spec_vcpus(VMSpec(system='x86_64', ram=512, iso='g.iso', switches='-smp cpus=6,sockets=1')) == 6
+    assert spec_vcpus(VMSpec(system='x86_64', ram=512, iso='g.iso', switches='-smp sockets=1,cpus=2')) == 2
+    assert spec_vcpus(VMSpec(system='x86_64', ram=512, iso='g.iso')) == 1
+
+
+def test_fifo_queue_drains_on_release():
+    scheduler = Scheduler(_host(memory_mb=4096), reserve_mb=0)
+
+    async def main():
+        first = await scheduler.admit(_spec('first', ram=2000))
+        admitted = []
+
+        async def admit(spec):
+            admission = await scheduler.admit(spec)
+            admitted.append(admission.name)
+            return admission
+
+        big = asyncio.ensure_future(admit(_spec('big', ram=3000)))
+        await _settle()
+        small = asyncio.ensure_future(admit(_spec('small', ram=500)))
+        await _settle()
+        # small would fit next to first, but big came first
+        assert scheduler.waiting() == ['big', 'small']
+        assert admitted == []
+
+        await scheduler.release(first)
+        await asyncio.gather(big, small)
+        assert admitted == ['big', 'small']
+        assert scheduler.waiting() == []
+        assert scheduler.committed_mb == 3500
+
+    asyncio.run(asyncio.wait_for(main(), 5))
+
+
+def test_memory_ratio_allows_overcommit():
+    scheduler = Scheduler(_host(memory_mb=4096), reserve_mb=1024, mem_ratio=2.0)
+    assert scheduler.memory_capacity_mb == 6144
+
+    async def main():
+        for name in ('a', 'b', 'c'):
+            await scheduler.admit(_spec(name, ram=2048))
+        blocked = asyncio.ensure_future(scheduler.admit(_spec('d', ram=64 + 128)))
+        await _settle()
+        assert not blocked.done()
+        blocked.cancel()
+
+    asyncio.run(asyncio.wait_for(main(), 5))
+    # A cancelled waiter leaves the queue
+    assert scheduler.waiting() == []
+
+
+def test_cpu_ratio_limits_vcpus():
+    scheduler = Scheduler(_host(cores=4), cpu_ratio=1.0)
+
+    async def main():
+        first = await scheduler.admit(_spec('a', smp=3))
+        second = asyncio.ensure_future(scheduler.admit(_spec('b', smp=2)))
+        await _settle()
+        assert not second.done()
+        await scheduler.release(first)
+        assert (await second).vcpus == 2
+
+    asyncio.run(asyncio.wait_for(main(), 5))
+
+
+def test_specs_that_never_fit_are_rejected():
+    scheduler = Scheduler(_host(cores=4, memory_mb=4096), reserve_mb=1024, cpu_ratio=2.0)
+    with pytest.raises(AdmissionError, match='needs 4096 MB, the host only allows 3072 MB'):
+        scheduler.check(_spec('huge', ram=4096))
+    with pytest.raises(AdmissionError, match='wants 9 vCPUs, the host only allows 8'):
+        scheduler.check(_spec('wide', smp=9))
+    # Overcommitted vCPUs are fine unpinned, but pinning needs a CPU per vCPU
+    scheduler.check(_spec('ok', smp=8))
+    pinned = Scheduler(_host(cores=4), pin='core', cpu_ratio=2.0)
+    with pytest.raises(AdmissionError, match='only be pinned to 4 CPUs of the host'):
+        asyncio.run(pinned.admit(_spec('wide', smp=5)))
+
+
+def test_numa_guest_larger_than_any_node_is_rejected():
+    scheduler = Scheduler(_host(nodes=2, cores=4), pin='numa')
+    # 8 CPUs in total, but no single node has 6
+    with pytest.raises(AdmissionError, match='only be pinned to 4 CPUs of one NUMA node'):
+        scheduler.check(_spec('wide', smp=6))
+
+    async def main():
+        # And it doesn't hold up the queue, the next guest is admitted at once
+        with pytest.raises(AdmissionError):
+            await scheduler.admit(_spec('wide', smp=6))
+        return await scheduler.admit(_spec('fits', smp=4))
+
+    admission = asyncio.run(asyncio.wait_for(main(), 5))
+    assert len({scheduler.host.topology[cpu][0] for cpu in admission.cpus}) == 1
+
+
+def test_numa_pinning_uses_one_node_per_guest():
+    scheduler = Scheduler(_host(nodes=2, cores=4), pin='numa')
+
+    async def main():
+        a = await scheduler.admit(_spec('a', smp=3))
+        b = await scheduler.admit(_spec('b', smp=4))
+        assert a.cpus == [0, 1, 2]
+        assert b.cpus == [4, 5, 6, 7]
+        # One free CPU left on node 0, too few for 2 vCPUs on one node
+        waiting = asyncio.ensure_future(scheduler.admit(_spec('c', smp=2)))
+        await _settle()
+        assert not waiting.done()
+        await scheduler.release(b)
+        assert (await waiting).cpus == [4, 5]
+
+    asyncio.run(asyncio.wait_for(main(), 5))
+
+
+def test_core_pinning_takes_whole_cores():
+    scheduler = Scheduler(_host(cores=4, threads=2), pin='core')
+
+    async def main():
+        a = await scheduler.admit(_spec('a', smp=3))
+        b = await scheduler.admit(_spec('b', smp=1))
+        return a, b
+
+    a, b = asyncio.run(main())
+    # Hyperthread siblings go together, nobody shares a core
+    assert a.cpus == [0, 1, 2, 3]
+    assert b.cpus == [4, 5]
@@ -0,0 +1,65 @@
+import asyncio
+import os
+
+from qemu_fleet import Fleet
+from qemu_launch import VMSpec
+from qemu_snapshot import SnapshotCache
+
+
+def _write(pending, data=b'STATE'):
+    with open(pending['state'], 'wb') as f:
+        f.write(data)
+
+
+def test_only_one_save_per_key(tmp_path):
+    cache = SnapshotCache(str(tmp_path / 'snapshots'))
+    first = cache.begin_save('k')
+    assert first is not None
+    assert cache.begin_save('k') is None
+
+    _write(first)
+    cache.commit('k', first, {})
+    assert cache.lookup('k')['size'] == 5
+    # Saved already, nobody needs to save it again
+    assert cache.begin_save('k') is None
+
+
+def test_abandon_keeps_saved_state(tmp_path):
+    cache = SnapshotCache(str(tmp_path / 'snapshots'))
+    pending = cache.begin_save('k')
+    _write(pending)
+    cache.commit('k', pending, {})
+
+    cache.discard('k')
+    retry = cache.begin_save('k')
+    _write(retry, b'PARTIAL')
+    cache.abandon('k', retry)
+    assert not os.path.exists(retry['state'])
+    assert cache.begin_save('k') is not None
+
+
+def test_abandon_releases_claim(tmp_path):
+    cache = SnapshotCache(str(tmp_path / 'snapshots'))
+    pending = cache.begin_save('k')
+    cache.abandon('k', pending)
+    assert cache.begin_save('k') is not None
+    assert cache.lookup('k') is None
+
+
+def test_concurrent_warm_launches_save_once(qemu_dir, iso):
+    cache = SnapshotCache()
+    fleet = Fleet(qemu_dir, autotune=False, snapshots=cache)
+    specs = [
+        VMSpec(system='x86_64', ram=256, iso=iso, name=f'w-{i}', warm_start=True, ready_marker='login:',
+               switches=['-display', 'none'])
+        for i in range(5)
+    ]
+    results = asyncio.run(fleet.run_all(specs))
+    assert [vm.warm for vm in results].count('saved') == 1
+    assert all(vm.warm_error is None and vm.returncode == 0 for vm in results)
+    assert not [name for name in os.listdir(cache.root) if name.endswith('.tmp')]
+
+    again = VMSpec(system='x86_64', ram=256, iso=iso, name='w', warm_start=True, ready_marker='login:',
+                   switches=['-display', 'none'])
+    vm = asyncio.run(fleet.run(again))
+    assert vm.warm == 'restored'
@@ -0,0 +1,137 @@
+import asyncio
+import os
+import threading
+import time
+
+import pytest
+
+import qemu_bench
+import qemu_qmp
+import qemu_telemetry
+from qemu_telemetry import VMStats, poll_once, prometheus_text
+
+from fake_qmp import FakeQMP
+
+pytestmark = pytest.mark.skipif(os.name == 'nt', reason='the fake QMP server listens on a unix socket')
+
+MB = 1024 * 1024
+
+
+def _blockstats(rd, wr):
+    return [{'device': 'disk0', 'stats': {
+        'rd_bytes': rd, 'wr_bytes': wr, 'rd_operations': 1, 'wr_operations': 1, 'flush_operations': 0}}]
+
+
+def _poll(path, replies, previous=None):
+    async def main():
+        async with FakeQMP(path, replies):
+            async with qemu_qmp.QMPClient(path) as client:
+                return await poll_once(client, 1234, previous)
+    return asyncio.run(main())
+
+
+@pytest.fixture
+def cpu_seconds(monkeypatch):
+    seconds = {11: 5.0, 12: 3.0}
+    monkeypatch.setattr(qemu_telemetry, 'thread_cpu_seconds', lambda pid, tid: seconds.get(tid))
+    return seconds
+
+
+def test_poll_once_rates(tmp_path, cpu_seconds):
+    replies = {
+        'query-status': {'status': 'running'},
+        'query-cpus-fast': [{'cpu-index': 0, 'thread-id': 11}, {'cpu-index': 1, 'thread-id': 12}],
+        'query-blockstats': _blockstats(3 * MB, 2 * MB),
+        'query-memory-size-summary': {'base-memory': 512 * MB},
+        'query-balloon': {'actual': 384 * MB},
+    }
+    previous = {
+        'monotonic': time.monotonic() - 2.0,
+        'vcpu_seconds': {0: 4.0, 1: 2.0},
+        'block': {'disk0': {'rd_bytes': 1 * MB, 'wr_bytes': 2 * MB}},
+    }
+    sample = _poll(str(tmp_path / 'q.sock'), replies, previous)
+
+    assert sample['status'] == 'running'
+    assert sample['vcpu_seconds'] == {0: 5.0, 1: 3.0}
+    assert sample['memory'] == 512 * MB
+    assert sample['balloon'] == 384 * MB
+    # 2 vCPU seconds over ~2 seconds
+    assert sample['cpu_percent'] == pytest.approx(100.0, rel=0.05)
+    assert sample['read_rate'] == pytest.approx(MB, rel=0.05)
+    assert sample['write_rate'] == 0.0
+
+
+def test_poll_once_first_sample_has_no_rates(tmp_path, cpu_seconds):
+    replies = {'query-status': {'status': 'paused'}, 'query-cpus-fast': [{'cpu-index': 0, 'thread-id': 11}]}
+    sample = _poll(str(tmp_path / 'q.sock'), replies)
+    assert sample['status'] == 'paused'
+    assert sample['cpu_percent'] is None and sample['read_rate'] is None
+
+
+def test_poll_once_tolerates_missing_commands(tmp_path, cpu_seconds):
+    # No balloon, no block devices and a query that fails outright
+    replies = {'query-status': {'status': 'running'}, 'query-blockstats': RuntimeError('no block layer')}
+    sample = _poll(str(tmp_path / 'q.sock'), replies)
+    assert sample['vcpu_seconds'] == {}
+    assert sample['block'] == {}
+    assert sample['memory'] is None and sample['balloon'] is None
+
+
+def test_poll_once_needs_status(tmp_path, cpu_seconds):
+    with pytest.raises(qemu_qmp.QMPError):
+        _poll(str(tmp_path / 'q.sock'), {})
+
+
+def test_prometheus_text():
+    running = VMStats('deb "1"', 100)
+    running.add({
+        'status': 'running', 'vcpu_seconds': {0: 1.5, 1: 0.25},
+        'block': {'disk0': {'rd_bytes': 10, 'wr_bytes': 20, 'rd_operations': 1, 'wr_operations': 2}},
+        'memory': 512 * MB, 'balloon': None,
+    })
+    gone = VMStats('old', 200)
+    gone.add({'status': 'running', 'vcpu_seconds': {}, 'block': {}, 'memory': None, 'balloon': None})
+    gone.exited = True
+
+    lines = prometheus_text([running, gone]).splitlines()
+    labels = 'vm="deb \\"1\\"",pid="100"'
+    assert '# TYPE qemu_vm_vcpu_seconds_total counter' in lines
+    assert '# HELP qemu_vm_up Guest process is running' in lines
+    assert f'qemu_vm_up{{{labels}}} 1' in lines
+    assert 'qemu_vm_up{vm="old",pid="200"} 0' in lines
+    assert f'qemu_vm_running{{{labels}}} 1' in lines
+    assert f'qemu_vm_vcpu_seconds_total{{{labels},cpu="0"}} 1.500' in lines
+    assert f'qemu_vm_block_read_bytes_total{{{labels},device="disk0"}} 10' in lines
+    assert f'qemu_vm_block_write_ops_total{{{labels},device="disk0"}} 2' in lines
+    assert f'qemu_vm_memory_bytes{{{labels}}} {512 * MB}' in lines
+    # Nothing but "up" for guests that exited, no balloon line without a balloon
+    assert not [l for l in lines if 'vm="old"' in l and not l.startswith('qemu_vm_up')]
+    assert not [l for l in lines if l.startswith('qemu_vm_balloon_bytes{')]
+
+
+def test_export_is_atomic(tmp_path):
+    telemetry = qemu_telemetry.Telemetry(prom_path=str(tmp_path / 'qemu.prom'))
+    telemetry.export()
+    assert (tmp_path / 'qemu.prom').read_text().startswith('# HELP qemu_vm_up')
+    assert os.listdir(tmp_path) == ['qemu.prom']
+
+
+@pytest.mark.skipif(not os.path.exists('/proc'), reason='reads /proc')
+def test_cpu_seconds_of_this_process():
+    deadline = time.process_time() + 0.2
+    while time.process_time() < deadline:
+        pass
+    tid = threading.get_native_id()
+    # Clock ticks are coarser than process_time()
+    assert qemu_telemetry.process_cpu_seconds(os.getpid()) == pytest.approx(time.process_time(), abs=0.1)
+    thread = qemu_telemetry.thread_cpu_seconds(os.getpid(), tid)
+    assert 0.1 < thread <= qemu_telemetry.process_cpu_seconds(os.getpid())
+    assert qemu_telemetry.process_cpu_seconds(2 ** 22 + 1) is None
+
+
+@pytest.mark.skipif(not os.path.exists('/proc'), reason='reads /proc')
+def test_bench_process_stats():
+    peak, cpu = qemu_bench.process_stats(os.getpid())
+    assert peak > MB
+    assert cpu == pytest.approx(time.process_time(), abs=0.1)